@@ -2173,7 +2173,7 @@ MP4StreamInfoError: not a MP4 file
             VALUES (?, ?, ?, ?, ?)"
         sql.cursor.execute(sql_cmd, (self.sqlOsFileName, stat.st_atime,
                                      stat.st_mtime, stat.st_ctime, self.song_size))
-        sql.con.commit()
+        sql.commit()
         last_music_id = sql.cursor.lastrowid
 
         #print("\n encoding.py sql_add_music() last_music_id:", last_music_id)
@@ -2183,7 +2183,7 @@ MP4StreamInfoError: not a MP4 file
         sql.cursor.execute("SELECT Id FROM Music INDEXED BY OsFileNameIndex " +
                            "WHERE OsFileName = ?", [self.sqlOsFileName])
         d = dict(sql.cursor.fetchone())
-        sql.con.commit()  # Will this fix bug?
+        sql.commit()  # Will this fix bug?
         self.music_id = d["Id"]
         if self.music_id != last_music_id:
             ''' The last encoding may be different quality and file size.
@@ -2198,7 +2198,7 @@ MP4StreamInfoError: not a MP4 file
             sql.cursor.execute(sql_cmd,  # ORIGINAL NORMAL METHOD
                                (stat.st_atime, stat.st_mtime, stat.st_ctime,
                                 self.song_size, self.music_id))
-            sql.con.commit()  # This update not working, times show 1/2 hour ago.
+            sql.commit()  # This update not working, times show 1/2 hour ago.
             action = 'edit'  # History action 'edit'
         else:
             action = 'init'  # History action 'init'
@@ -21,11 +21,16 @@ from __future__ import with_statement  # Error handling for file opens
 #       June 02 2024 - Reactivate '?' as illegal filename character
 #       Dec. 04 2024 - if t_init() ends in ":" don't add another when printing
 #       June 01 2025 - Strip `env` from `#!/usr/bin/env python` for script name
+#       Oct. 18 2026 - launch_command() uses subprocess. No 'ps aux' polling.
+#       Oct. 18 2026 - ExitWatcher() pidfd or SIGCHLD instead of os.kill(pid, 0)
+#       Oct. 18 2026 - kill_children() at exit. start_new_session not setsid
 #
 #==============================================================================
 
 import signal  # Trap shutdown to close files
 import os
+import sys
+import atexit  # kill_children() when mserve ends
 try:
     import subprocess32 as sp
     SUBPROCESS_VER = '32'
@@ -33,7 +38,15 @@ except ImportError:  # No module named subprocess32
     import subprocess as sp
     SUBPROCESS_VER = 'native'
 
+# Python 2 subprocess has no start_new_session. preexec_fn isn't thread safe.
+if SUBPROCESS_VER == '32' or sys.version_info[0] >= 3:
+    NEW_SESSION = {'start_new_session': True}
+else:
+    NEW_SESSION = {'preexec_fn': os.setsid}
+
 import errno
+import select  # ExitWatcher() checks if pidfd is readable
+import threading  # ChildProcess() reads stdout and stderr pipes
 import json  # For reading/writing files in json format, no image support
 import glob  # For globbing files in /tmp/mserve_ffprobe*
 import time
@@ -41,6 +54,13 @@ import datetime
 import pickle  # For reading/writing files in pickle format, supports images
 import toolkit  # Common Tkinter routines
 
+# Oct. 18 2026 - launch_command() children by PID
+CHILDREN = {}  # {pid: ChildProcess()} still running or not reaped yet
+CHILD_EXITS = {}  # {pid: exit status} after reap_children()
+CHILD_EXIT_ORDER = []  # Oldest exit status is dropped first
+CHILD_EXITS_KEEP = 100  # Exit statuses kept for exit_status()
+CHILD_OUTPUT_KEEP = 65536  # Last bytes of stdout and stderr kept
+
 # Program timings for OS calls and functions or loops
 TIME_LIST = []  # list of tuples name, start time
 TIME_NDX = 0  # index pushed or popped to support nested items
@@ -257,10 +277,156 @@ def which(cmd, path=None):
     return None
 
 
-def launch_command(ext_name, toplevel=None, ms_wait=3000):
+class ChildProcess:
+    """ External command launched by launch_command() with subprocess.
+
+        The PID is known as soon as Popen() returns. There is no 'ps aux'
+        polling so commands that end in a few milliseconds ('cp' on NVMe)
+        still get their PID.
+
+        Simple commands are run as "exec command" so the shell is replaced
+        and the PID is the program's own (ffplay PID for pav.find() sink).
+        Commands with pipes, ';' or '&&' keep the shell which ends when the
+        last command ends. Either way the command has its own process group
+        so kill() gets every process in it.
+
+        stdout and stderr go to mserve's terminal like os.popen(cmd + ' &')
+        did. With capture=True they are pipes read by daemon threads so a
+        chatty command never blocks. Last CHILD_OUTPUT_KEEP bytes are kept.
+        poll() reaps the child so it doesn't linger as a zombie that
+        os.kill(pid, 0) says is still running.
+    """
+
+    def __init__(self, command, capture=False):
+        self.command = command
+        self.capture = capture  # Read stdout and stderr for output()
+        self.start_time = time.time()
+        self.end_time = None  # Set by poll() when command has ended
+        self.returncode = None  # Exit status. Negative = killed by signal
+        self.stdout = []  # Chunks read from stdout pipe
+        self.stderr = []  # Chunks read from stderr pipe
+        run = "exec " + command if simple_command(command) else command
+        pipe = sp.PIPE if capture else None  # None = inherit mserve's
+        with open(os.devnull) as devnull:  # Command can't read mserve stdin
+            self.proc = sp.Popen(run, shell=True, stdin=devnull,
+                                 stdout=pipe, stderr=pipe,
+                                 close_fds=True, **NEW_SESSION)
+        self.pid = self.proc.pid
+        if not capture:
+            return
+        for pipe, chunks in ((self.proc.stdout, self.stdout),
+                             (self.proc.stderr, self.stderr)):
+            thread = threading.Thread(target=self.read_pipe,
+                                      args=(pipe, chunks))
+            thread.daemon = True  # Don't hang mserve shutdown
+            thread.start()
+
+    @staticmethod
+    def read_pipe(pipe, chunks):
+        """ Thread reads pipe until command closes it. Keep tail only. """
+        size = 0
+        for chunk in iter(lambda: os.read(pipe.fileno(), 4096), b''):
+            chunks.append(chunk)
+            size += len(chunk)
+            while size > CHILD_OUTPUT_KEEP and len(chunks) > 1:
+                size -= len(chunks.pop(0))
+        pipe.close()
+
+    def poll(self):
+        """ Return None while running, else exit status. Reaps zombie. """
+        if self.returncode is None:
+            self.returncode = self.proc.poll()
+            if self.returncode is not None:
+                self.end_time = time.time()
+        return self.returncode
+
+    def kill(self, sig=signal.SIGKILL):
+        """ Signal every process in command's process group """
+        try:
+            os.killpg(self.pid, sig)
+        except OSError:
+            return False  # Already ended
+        if sig == signal.SIGKILL:
+            self.proc.wait()  # Reap right away
+            self.poll()
+        return True
+
+    def output(self, stderr=False):
+        """ Text read so far from stdout (or stderr). Empty unless
+            launch_command(capture=True) """
+        text = b''.join(self.stderr if stderr else self.stdout)
+        return text.decode("utf-8", "replace")
+
+
+def simple_command(command):
+    """ True when command has no shell control operators outside quotes:
+        '|', '&', ';', '(', ')', or newline. Redirections like '2>&1' and
+        '2>/dev/null' are allowed. """
+    quote = None
+    prev = ""
+    for ch in command:
+        if quote:
+            if ch == quote and prev != "\\":
+                quote = None
+        elif ch in "'\"" and prev != "\\":
+            quote = ch
+        elif ch in "|;()\n`" or (ch == "&" and prev not in "<>"):
+            return False
+        prev = ch
+    return True
+
+
+def reap_children():
+    """ Reap launch_command() children that ended. Their exit status stays
+        in CHILD_EXITS (latest CHILD_EXITS_KEEP) for exit_status(). """
+    for pid in list(CHILDREN):
+        child = CHILDREN[pid]
+        if child.poll() is not None:
+            del CHILDREN[pid]
+            CHILD_EXITS[pid] = child.returncode
+            CHILD_EXIT_ORDER.append(pid)
+    while len(CHILD_EXIT_ORDER) > CHILD_EXITS_KEEP:
+        CHILD_EXITS.pop(CHILD_EXIT_ORDER.pop(0), None)
+
+
+def kill_children():
+    """ atexit - Kill launch_command() children still running. They have
+        their own session so closing mserve's terminal doesn't end them. """
+    for pid in list(CHILDREN):
+        child = CHILDREN.pop(pid)
+        if child.poll() is None:
+            child.kill()
+
+
+atexit.register(kill_children)
+
+
+def exit_status(pid):
+    """ Exit status of launch_command() child. None when still running or
+        PID wasn't launched by us. Negative when killed by signal. """
+    child = CHILDREN.get(pid)
+    if child:
+        return child.poll()
+    return CHILD_EXITS.get(pid)
+
+
+def child_process(pid):
+    """ ChildProcess() for PID returned by launch_command() or None """
+    return CHILDREN.get(pid)
+
+
+def launch_command(ext_name, toplevel=None, ms_wait=3000, capture=False):
     """ Launch external command in background and return PID to parent.
-        Use for programs requiring more than .2 seconds to run. Otherwise,
-        program could run and finish before PID can be obtained.
+
+        Oct. 18 2026 - ChildProcess() returns PID from subprocess.Popen().
+            'toplevel' and 'ms_wait' were for 'ps aux' polling and aren't
+            used anymore. Returns 0 when command can't be launched.
+
+            Original os.popen(ext_name + ' &') and pid_list() polling took
+            37 ms and failed when command ended before 'ps' saw it.
+            Output goes to terminal unless capture=True, then
+            child_process(pid).output() has it.
+
 
         UPGRADE: https://stackoverflow.com/a/19152273/6929343
         # Can't use shell=True if you want the pid of `du`, not the
@@ -307,46 +473,17 @@ def launch_command(ext_name, toplevel=None, ms_wait=3000):
            os.kill(P.pid, signal.SIGCONT)
 
     """
-    #t_init("launch_ext_command")
-    all_pid = pid_list(ext_name)
-    new_pid = all_pid
-
-    os.popen(ext_name + ' &')           # Run command in background
-    sleep_count = 0
-    sleep_max = ms_wait / 10
-    #import psutil  # ImportError: No module named psutil
-    #current_process = psutil.Process()
-    #children = current_process.children(recursive=True)
-    #for child in children:
-    #    print('Child pid is {}'.format(child.pid))
-    while new_pid == all_pid:
-        #t_init("pid_list")
-        new_pid = pid_list(ext_name)
-        #pid_list_time = t_end('no_print')
-        if new_pid != all_pid:
-            break  # Skip sleep cycle
-        if sleep_count > 0:  # Don't sleep first time through loop
-            if toplevel is None:
-                time.sleep(.01)  # sleep 10 milliseconds
-            else:
-                toplevel.after(10)  # Fine tune for sleep count of 2
-        sleep_count += 1
-        if sleep_count >= sleep_max:  # 3 second time-out
-            print('launch_ext_command() ERROR: ', ms_wait, 'ms timeout reached.')
-            print('External command name:', ext_name)
-            return 0  # Return no PID found
-
-    #print('launch_ext_command() sleep_count:', sleep_count, all_pid)
-    diff_list = list(set(new_pid) - set(all_pid))
-
-    #total_time = t_end('no_print')
-    #print("launch_ext_command(" + ext_name + ") pid_list_time:", pid_list_time,
-    #      "total_time:", total_time)  # pid_list_time: 0.017 total_time: 0.037
-    if len(diff_list) == 1:
-        return int(diff_list[0])  # Return PID number found
-
-    print('launch_ext_command() ERROR: A new PID could not be found')
-    return 0  # Return no PID found
+    _who = "external.py launch_command():"
+    reap_children()  # Earlier children that ended
+    try:
+        child = ChildProcess(ext_name, capture=capture)
+    except OSError as err:
+        print(_who, "ERROR:", err)
+        print('External command name:', ext_name)
+        return 0  # Return no PID found
+
+    CHILDREN[child.pid] = child
+    return child.pid
 
 
 def pid_list(ext_name):
@@ -371,6 +508,10 @@ def check_pid_running(active_pid):
     if active_pid == 0:
         return 0                    # Could be running in loop until PID ends
 
+    child = CHILDREN.get(active_pid)
+    if child:                       # launch_command() child, reap if ended
+        return active_pid if child.poll() is None else 0
+
     try:
         os.kill(active_pid, 0)      # 0 is simply status check, 9 really kills
         return active_pid           # pid is still running
@@ -378,6 +519,103 @@ def check_pid_running(active_pid):
         return 0                    # pid has finished
 
 
+SIGCHLD_COUNT = 0  # Incremented by sigchld_handler() when a child ends
+SIGCHLD_INSTALLED = False  # install_sigchld() has run
+
+
+def sigchld_handler(*_args):
+    """ Count SIGCHLD. Reaping is left to ChildProcess.poll() """
+    global SIGCHLD_COUNT
+    SIGCHLD_COUNT += 1
+
+
+def install_sigchld():
+    """ Install sigchld_handler() once. Interrupted system calls are
+        restarted (SA_RESTART) so Python 2 reads don't fail with EINTR. """
+    global SIGCHLD_INSTALLED
+    if SIGCHLD_INSTALLED:
+        return
+    signal.signal(signal.SIGCHLD, sigchld_handler)
+    signal.siginterrupt(signal.SIGCHLD, False)
+    SIGCHLD_INSTALLED = True
+
+
+class ExitWatcher:
+    """ Tell when launch_command() child has ended without polling
+        os.kill(pid, 0) every refresh.
+
+        Linux 5.3+ with Python 3.9+ uses os.pidfd_open(). The pidfd becomes
+        readable when the process ends. With a toplevel and callback the
+        pidfd is a Tk file handler and callback(pid) runs as soon as the
+        process ends.
+
+        Otherwise SIGCHLD_COUNT is compared to the count at last check and
+        the child is only polled when a SIGCHLD has arrived since.
+
+        USAGE:
+
+        watcher = ExitWatcher(pid, toplevel, callback)
+        watcher.ended() - True when process has ended. Cheap to call.
+        watcher.close() - Remove file handler and close pidfd.
+    """
+
+    def __init__(self, pid, toplevel=None, callback=None):
+        self.pid = pid  # PID returned by launch_command()
+        self.toplevel = toplevel  # Optional Tk widget for file handler
+        self.callback = callback  # Optional callback(pid) when pid ends
+        self.fd = None  # pidfd when supported
+        self.handler = False  # Tk file handler created for self.fd
+        self.sigchld_seen = None  # SIGCHLD_COUNT at last check
+        self.is_ended = pid == 0
+
+        if self.is_ended:
+            return
+        try:
+            self.fd = os.pidfd_open(pid)
+        except (AttributeError, OSError):
+            # Python < 3.9, Linux < 5.3 or pid already reaped
+            install_sigchld()
+            return
+        if toplevel and callback:
+            toplevel.tk.createfilehandler(self.fd, toolkit.tk.READABLE,
+                                          self.fd_ready)
+            self.handler = True
+
+    def fd_ready(self, _fd, _mask):
+        """ Tk file handler. pidfd is readable when process ended. """
+        if self.ended() and self.callback:
+            self.callback(self.pid)
+
+    def ended(self):
+        """ Has process ended? Reaps launch_command() child when it has. """
+        if self.is_ended:
+            return True
+        if self.fd is not None:
+            readable, _w, _x = select.select([self.fd], [], [], 0)
+            if not readable:
+                return False
+        elif self.sigchld_seen == SIGCHLD_COUNT and self.pid in CHILDREN:
+            return False  # No child has ended since last check
+        self.sigchld_seen = SIGCHLD_COUNT  # Set before check, no race
+        if check_pid_running(self.pid):
+            return False
+        self.is_ended = True
+        self.close()
+        return True
+
+    def close(self):
+        """ Remove Tk file handler and close pidfd """
+        if self.handler:
+            try:
+                self.toplevel.tk.deletefilehandler(self.fd)
+            except toolkit.tk.TclError:
+                pass  # Toplevel already destroyed
+            self.handler = False
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+
 def shell_quote(s):
     """ Escape quotes in shell variables """
     ''' E.G.
@@ -402,6 +640,14 @@ def kill_pid_running(active_pid):
               " 'active_pid' is:", active_pid)
         return 0                    # Programmer error
 
+    child = CHILDREN.get(active_pid)
+    if child:                       # launch_command() child and its group
+        if child.kill():
+            return True
+        print("external.kill_pid_running() ERROR: os.killpg " +
+              " failed for PID:", active_pid)
+        return 0                    # pid has finished
+
     try:
         os.kill(active_pid, 9)  # 0 is status check, 9 kills
         return True  # pid killed. prints "killed" to console if just killed self
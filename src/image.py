@@ -24,6 +24,8 @@ from __future__ import with_statement  # Error handling for file opens
 #       July 06 2024 - import monitor as mon. Utilize global_variables.py
 #       Oct. 15 2024 - Rename mserve.png to taskbar_icon.png
 #       Oct. 05 2025 - Prepend application character + "_" to taskbar_icon.png
+#       Oct. 18 2026 - SpinArtCache() rotated artwork frames with LRU memory cap
+#       Oct. 18 2026 - SpinArtCache() coarser angle step when cap is too small
 #
 #==============================================================================
 
@@ -51,7 +53,9 @@ import re
 import time
 import datetime
 import io
-from collections import namedtuple
+import hashlib  # SpinArtCache() artwork key
+import threading  # SpinArtCache() background worker
+from collections import namedtuple, OrderedDict
 
 import global_variables as g
 import x11                  # x11 wrapper functions for GoneFishing() class
@@ -320,6 +324,244 @@ def shift_image(img_name, direction, width, height, percent):
     return new_image
 
 
+# ==============================================================================
+#
+#       SpinArtCache() - Rotated artwork frames for mserve.py play_spin_art()
+#
+# ==============================================================================
+
+SPIN_STEPS = 720  # 1/2 degree per frame, 720 frames for a full turn
+SPIN_CACHE_MB = 128  # Memory cap for all cached frame sets (4 bytes a pixel)
+SPIN_CACHE_SETS = 8  # LRU - Most frame sets kept (song, size & background)
+SPIN_WORKER = True  # Render rotated frames ahead in a background thread
+
+
+class SpinFrames:
+    """ Rotated frames for one artwork image at one size and background.
+
+        PIL images can be rendered by the background worker. PhotoImages
+        are only created and released in the main (tkinter) thread.
+
+        Callers always pass ndx 0 to 719 (SPIN_STEPS). When fewer 'steps'
+        fit under the memory cap each frame is used for several ndx.
+    """
+    def __init__(self, cache, key, art, bg, steps=SPIN_STEPS):
+        self.cache = cache  # SpinArtCache() that owns memory budget
+        self.key = key  # (md5 of art, (width, height), background)
+        self.source = art  # PIL image last passed to SpinArtCache.frames()
+        self.rgba = art.convert('RGBA')
+        self.size = art.size
+        self.bg = bg
+        self.steps = steps
+        self.frame_bytes = art.size[0] * art.size[1] * 4
+        self.images = [None] * steps  # PIL rotated frames
+        self.photos = [None] * steps  # ImageTk.PhotoImage of rotated frames
+        self.effects = {}  # {(effect, count): ImageTk.PhotoImage}
+        # Quarter turns are kept as PIL images for slide and fade effects
+        self.keep = [SPIN_STEPS // 4 * i - 1 for i in range(1, 5)]  # ndx
+        self.keep_frames = [self.frame(ndx) for ndx in self.keep]
+        self.fade_order = None  # play_art_fade2() shuffled (x, y) list
+        self.bytes = 0  # Memory used by images, photos and effects
+        self.worker = None  # threading.Thread() running self.prefetch()
+        self.cancel = False  # Tell worker to stop
+
+    def angle(self, ndx):
+        """ Frame 0 is rotated -0.5°, frame 719 is rotated -360°. With
+            fewer steps, E.G. 240, frame 0 is -1.5° """
+        return -(ndx + 1) * 360.0 / self.steps
+
+    def frame(self, ndx):
+        """ Frame for ndx 0 to SPIN_STEPS - 1. Last ndx is last frame """
+        return ((ndx + 1) * self.steps - 1) // SPIN_STEPS
+
+    def render(self, ndx):
+        """ If Pillow < 5 background fill for corners more complicated """
+        frame = Image.new("RGBA", self.size, self.bg)
+        rot = self.rgba.rotate(self.angle(ndx))
+        frame.paste(rot, (0, 0), rot)
+        return frame
+
+    def start(self, ndx=0):
+        """ Render frames ahead of the animation in a daemon thread """
+        if self.worker is not None or not SPIN_WORKER:
+            return
+        self.worker = threading.Thread(target=self.prefetch,
+                                       args=(self.frame(ndx),))
+        self.worker.daemon = True
+        self.worker.start()
+
+    def stop(self):
+        """ Worker checks flag before each frame """
+        self.cancel = True
+
+    def prefetch(self, start):
+        """ Worker thread - PIL only, no tkinter calls allowed here.
+            'start' and ndx below are frame numbers, not 0 to 719. """
+        for i in range(self.steps):
+            ndx = (start + i) % self.steps
+            if self.cancel:
+                break
+            if self.images[ndx] is not None or self.photos[ndx] is not None:
+                continue
+            if not self.cache.room(self.frame_bytes):
+                break  # Memory cap reached, rest are rendered on demand
+            frame = self.render(ndx)
+            with self.cache.lock:
+                if self.images[ndx] is None and self.photos[ndx] is None:
+                    self.images[ndx] = frame
+                    self.bytes += self.frame_bytes
+                    self.cache.prefetched += 1
+
+    def image(self, ndx):
+        """ PIL image for frame, rendered now if not cached """
+        ndx = self.frame(ndx)
+        frame = self.images[ndx]
+        if frame is None:
+            frame = self.render(ndx)
+            if ndx in self.keep_frames and self.cache.room(self.frame_bytes):
+                with self.cache.lock:
+                    self.images[ndx] = frame
+                    self.bytes += self.frame_bytes
+        return frame
+
+    def photo(self, ndx):
+        """ PhotoImage for frame. Main thread only. """
+        frame_ndx = self.frame(ndx)
+        photo = self.photos[frame_ndx]
+        if photo is not None:
+            self.cache.hits += 1
+            return photo
+
+        with self.cache.lock:
+            frame = self.images[frame_ndx]
+            if frame is not None and frame_ndx not in self.keep_frames:
+                self.images[frame_ndx] = None  # PhotoImage replaces PIL image
+                self.bytes -= self.frame_bytes
+        if frame is None:
+            self.cache.misses += 1
+            frame = self.image(ndx)
+        else:
+            self.cache.hits += 1
+
+        photo = ImageTk.PhotoImage(frame)
+        if self.cache.room(self.frame_bytes):
+            with self.cache.lock:
+                self.photos[frame_ndx] = photo
+                self.bytes += self.frame_bytes
+        return photo
+
+    def effect(self, name, count, make):
+        """ PhotoImage for step 'count' of effect 'name'. Main thread only.
+            make() returns PIL image and is only called when not cached. """
+        photo = self.effects.get((name, count))
+        if photo is not None:
+            self.cache.hits += 1
+            return photo
+
+        self.cache.misses += 1
+        photo = ImageTk.PhotoImage(make())
+        if self.cache.room(self.frame_bytes):
+            with self.cache.lock:
+                self.effects[(name, count)] = photo
+                self.bytes += self.frame_bytes
+        return photo
+
+
+class SpinArtCache:
+    """ LRU cache of SpinFrames() keyed by artwork hash, size and background.
+
+        Usage from mserve.py play_spin_art():
+
+            frames = self.spin_cache.frames(self.play_resized_art, self.theme_bg)
+            self.play_current_song_art = frames.photo(ndx)
+
+        Memory for all frame sets is capped at 'max_mb'. When a full turn
+        of SPIN_STEPS frames doesn't fit, fewer frames with a coarser angle
+        step are used (fit_steps()). Least recently used frame sets are
+        released first. Slide and fade effects not under the cap are rendered
+        each time. self.lock guards self.sets and frame counts shared with
+        the background worker.
+    """
+    def __init__(self, max_mb=SPIN_CACHE_MB, max_sets=SPIN_CACHE_SETS):
+        self.max_bytes = max_mb * 1000000
+        self.max_sets = max_sets
+        self.sets = OrderedDict()  # {key: SpinFrames()} oldest first
+        self.current = None  # SpinFrames() last returned by frames()
+        self.lock = threading.Lock()
+        self.hits = self.misses = self.prefetched = self.evictions = 0
+
+    def used(self):
+        """ Bytes used by all frame sets """
+        with self.lock:
+            return sum(frames.bytes for frames in self.sets.values())
+
+    def room(self, nbytes):
+        """ Is there room for another frame under the memory cap? """
+        return self.used() + nbytes <= self.max_bytes
+
+    def fit_steps(self, size):
+        """ Most frames for a full turn that fit under the memory cap. A
+            full turn of 720 frames at 300 x 300 pixels is 259 MB so 128 MB
+            gets 240 frames, 1.5° each. Steps divide SPIN_STEPS and are a
+            multiple of 4 so quarter turns are exact frames. """
+        frame_bytes = size[0] * size[1] * 4
+        steps = 4
+        for steps in range(SPIN_STEPS, 3, -4):
+            if SPIN_STEPS % steps == 0 and \
+                    steps * frame_bytes <= self.max_bytes:
+                break
+        return steps
+
+    def frames(self, art, bg, ndx=0):
+        """ Return SpinFrames() for PIL image 'art' on background 'bg'.
+            Hashing artwork only happens when a new PIL image is passed. """
+        current = self.current
+        if current is not None and current.source is art and current.bg == bg:
+            return current
+
+        key = (hashlib.md5(art.tobytes()).hexdigest(), art.size, bg)
+        with self.lock:
+            frames = self.sets.pop(key, None)
+            if frames is None:
+                frames = SpinFrames(self, key, art, bg,
+                                    self.fit_steps(art.size))
+            frames.source = art
+            self.sets[key] = frames  # Most recently used is last
+
+        if current is not None and current is not frames:
+            current.stop()
+        self.current = frames
+        self.evict(frames.steps * frames.frame_bytes)
+        frames.start(ndx)
+        return frames
+
+    def evict(self, nbytes=0):
+        """ Release least recently used frame sets. Main thread only as
+            releasing PhotoImages calls tkinter. """
+        while len(self.sets) > 1 and (len(self.sets) > self.max_sets or
+                                      self.used() + nbytes > self.max_bytes):
+            with self.lock:
+                _key, frames = self.sets.popitem(last=False)
+            frames.stop()
+            self.evictions += 1
+
+    def clear(self):
+        """ Release all frame sets when play window closes """
+        with self.lock:
+            sets, self.sets = self.sets, OrderedDict()
+        for frames in sets.values():
+            frames.stop()
+        self.current = None
+
+    def counts(self):
+        """ Counters for mserve.py show_debug() """
+        return OrderedDict([
+            ("frame sets", len(self.sets)), ("used MB", round(
+                self.used() / 1000000.0, 1)), ("hits", self.hits),
+            ("misses", self.misses), ("prefetched", self.prefetched),
+            ("evictions", self.evictions)])
+
+
 # noinspection PyTypeChecker
 def make_checkboxes(hgt, out_c, fill_c, chk_c):
 
@@ -22,6 +22,10 @@ from __future__ import with_statement  # Error handling for file opens
 #       Mar. 13 2024 - SQL Config for treeview colors
 #       Apr. 28 2024 - Loudness Normalization using ffmpeg 'loudnorm' filter.
 #       Nov. 16 2024 - Update virtual file sizes for FTP devices 
+#       Oct. 18 2026 - DirSnapshot() class for incremental make_sorted_list()
+#       Oct. 18 2026 - Volume analysis reads History in one batch per step
+#       Oct. 18 2026 - FfmpegPool() runs Analyze Volume ffmpeg commands at once
+#       Oct. 18 2026 - sql.JobQueue() resumes Synchronize and Analyze Volume
 #
 #==============================================================================
 #import stat
@@ -72,6 +76,17 @@ import ftplib  # Communicate with FTP server
 import random  # For Locations() make_temp
 import string  # For Locations() make_temp
 import traceback
+import threading  # ParallelWalk() and FfmpegPool() worker threads
+import multiprocessing  # cpu_count() for FfmpegPool() worker threads
+import signal  # FfmpegPool() kills ffmpeg process group
+try:
+    import subprocess32 as sp
+except ImportError:  # No module named subprocess32
+    import subprocess as sp
+try:
+    import queue  # Python 3
+except ImportError:
+    import Queue as queue  # Python 2
 from collections import OrderedDict
 
 import global_variables as g
@@ -114,6 +129,10 @@ FNAME_MOD_TIME         = MSERVE_DIR + "modification_time"  # Android phone times
 # Sep 04 2023 - Create FNAME_SIZE_DICT of tuples (fake_path, file_size)
 FNAME_SIZE_DICT        = MSERVE_DIR + "size_dict"  # JSON dictionary
 FNAME_WALK_LIST        = MSERVE_DIR + "walk_list"  # JSON list of tuples
+# Oct 18 2026 - Directory mtimes and entries for incremental make_sorted_list()
+FNAME_DIR_SNAPSHOT     = MSERVE_DIR + "dir_snapshot"  # JSON dictionary
+# Oct 18 2026 - mserve.py ArtworkCache() extracted and resized artwork files
+FNAME_ARTWORK_DIR      = MSERVE_DIR + "artwork" + os.sep  # Directory
 
 # Files in /tmp/
 # There can be two open at once so unlike other global variables this is never
@@ -131,6 +150,12 @@ IPC_PICKLE_FNAME = g.TEMP_DIR + "mserve_encoding_pickle"
 ENCODE_DEV_FNAME = g.TEMP_DIR + "mserve_encoding_last_disc"
 
 ''' Global variables '''
+WALK_WORKERS = 4  # Directories listed at once for remote hosts. Local is 1
+WALK_REFRESH = .1  # Seconds between ParallelWalk() refresh() callbacks
+FFMPEG_WORKERS = 0  # Analyze Volume ffmpeg commands at once. 0 = CPU count
+FFMPEG_REFRESH = .033  # Seconds between FfmpegPool() refresh() callbacks
+FFMPEG_COMMIT_JOBS = 50  # avo_job_done() jobs per SQL commit
+FFMPEG_COMMIT_SECS = 2.0  # avo_job_done() seconds between SQL commits
 LIST = []  # List of DICT entries - DEPRECATED August 2023
 DICT = {}  # Location dictionary - DEPRECATED August 2023
 
@@ -157,6 +182,7 @@ def set_location_filenames(iid):
     """ Called when mserve first starts up """
     global FNAME_LAST_OPEN_STATES, FNAME_LAST_PLAYLIST, FNAME_LAST_SONG_NDX
     global FNAME_MOD_TIME, FNAME_SIZE_DICT, FNAME_WALK_LIST, LAST_LOCATION_SET
+    global FNAME_DIR_SNAPSHOT, FNAME_ARTWORK_DIR
 
     ''' Sanity check '''
     if LAST_LOCATION_SET:
@@ -175,6 +201,8 @@ def set_location_filenames(iid):
     FNAME_MOD_TIME         = set_one_filename(FNAME_MOD_TIME, iid)
     FNAME_SIZE_DICT        = set_one_filename(FNAME_SIZE_DICT, iid)
     FNAME_WALK_LIST        = set_one_filename(FNAME_WALK_LIST, iid)
+    FNAME_DIR_SNAPSHOT     = set_one_filename(FNAME_DIR_SNAPSHOT, iid)
+    FNAME_ARTWORK_DIR      = set_one_filename(FNAME_ARTWORK_DIR, iid)
 
     LAST_LOCATION_SET = True
 
@@ -1027,6 +1055,412 @@ class ModTime:
             pickle.dump(self.mod_dict, f)
 
 
+class ParallelWalk:
+    """ Walk directories listing several at once with a small thread pool.
+        Over FTP, sshfs and Android WiFi mounts every directory listing pays
+        a full network round trip. Listing Artist and Album directories
+        concurrently hides most of that latency.
+
+        list_dir(subdir) is called in worker threads and must return
+        (dirs, files) lists of names, or (None, None) when listing fails.
+        It cannot touch tkinter. The update(subdir) and refresh() callbacks
+        are always called in the caller's (main) thread, so DelayedTextBox
+        can show progress and play window animations keep running.
+
+        walk() returns the same (subdir, dirs, files) tuples as os.walk()
+        with parents ahead of their children. Sibling order can vary.
+    """
+
+    def __init__(self, list_dir, workers=WALK_WORKERS, join=os.path.join):
+        self.list_dir = list_dir    # Function(subdir) returns dirs, files
+        self.workers = max(1, int(workers))  # 1 = walk in caller's thread
+        self.join = join            # Function(subdir, name) for next subdir
+        self.listed_cnt = 0         # Directories listed
+        self.error_cnt = 0          # Directories that couldn't be listed
+
+    def list_one(self, subdir, depth):
+        """ List one directory. Exceptions are returned as failed listing. """
+        try:
+            dirs, files = self.list_dir(subdir)
+        except Exception as err:
+            print("location.py ParallelWalk.list_one() Exception:", err)
+            dirs, files = None, None
+        return subdir, depth, dirs, files
+
+    def worker(self, jobs, results):
+        """ Worker thread. List directories until None job is received. """
+        while True:
+            job = jobs.get()
+            if job is None:
+                return
+            results.put(self.list_one(*job))
+
+    def walk(self, top, max_depth=2, update=None, refresh=None):
+        """ Walk directory tree beginning at top.
+        :param top: Top Directory
+        :param max_depth: Deepest level listed, top is 0. None = no limit
+        :param update: Optional callback receiving each subdir, E.G. dtb.update
+        :param refresh: Optional callback to update animations while waiting
+        :returns walk_list: [(subdir, dirs, files), ...] same as os.walk()
+        """
+        jobs = queue.Queue()
+        results = queue.Queue()
+        threads = []
+        if self.workers > 1:
+            for _i in range(self.workers):
+                thread = threading.Thread(target=self.worker,
+                                          args=(jobs, results))
+                thread.daemon = True  # Don't hang mserve shutdown
+                thread.start()
+                threads.append(thread)
+
+        def submit(subdir, depth):
+            """ Queue directory for worker threads or list it now """
+            if threads:
+                jobs.put((subdir, depth))
+            else:
+                results.put(self.list_one(subdir, depth))
+
+        walk_list = []
+        submit(top, 0)
+        pending = 1
+        next_refresh = time.time() + WALK_REFRESH
+        while pending:
+            try:
+                subdir, depth, dirs, files = results.get(timeout=WALK_REFRESH)
+            except queue.Empty:
+                subdir = None  # Waiting on slow host
+            if refresh and (subdir is None or time.time() > next_refresh):
+                refresh()
+                next_refresh = time.time() + WALK_REFRESH
+            if subdir is None:
+                continue
+
+            pending -= 1
+            if update:
+                update(subdir)
+            if dirs is None:
+                self.error_cnt += 1
+                continue
+            self.listed_cnt += 1
+            walk_list.append((subdir, dirs, files))
+            if max_depth is not None and depth >= max_depth:
+                continue
+            for name in dirs:
+                submit(self.join(subdir, name), depth + 1)
+                pending += 1
+
+        for _thread in threads:
+            jobs.put(None)  # Tell worker thread to end
+        return walk_list
+
+
+class FfmpegPool:
+    """ Run several ffmpeg commands at once with a small thread pool.
+        Analyze Volume steps used to run one ffmpeg at a time with output
+        redirected to the one TMP_STDERR file shared by all commands.
+
+        Jobs are dictionaries with 'cmd' and 'wait' (seconds) keys. Worker
+        threads run the command with stdout and stderr captured through
+        pipes, kill it after 'wait' seconds and add 'stdout', 'stderr',
+        'timeout', 'start' and 'end' keys. Worker threads can't touch
+        tkinter or sqlite3.
+
+        submit() only saves the job. run() hands a worker thread the next
+        job as each one ends so no more than 'workers' commands run or wait
+        at once. run() calls done(job) in the caller's (main) thread as each
+        job ends, in any order, so results can be saved to SQL and inserted
+        into treeview. refresh() is called while waiting. When done() or
+        refresh() return False, cancel() kills running commands and jobs
+        not started yet are returned with 'cancelled' key.
+    """
+
+    def __init__(self, workers=FFMPEG_WORKERS):
+        self.workers = max(1, int(workers or multiprocessing.cpu_count()))
+        self.jobs = queue.Queue()   # Jobs waiting for worker thread
+        self.results = queue.Queue()  # Jobs ended, waiting for done()
+        self.threads = []           # Started by run()
+        self.running = {}           # {id(job): Popen()} being run now
+        self.lock = threading.Lock()  # For self.running and self.cancelled
+        self.cancelled = False      # Set by cancel()
+        self.submitted = []         # Jobs in submit() order
+        self.submitted_cnt = 0      # Jobs submitted
+        self.started_cnt = 0        # Jobs given to worker threads
+        self.done_cnt = 0           # Jobs passed to done()
+        self.timeout_cnt = 0        # Commands killed after 'wait' seconds
+
+    def submit(self, job):
+        """ Save job. run() gives it to a worker thread. """
+        self.submitted.append(job)
+        self.submitted_cnt += 1
+
+    def start(self):
+        """ Give worker threads jobs until 'workers' jobs are running. """
+        while self.started_cnt < self.submitted_cnt and \
+                self.started_cnt - self.done_cnt < self.workers:
+            self.jobs.put(self.submitted[self.started_cnt])
+            self.started_cnt += 1
+
+    def run_one(self, job):
+        """ Run one command in worker thread with output through pipes. """
+        job['start'] = time.time()
+        job['timeout'] = False
+        # Own session and process group so kill() gets ffmpeg, not just the
+        # shell. preexec_fn isn't safe with threads so only Python 2 uses it.
+        if PYTHON_VER == "3":
+            session = {'start_new_session': True}
+        else:
+            session = {'preexec_fn': os.setsid}
+        try:
+            proc = sp.Popen(job['cmd'], shell=True, stdout=sp.PIPE,
+                            stderr=sp.PIPE, **session)
+        except OSError as err:
+            job['stdout'], job['stderr'] = "", str(err)
+            job['end'] = time.time()
+            return
+
+        with self.lock:
+            self.running[id(job)] = proc
+            if self.cancelled:
+                self.kill(proc)
+
+        def time_out():
+            """ Command ran longer than job['wait'] seconds """
+            job['timeout'] = True
+            print("location.py FfmpegPool.run_one()", job['wait'],
+                  "second time-out\ncommand:", job['cmd'])
+            self.kill(proc)
+
+        timer = threading.Timer(float(job['wait']), time_out)
+        timer.daemon = True
+        timer.start()
+        out, err = proc.communicate()
+        timer.cancel()
+        with self.lock:
+            del self.running[id(job)]
+
+        if not isinstance(err, str):  # Python 3 bytes
+            out = out.decode("utf-8", "replace")
+            err = err.decode("utf-8", "replace")
+        job['stdout'], job['stderr'] = out, err
+        job['end'] = time.time()
+
+    def worker(self):
+        """ Worker thread. Run jobs until None job is received. """
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                return
+            if self.cancelled:
+                job['cancelled'] = True
+            else:
+                self.run_one(job)
+            self.results.put(job)
+
+    @staticmethod
+    def kill(proc):
+        """ Kill shell and ffmpeg in process group started by run_one() """
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except OSError:
+            pass  # Ended on its own
+
+    def cancel(self):
+        """ Kill running commands. Jobs not started are not run. """
+        with self.lock:
+            self.cancelled = True
+            for proc in self.running.values():
+                self.kill(proc)
+
+    def run(self, done, refresh=None):
+        """ Wait for all submitted jobs to end.
+        :param done: Function(job) called in main thread as each job ends.
+            Returns False to cancel remaining jobs.
+        :param refresh: Optional function to update animations while
+            waiting. Returns False to cancel remaining jobs.
+        :returns: True when all jobs were done, False when cancelled
+        """
+        for _i in range(min(self.workers, self.submitted_cnt)):
+            thread = threading.Thread(target=self.worker)
+            thread.daemon = True  # Don't hang mserve shutdown
+            thread.start()
+            self.threads.append(thread)
+        self.start()
+
+        while self.done_cnt < self.submitted_cnt:
+            try:
+                job = self.results.get(timeout=FFMPEG_REFRESH)
+            except queue.Empty:
+                job = None  # All workers are busy
+            if refresh and not self.cancelled and refresh() is False:
+                self.cancel()
+            if job is None:
+                continue
+
+            self.done_cnt += 1
+            if job.get('timeout'):
+                self.timeout_cnt += 1
+            if not self.cancelled and done(job) is False:
+                self.cancel()
+            self.start()  # Cancelled jobs pass through workers unrun
+
+        for _thread in self.threads:
+            self.jobs.put(None)  # Tell worker thread to end
+        self.threads = []
+        return not self.cancelled
+
+
+class DirSnapshot:
+    """ Persistent snapshot of directory modification times and entries.
+        Saved in ~/.../mserve/L999/dir_snapshot so make_sorted_list() doesn't
+        have to walk the whole location each time mserve starts.
+
+        A directory's mtime changes when files are added, deleted or renamed
+        inside it. When the mtime is the same as last session, the saved
+        dirs and files are reused and the directory isn't listed again.
+        Over sshfs or curlftpfs this replaces thousands of round trips with
+        one os.stat() per Artist and Album directory.
+
+        walk() returns the same (subdir, dirs, files) tuples os.walk() would
+        for TopDir, Artist and Album levels. Directories below Album level
+        are listed but not descended, make_sorted_list() ignores them.
+
+        After walk() the delta since last session is in self.added,
+        self.removed and self.changed_dirs. The sorted list and depth counts
+        from last session are in self.sorted_list and self.depth_count.
+
+    """
+
+    def __init__(self, topdir, filename=None, max_depth=2):
+        self.topdir = topdir        # Location's Top Directory ending in os.sep
+        self.filename = filename if filename else FNAME_DIR_SNAPSHOT
+        self.max_depth = max_depth  # 0 = TopDir, 1 = Artist, 2 = Album
+        self.dirs = {}              # Key = relative subdir: [mtime, dirs, files]
+        self.new_dirs = {}          # self.dirs rebuilt by walk()
+        self.sorted_list = None     # make_sorted_list() work list last session
+        self.depth_count = None     # Count of songs at topdir, artist, album
+        self.loaded = False         # Snapshot file exists for same topdir?
+        self.added = []             # Full paths of files added since last walk
+        self.removed = []           # Full paths of files removed since last walk
+        self.changed_dirs = []      # Relative subdirs re-listed because mtime
+        self.listed_cnt = 0         # Directories listed with os.listdir()
+        self.reused_cnt = 0         # Directories reused from snapshot
+        self.read()
+
+    def read(self):
+        """ Read last snapshot. Ignore it if Top Directory has changed. """
+        d = None
+        try:
+            d = ext.read_from_json(self.filename)
+        except ValueError as err:  # Corrupt JSON, E.G. disk full on last save
+            print("location.py DirSnapshot.read() Exception:", err)
+        if not d or d.get('TopDir') != self.topdir:
+            return False
+
+        self.dirs = d.get('Dirs', {})
+        self.sorted_list = d.get('SortedList', None)
+        self.depth_count = d.get('DepthCount', None)
+        self.loaded = True
+        return True
+
+    def save(self, sorted_list=None, depth_count=None):
+        """ Save snapshot rebuilt by walk() with results of make_sorted_list() """
+        d = {'TopDir': self.topdir, 'Dirs': self.new_dirs,
+             'SortedList': sorted_list, 'DepthCount': depth_count}
+        if not ext.write_to_json(self.filename, d):
+            print("location.py DirSnapshot.save() FAILED:", self.filename)
+            return False
+        self.dirs = self.new_dirs
+        self.sorted_list = sorted_list
+        self.depth_count = depth_count
+        return True
+
+    def walk(self, update=None, workers=1, refresh=None):
+        """ Walk Top Directory reusing unchanged directories from snapshot.
+        :param update: Optional callback receiving each subdir, E.G. dtb.update
+        :param workers: Directories listed at once, see ParallelWalk()
+        :param refresh: Optional callback to keep animations running
+        :returns walk_list: [(subdir, dirs, files), ...] same as os.walk()
+        """
+        self.new_dirs = {}
+        walker = ParallelWalk(self.read_dir, workers)
+        walk_list = walker.walk(self.topdir, self.max_depth, update, refresh)
+        self.compare()
+        return walk_list
+
+    def read_dir(self, subdir):
+        """ Get one directory's entries from snapshot or by listing it.
+            Runs in ParallelWalk() worker threads. self.dirs is only read.
+        """
+        rel = subdir[len(self.topdir):]
+        try:
+            mtime = os.stat(subdir).st_mtime
+        except OSError as err:
+            print("location.py DirSnapshot.read_dir() Exception:", err)
+            return None, None
+
+        old = self.dirs.get(rel)
+        if old and old[0] == mtime:
+            dirs, files = old[1], old[2]
+        else:
+            dirs, files = self.list_dir(subdir)
+            if dirs is None:
+                return None, None  # Directory vanished or host went off-line
+
+        self.new_dirs[rel] = [mtime, dirs, files]
+        return list(dirs), files
+
+    def compare(self):
+        """ Build delta between last snapshot and directories just walked """
+        self.added = []
+        self.removed = []
+        self.changed_dirs = []
+        self.listed_cnt = self.reused_cnt = 0
+
+        for rel, (mtime, _dirs, files) in self.new_dirs.items():
+            old = self.dirs.get(rel)
+            if old and old[0] == mtime:
+                self.reused_cnt += 1
+                continue
+            self.listed_cnt += 1
+            self.changed_dirs.append(rel)
+            subdir = os.path.join(self.topdir, rel)
+            old_files = set(old[2]) if old else set()
+            new_files = set(files)
+            self.added.extend([os.path.join(subdir, f)
+                               for f in new_files - old_files])
+            self.removed.extend([os.path.join(subdir, f)
+                                 for f in old_files - new_files])
+
+        ''' Directories that disappeared take all their files with them '''
+        for rel in self.dirs:
+            if rel not in self.new_dirs:
+                subdir = os.path.join(self.topdir, rel)
+                self.removed.extend([os.path.join(subdir, f)
+                                     for f in self.dirs[rel][2]])
+                self.changed_dirs.append(rel)
+
+    @staticmethod
+    def list_dir(subdir):
+        """ Split directory entries into subdirectories and files like os.walk()
+        :returns dirs, files: Lists of names or None, None when listing fails
+        """
+        try:
+            names = os.listdir(subdir)
+        except OSError as err:
+            print("location.py DirSnapshot.list_dir() Exception:", err)
+            return None, None
+
+        dirs = []
+        files = []
+        for name in names:
+            if os.path.isdir(os.path.join(subdir, name)):
+                dirs.append(name)
+            else:
+                files.append(name)
+        return dirs, files
+
+
 def t(float_time):
     """
     TODO: This is in external.py module now!
@@ -1226,6 +1660,13 @@ class LocationsCommonSelf:
         self.avo_select_max_upper = -0.2  # Select songs <= maximum volume
         # E.G. self.avo_select_max_lower <= song_max <= self.avo_select_max_upper
         self.avo_skip_complete = True  # Skip if step completed for file
+        self.avo_hist_vars = {}  # {action: {music_id: row}} avo_get_music_var()
+        self.avo_pool = None  # FfmpegPool() while cmp_populate_tree() runs
+        self.avo_jobs = None  # sql.JobQueue() while FfmpegPool() runs
+        self.avo_commit_cnt = 0  # avo_job_done() jobs since last SQL commit
+        self.avo_commit_time = 0.0  # avo_job_done() time of last SQL commit
+        self.cmp_title = ""  # cmp_top title before job_progress() stats
+        self.job_progress_time = 0.0  # Last time job_progress() updated title
         self.avo_integrated = "-23.0"  # AKA input_i. ffmpeg 'loudnorm' defaults
         self.avo_true_peak = "-0.0"  # AKA input_tp  TODO: Setup in user sql.Config()
         self.avo_lra = "11.0"  # AKA input_lra and "LRA"
@@ -1633,6 +2074,27 @@ class Locations(LocationsCommonSelf):
         sql_key += base_key
         return self.cfg.get_cfg(sql_key)
 
+    def get_walk_workers(self, code=None):
+        """ Directories ParallelWalk() lists at once for a location.
+            SQL History Type 'walk', Action 'L999', Size = workers overrides
+            default of WALK_WORKERS for remote hosts and 1 for local storage.
+        :param code: Location code. Defaults to open location
+        :return workers: Integer 1 or greater
+        """
+        code = code if code else self.open_code
+        d = sql.get_config('walk', code) if code else None
+        if d and d['Size']:
+            return max(1, int(d['Size']))
+        if code == self.act_code and code != self.open_code:
+            return WALK_WORKERS if self.act_host else 1
+        return WALK_WORKERS if self.open_host else 1
+
+    @staticmethod
+    def set_walk_workers(code, workers):
+        """ Save number of directories ParallelWalk() lists at once """
+        sql.save_config('walk', code, Size=int(workers),
+                        Comments="Concurrent directory listings")
+
     def display_test_window(self):
         """ Mount test host window when not using Playlist Maintenance Window
             Called from within mserve.py
@@ -2815,7 +3277,7 @@ class Locations(LocationsCommonSelf):
     def delete_location(self):
         """ Delete Location  when 'Delete' button applied. """
         sql.loc_cursor.execute("DELETE FROM Location WHERE Id=?", [self.act_row_id])
-        sql.con.commit()  # con.commit() must follow cursor.execute()
+        sql.commit()  # con.commit() must follow cursor.execute()
         # same as mserve.py Playlists().delete_playlist()
         sql.delete_config("resume", self.act_code)
         sql.delete_config("chron_state", self.act_code)
@@ -3844,6 +4306,10 @@ filename.
     def test_ftp_walk(self, ftp, show=True):
         """ Walk FTP directories
             TODO: Simply read fake_paths_size
+
+            Oct 18/26 - ParallelWalk() lists directories at once with one FTP
+                connection per worker thread. When the FTP server refuses
+                extra connections, workers share 'ftp' one at a time.
         """
 
         ''' Build fake_paths_size filename (FNAME) using open location) '''
@@ -3852,59 +4318,83 @@ filename.
         if os.path.isfile(size_name) and os.path.isfile(walk_name):
             return True  # Save time and reuse last session. Tree will rebuild slow
 
-        def walk(topdir, path, all_dict, walks):
-            """ walk the path """
-            files = []
+        if self.act_topdir.endswith(os.sep):
+            u_topdir = self.act_topdir.rsplit(os.sep, 1)[0]
+        else:
+            u_topdir = self.act_topdir
+        u_topdir = toolkit.uni_str(u_topdir)
+
+        all_files = {}  # Key = full path, Value = size
+        dir_lines = {}  # Key = FTP path, Value = lines for self.test_show()
+        local = threading.local()  # Each worker thread's FTP connection
+        connections = []  # Extra FTP connections to quit when walk is done
+        ftp_lock = threading.Lock()  # When sharing 'ftp' between threads
+
+        def ftp_dir(path):
+            """ List FTP path in a worker thread. Returns dirs & files. """
+            conn = getattr(local, 'ftp', None)
+            if conn is None:
+                conn = local.ftp = self.ftp_connect() or ftp
+                if conn is not ftp:
+                    connections.append(conn)
+            lines = []
+            if conn is ftp:
+                with ftp_lock:
+                    ftp.dir(path, lines.append)  # callback = lines.append(line)
+            else:
+                conn.dir(path, lines.append)
+
             dirs = []
             base_names = []
-            if topdir.endswith(os.sep):
-                u_topdir = topdir.rsplit(os.sep, 1)[0]
-            else:
-                u_topdir = topdir
-            u_topdir = toolkit.uni_str(u_topdir).encode('utf-8')
-            u_path = toolkit.uni_str(path)
-            ftp.dir(u_path, files.append)  # callback = files.append(line)
+            shows = []
+            u_path = toolkit.uni_str(path).rstrip(os.sep)
             # Filename could be any position on line so can't use line[52:] below
             # dr-x------   3 user group            0 Aug 27 16:32 Compilations
-            for f in files:
+            for f in lines:
                 lin = ' '.join(f.split())  # compress multiple whitespace to one space
                 parts = lin.split()  # split on one space
                 size = parts[4]
                 # Date format is either: MMM DD hh:mm or MMM DD  YYYY or MMM DD YYYY
                 date3 = parts[7] + " "  # doesn't matter if the size is same as YEAR
                 # No shortcut ' '.join(parts[8:]) - name could have had double space
-                name = f.split(date3)[1]
+                u_name = toolkit.uni_str(f.split(date3)[1])
                 if f.startswith("d"):  # directory?
-                    # Print all directories to see permissions
-                    self.test_show(f)  # self. doesn't work inside inner func.
-                    self.fast_refresh()  # Update animations
-                    new_path = path + name + os.sep
-                    dirs.append(name.encode('utf-8'))
-                    walk(topdir, new_path, all_dict, walks)  # back down the rabbit hole
+                    shows.append(f)  # Print all directories to see permissions
+                    dirs.append(u_name)
                 else:
                     # /path/to/filename.ext <SIZE>
-                    u_name = toolkit.uni_str(name)
-                    base_names.append(u_name.encode('utf-8'))
+                    base_names.append(u_name)
                     int_size = int(size.strip())
-                    u_size = u'{:n}'.format(int_size)
-                    entry = u_path + u_name + u" < " + u_size + u" > "
-                    #all_dict.append(entry.encode('utf-8'))  # no more list, now dict
-                    full_path = u_path + u_name
-                    all_dict[u_topdir + full_path.encode('utf-8')] = int_size
+                    full_path = u_path + os.sep + u_name
+                    all_files[u_topdir + full_path] = int_size
                     if show:
-                        self.test_show(entry.encode('utf-8'))
-            #walk_tuple = tuple((u_path.encode('utf-8'), dirs, base_names))
-            #walks.append(walk_tuple)
-            if u_path.endswith(os.sep):
-                u_path = u_path.rsplit(os.sep, 1)[0]
-            walks.append((u_topdir + u_path.encode('utf-8'), dirs, base_names))
-
-        all_files = {}
-        all_walks = []
+                        u_size = u'{:n}'.format(int_size)
+                        shows.append(full_path + u" < " + u_size + u" > ")
+            dir_lines[path] = shows
+            return dirs, base_names
+
+        def update(path):
+            """ Show directory lines in main thread as each listing arrives """
+            for line in dir_lines.pop(path, []):
+                self.test_show(line)
+
+        workers = self.get_walk_workers(self.act_code)
+        walker = ParallelWalk(ftp_dir, workers)
         # Long test of all sub-dirs and files
         ext.t_init('walk(os.sep, all_files)')
-        print("self.act_topdir:", self.act_topdir)
-        walk(self.act_topdir, os.sep, all_files, all_walks)  # 41 seconds. Nautilus is split second
+        print("self.act_topdir:", self.act_topdir, "workers:", workers)
+        walks = walker.walk(os.sep, max_depth=None, update=update,
+                            refresh=self.fast_refresh)  # Was 41 seconds
+        for conn in connections:
+            try:
+                conn.quit()
+            except Exception as err:
+                print("Exception:", err)
+
+        all_walks = []
+        for path, dirs, base_names in walks:
+            u_path = toolkit.uni_str(path).rstrip(os.sep)
+            all_walks.append((u_topdir + u_path, dirs, base_names))
         success = ext.write_to_json(size_name, all_files)
         if not success:
             print("ext.write_to_json(FNAME_SIZE_DICT, all_files)... FAILED")
@@ -3924,6 +4414,8 @@ filename.
 
         walk_time = ext.t_end('print')
         text = "\nFTP Walk completed in: " + tmf.mm_ss(walk_time) + " seconds."
+        text += "\nDirectories listed: " + str(walker.listed_cnt)
+        text += " using " + str(workers) + " FTP connection(s)."
         text += "\nFake paths and sizes saved to: " + size_name
         text += "\nos.walk(dir, topdown) list to: " + walk_name
         self.test_show(text, pattern=FNAME_SIZE_DICT)
@@ -3932,6 +4424,23 @@ filename.
         print("len(all_files):", len(all_files))  # 4,074 files incl 452 subdirs
         return
 
+    def ftp_connect(self):
+        """ Quietly open another FTP connection to self.act_host for
+            ParallelWalk() worker threads. No messages, they can't use tkinter.
+        :return ftp: ftplib.FTP() instance or None when login fails
+        """
+        parts = self.act_wakecmd.split()  # ftp 2221 rick 1234
+        if len(parts) < 4 or parts[0] != "ftp":
+            return None
+        ftp = ftplib.FTP()
+        try:
+            ftp.connect(self.act_host, int(parts[1]))
+            ftp.login(parts[2], parts[3])
+        except Exception as err:
+            print("location.py Locations.ftp_connect() Exception:", err)
+            return None
+        return ftp
+
     def test_show(self, text, pattern=None):
         """ Insert into self.test_box (scrolled text box) and print to console.
             Also use dtb (delayed text box), however by design not all lines will
@@ -4266,6 +4775,7 @@ filename.
             title = "Update 'loudnorm' Filter Pass 2 - " + self.cmp_target_dir
 
         title = title + " - mserve"
+        self.cmp_title = title  # job_progress() appends files/s and ETA
         self.cmp_top.title(title)
 
         ''' FileControl() from mserve.py used to parse ffmpeg output '''
@@ -4582,6 +5092,9 @@ filename.
         if not self.cmp_top_is_active:
             return  # Already closed
         self.cmp_top_is_active = False
+        if self.avo_pool:
+            self.avo_pool.cancel()  # Kill ffmpeg commands still running
+            self.avo_pool = None
         if self.tt and self.cmp_top:
             if self.tt.check(self.cmp_top) is not None:  # Were tooltips created?
                 self.tt.close(self.cmp_top)  # Close tooltips under top level
@@ -4633,6 +5146,10 @@ filename.
                 return False
 
         toolkit.wait_cursor(self.cmp_top)  # Make Cursor a spinning hourglass
+        if prefix != "cmp":
+            self.avo_load_music_vars()  # Avoid SQL query per song
+            self.avo_pool = FfmpegPool()  # ..._insert_tree_row() submits ffmpeg
+            self.avo_jobs = self.job_queue_open(self.state)
         ''' Traverse fake_paths created by mserve.py make_sorted_list() '''
         for i, fake_path in enumerate(self.fake_paths):
             if not self.cmp_top_is_active:
@@ -4684,6 +5201,26 @@ filename.
                 print("locations.py cmp_populate_tree() invalid state:", self.state)
                 exit()
 
+        if self.avo_pool:
+            ''' ffmpeg commands queued above run several at once. Results are
+                saved and inserted into treeview as each one ends. '''
+            pool, self.avo_pool = self.avo_pool, None  # 'Redo' runs one now
+            with sql.UnitOfWork():  # One commit for all jobs
+                for job in pool.submitted:
+                    # History decides which songs run, JobQueue records runs
+                    self.avo_jobs.enqueue(self.fake_paths[int(job['iid'])],
+                                          job['cmd'], job['trg_size'])
+            self.avo_commit_cnt, self.avo_commit_time = 0, time.time()
+            with sql.UnitOfWork(rows=0):  # avo_job_done() commits batches
+                finished = pool.run(self.avo_job_done, self.fast_refresh)
+            jobs, self.avo_jobs = self.avo_jobs, None
+            if not finished:
+                self.avo_hist_vars = {}
+                return False  # Closing down. Next run skips finished songs
+            self.job_progress(jobs, force=True)
+            jobs.purge()
+
+        self.avo_hist_vars = {}  # Single song 'Redo' reads SQL again
         ext.t_end('no_print')  # No Refresh: Build compare target: 1.2339029312
         # Refresh thread (33ms after)   : Build compare target: 158.4349091053
         # Refresh tk_after=False     : Build compare target: 26.8863759041
@@ -4914,7 +5451,7 @@ filename.
                 'diff -s ' + '"' + src_path + '" "' +
                 self.TMP_FTP_RETRIEVE + '"', src_size)
             print(ext.read_into_string(self.TMP_STDOUT))
-            """ Use avo_run_ffmpeg() technique of cmd = cmd.replace()
+            """ Use avo_run_retry() technique of cmd = cmd.replace()
             TODO:
             1. Assume target is Android and Android is never the source
             2. ftp file transfer to /tmp/mserve_ftp_recv_zs8k6f
@@ -4984,8 +5521,45 @@ filename.
             ftp.retrbinary('RETR ' + basename, f.write)
         # error_perm: 550 No such directory.
 
+    def job_queue_open(self, operation):
+        """ sql.JobQueue() for operation from open location to other.
+            Report jobs an earlier session didn't finish. """
+        jobs = sql.JobQueue(operation, self.open_code, self.act_code)
+        interrupted = jobs.interrupted()
+        if interrupted:
+            print("location.py job_queue_open()", operation,
+                  "resuming. Jobs not finished last time:", interrupted)
+        return jobs
+
+    def job_progress(self, jobs, force=False):
+        """ Append files/s, MB/s and ETA from sql.JobQueue() to cmp_top
+            title. Once a second unless force=True. """
+        now = time.time()
+        if not force and now - self.job_progress_time < 1.0:
+            return
+        self.job_progress_time = now
+        st = jobs.stats()
+        done = st['done'] + st['failed']
+        text = "  [" + '{:n}'.format(done) + " of " + \
+               '{:n}'.format(done + st['remaining']) + " files"
+        if st['files_per_sec']:
+            text += "  " + '{:.2f}'.format(st['files_per_sec']) + " files/s"
+        if st['mb_per_sec']:
+            text += "  " + '{:.1f}'.format(st['mb_per_sec']) + " MB/s"
+        if st['eta'] is not None and st['remaining']:
+            text += "  ETA " + tmf.mm_ss(st['eta'])
+        text += "]"
+        if self.cmp_top_is_active:
+            self.cmp_top.title(self.cmp_title + text)
+        return st
+
     def cmp_update_files(self):
-        """ Called via "Update differences" button on cmp_top """
+        """ Called via "Update differences" button on cmp_top
+
+            Commands are saved in sql.JobQueue() so when mserve closes or
+            crashes part way through, next time commands already done are
+            skipped and interrupted commands are run again.
+        """
 
         _who = "Locations().cmp_update_files():"
 
@@ -5013,13 +5587,27 @@ filename.
                         break  # Programmer error
         self.fast_refresh(tk_after=True)  # Update play_top animations
 
-        ''' Tally sizes of all files to be copied. For granular progress bars. '''
+        ''' Tally sizes of all files to be copied. For granular progress bars.
+            Queue commands that weren't done by an interrupted session. '''
         all_sizes = 0
+        jobs = self.job_queue_open('synchronize')
+        command_list = list()
+        with sql.UnitOfWork():  # One commit for all queued commands
+            for entry in self.cmp_command_list:
+                iid, command, size, src_to_trg, src_time, trg_time = entry
+                bytes_size = int(float(size) * 1000000) \
+                    if command.startswith("cp") else 0  # size is MB 3 decimals
+                mtime = src_time if src_to_trg else trg_time  # File copied
+                if not jobs.enqueue(self.fake_paths[int(iid)], command,
+                                    bytes_size, float(mtime)):
+                    continue  # Done before mserve closed last time
+                command_list.append(entry)
+                if command.startswith("cp"):
+                    all_sizes += float(size)  # Total size of all files copied
+        if jobs.skipped:
+            print(_who, "skipping commands done last session:", jobs.skipped)
+        self.cmp_command_list = command_list
         command_count = len(self.cmp_command_list)
-        for iid, command, size, src_to_trg, src_time, trg_time in \
-                self.cmp_command_list:
-            if command.startswith("cp"):
-                all_sizes += float(size)  # Total size of all files copied
 
         last_sel_iid = None  # Last row highlighted in green
         # All files common to both loca
@@ -5062,12 +5650,18 @@ filename.
 
             ''' 2. Run the copy or touch command '''
             start_time = time.time()
+            jobs.start(fake_path, start_time)
             if not self.run_one_command(command, size):
                 # self.cmp_return_code can be set to 2, 3, 4 or 5
+                if self.cmp_return_code != 0:
+                    jobs.finish(fake_path, False)
                 break  # Run one command failed
 
             ''' 3. Refresh progress bar '''
             run_count += 1
+            jobs.finish(fake_path, True, int(float(size) * 1000000)
+                        if command.startswith("cp") else 0)
+            self.job_progress(jobs)
             percent = float(100.0 * run_count / command_count)
             progress_var.set(percent)
             if command.startswith("cp"):
@@ -5114,6 +5708,11 @@ filename.
         if not self.cmp_top_is_active:
             return
 
+        ''' All commands ran? Next run starts with an empty queue '''
+        job_stats = self.job_progress(jobs, force=True)
+        if self.cmp_return_code == 0:
+            jobs.purge()
+
         ''' Remove last highlight and close ModTime instances '''
         toolkit.tv_tag_remove(self.cmp_tree, last_sel_iid, 'cmp_sel')
         self.src_mt.close()  # Save modification_time to disk
@@ -5169,8 +5768,14 @@ filename.
             text += "\nOther location is missing: " + '{:n}'.format(missing_count)
             text += " music files."
         text += "\n\nFile synchronization count: " + '{:n}'.format(run_count)
+        if jobs.skipped:
+            text += "\nDone before last shutdown: " + \
+                '{:n}'.format(jobs.skipped)
         if speed > 0:
             text += "\n\nCopy speed (MB/s): " + '{:n}'.format(speed)
+        if job_stats['files_per_sec']:
+            text += "\nFiles per second: " + \
+                '{:.2f}'.format(job_stats['files_per_sec'])
         text += "\n\nTotal time (D.HH:MM:SS): " + tmf.mm_ss(elapsed)
         self.out_cast_show_print(title, text, align="left")
 
@@ -5984,50 +6589,30 @@ filename.
                             use_tv=True, current_tree=False):
         """ Analyze Mean Volume and Maximum Volume for Old (Original) Title
             use_tv = False when analyzing one song not in treeview.
+            Oct. 18 2026 - ffmpeg runs in self.avo_pool when it is set.
+                avo_finish() saves results after ffmpeg ends.
         """
 
         _who = self.who + "avo_insert_tree_row():"
-        loc = self.act_code  # Just to get a shorter more meaningful var name
 
         ''' Get target path, size, access, modify time and SQL music ID '''
         trg_path, trg_size, trg_atime, trg_mtime, music_id, OsBase = \
             self.avo_trg_info(fake_path)
         if trg_path is None:  # Target location is missing file in source loc.
             return True  # Nothing inserted into treeview but, not an error
-
-        def insert_tv_row():
-            """ Shared inner-function to add treeview row """
-            try:
-                max_float = float(max_volume.split(" dB")[0])
-            except ValueError:
-                print(_who, "Maximum Volume is not a number:", max_volume)
-                print("for:", OsBase)
-                max_float = self.avo_select_max_lower - 50.0  # make it stick out
-
-            if self.avo_select_max_lower <= max_float <= self.avo_select_max_upper:
-                pass  # Need button to pick "Show All" or "Selected"
-
-            if not use_tv:  # Nothing to insert into treeview for 'Redo' single song
-                if current_tree:  # Update current tv item with new maximum vol.
-                    self.cmp_tree.set(iid, "Maximum", max_volume)
-                return  # Processing single song already in Treeview.
-
-            self.cmp_tree.insert(CurrAlbumId, "end", iid=iid, text=Title,
-                                 values=(mean_volume, max_volume, music_id),
-                                 tags=("Title",))
-            self.cmp_tree.see(iid)
-            self.cmp_top.update_idletasks()  # Allow close button to abort
-            self.cmp_found += 1
+        job = self.avo_job(CurrAlbumId, iid, Title, use_tv, current_tree,
+                           trg_path, trg_size, trg_atime, music_id, OsBase)
 
         ''' Skip files already analyzed? '''
         if self.avo_skip_complete:
             # Skip over completed files (new only).
-            d = sql.hist_get_music_var(music_id, 'volume', 'detect_old', loc)
+            d = self.avo_get_music_var(music_id, 'detect_old')
             if d:
                 mean_volume, max_volume = json.loads(d['Target'])
                 if max_volume != "N/A":
                     if d['Timestamp'] > trg_mtime:
-                        insert_tv_row()  # Show progress so far
+                        # Show progress so far
+                        self.avo_tv_row(job, mean_volume, max_volume, music_id)
                         self.avo_skip_count += 1
                         return True  # Skip this song file
                 elif use_tv:  # Redo normalization would have deleted history
@@ -6043,39 +6628,173 @@ filename.
         '''   B I G   T I C K E T   E V E N T   
 
               -  Run ffmpeg 'volumedetect' Filter  
-            Calls self.avo_run_ffmpeg() shared with avn_insert_tree_row()
+            Calls self.avo_ffmpeg_cmd() shared with avn_insert_tree_row()
         '''
-        start_ffmpeg = time.time()
-        mean_volume, max_volume = self.avo_run_ffmpeg(trg_path, trg_size)
-        end_ffmpeg = time.time()
+        cmd, wait = self.avo_ffmpeg_cmd(trg_path, trg_size)
+        return self.avo_submit(job, cmd, wait, self.avo_finish)
+
+    def avo_finish(self, job, ok):
+        """ ffmpeg 'volumedetect' ended for avo_insert_tree_row() job.
+            :param ok: False when ffmpeg failed or timed out
+        """
+        _who = self.who + "avo_finish():"
+        mean_volume, max_volume = self.avo_ffmpeg_results(ok)
         if not self.cmp_top_is_active:
             return False  # Closing down
 
         ''' ffmpeg changes Last Access Time - Set it back '''
-        self.avo_trg_reset(trg_path, trg_atime, _who)
+        self.avo_trg_reset(job['trg_path'], job['trg_atime'], _who)
 
         ''' Save ffmpeg results in SQL History Table. '''
+        music_id = job['music_id']
         if max_volume == "N/A":
-            d = sql.hist_get_music_var(music_id, "volume", "detect_old", loc)
+            d = self.avo_get_music_var(music_id, "detect_old")
             if d:
                 print(_who, "Not overwriting existing music volume:\n\t",
                       d['Target'], "with 'N/A'.")
-                print("for:", OsBase)
+                print("for:", job['OsBase'])
                 music_id = 0  # Don't overwrite previous value with "N/A"
         if not self.cmp_top_is_active:
             return False  # Closing down
 
         if music_id:
             sql.hist_add_music_var(
-                music_id, 'volume', 'detect_old', SourceMaster=loc,
+                music_id, 'volume', 'detect_old', SourceMaster=self.act_code,
                 SourceDetail='volumedetect', Comments=self.avo_comment,
-                Target=json.dumps([mean_volume, max_volume]), Size=trg_size,
-                Seconds=round(end_ffmpeg - start_ffmpeg, 4))
+                Target=json.dumps([mean_volume, max_volume]),
+                Size=job['trg_size'], Seconds=round(job['end'] - job['start'], 4))
 
         ''' Insert song into treeview '''
-        insert_tv_row()
+        self.avo_tv_row(job, mean_volume, max_volume, music_id)
         return self.cmp_top_is_active
 
+    def avo_tv_row(self, job, mean_volume, max_volume, music_id):
+        """ Add treeview row for avo_insert_tree_row() or avo_finish() """
+        _who = self.who + "avo_tv_row():"
+        try:
+            max_float = float(max_volume.split(" dB")[0])
+        except ValueError:
+            print(_who, "Maximum Volume is not a number:", max_volume)
+            print("for:", job['OsBase'])
+            max_float = self.avo_select_max_lower - 50.0  # make it stick out
+
+        if self.avo_select_max_lower <= max_float <= self.avo_select_max_upper:
+            pass  # Need button to pick "Show All" or "Selected"
+
+        if not job['use_tv']:  # Nothing to insert into treeview for 'Redo' single song
+            if job['current_tree']:  # Update current tv item with new maximum vol.
+                self.cmp_tree.set(job['iid'], "Maximum", max_volume)
+            return  # Processing single song already in Treeview.
+
+        self.avo_tv_insert(job, (mean_volume, max_volume, music_id))
+
+    @staticmethod
+    def avo_job(CurrAlbumId, iid, Title, use_tv, current_tree, trg_path,
+                trg_size, trg_atime, music_id, OsBase):
+        """ Job dictionary for avo_submit(), FfmpegPool() and ..._finish()
+
+            shared by avo_ / aln_ / uln_ and avn_ ... _insert_tree_row()
+
+            :param trg_path: Song file ffmpeg reads
+        """
+        return {"CurrAlbumId": CurrAlbumId, "iid": iid, "Title": Title,
+                "use_tv": use_tv, "current_tree": current_tree,
+                "trg_path": trg_path, "trg_size": trg_size,
+                "trg_atime": trg_atime, "music_id": music_id, "OsBase": OsBase}
+
+    def avo_submit(self, job, cmd, wait, finish):
+        """ Run ffmpeg command for job then call finish(job, ok).
+
+            When self.avo_pool is set by cmp_populate_tree(), the command is
+            queued for FfmpegPool() worker threads. FfmpegPool.run() calls
+            avo_job_done() in main thread as each command ends.
+
+            Otherwise (single song 'Redo') the command is run right now.
+        """
+        job['cmd'] = cmd
+        job['wait'] = wait
+        job['finish'] = finish
+        if self.avo_pool:
+            self.avo_pool.submit(job)  # cmp_populate_tree() queues in SQL
+            return self.cmp_top_is_active
+
+        job['start'] = time.time()
+        self.run_one_command(cmd, job['trg_size'], wait=wait, print_stats=False)
+        job['end'] = time.time()
+        return self.avo_job_done(job)
+
+    def avo_job_done(self, job):
+        """ ffmpeg command for job ended. Called in main thread.
+            Output captured by FfmpegPool() is written to self.TMP_STDERR so
+            avo_run_retry() and FileControl.get_metadata() work as before.
+        """
+        if job.get('cancelled'):
+            return False  # FfmpegPool.cancel() never ran command
+        if 'stderr' in job:
+            self.rm_file(self.TMP_STDOUT)
+            with open(self.TMP_STDERR, "w") as fh:
+                fh.write(job['stderr'])
+            self.cmp_return_code = 4 if job['timeout'] else 0
+
+        ok = self.avo_run_retry(job['cmd'], job['trg_size'], job['wait'],
+                                job['trg_path'])
+        if ok:
+            # Use mserve.py FileControl() class methods to parse ffmpeg results
+            self.trg_ctl.get_metadata(ffmpeg_results=self.TMP_STDERR,
+                                      trg_path=job['trg_path'])
+        if self.avo_jobs:  # Worker threads can't touch sqlite3
+            fake_path = self.fake_paths[int(job['iid'])]
+            self.avo_jobs.start(fake_path, job['start'])
+            self.avo_jobs.finish(fake_path, ok, job['trg_size'], job['end'])
+            self.job_progress(self.avo_jobs)
+        result = job['finish'](job, ok)
+
+        # Commit every FFMPEG_COMMIT_JOBS jobs or FFMPEG_COMMIT_SECS seconds
+        # so results reach disk while slow ffmpeg commands are running.
+        self.avo_commit_cnt += 1
+        if self.avo_commit_cnt >= FFMPEG_COMMIT_JOBS or \
+                time.time() - self.avo_commit_time >= FFMPEG_COMMIT_SECS:
+            sql.flush()
+            self.avo_commit_cnt, self.avo_commit_time = 0, time.time()
+        return result
+
+    def avo_tv_insert(self, job, values):
+        """ Insert song row under album in song order. FfmpegPool() jobs
+            end in any order. Song iid is index into self.fake_paths. """
+        children = self.cmp_tree.get_children(job['CurrAlbumId'])
+        ndx = len(children)
+        while ndx and int(children[ndx - 1]) > int(job['iid']):
+            ndx -= 1
+        self.cmp_tree.insert(job['CurrAlbumId'], ndx, iid=job['iid'],
+                             text=job['Title'], values=values, tags=("Title",))
+        self.cmp_tree.see(job['iid'])
+        self.cmp_top.update_idletasks()  # Allow close button to abort
+        self.cmp_found += 1
+
+    def avo_load_music_vars(self):
+        """ Read History rows for this location that current analysis step
+            checks. One query for each action instead of one for each song.
+            Each song is read before it is updated so rows can't go stale
+            while cmp_populate_tree() loop runs.
+        """
+        actions = {"detect_old": ("detect_old",),
+                   "loudnorm_1": ("detect_old", "loudnorm_1"),
+                   "loudnorm_2": ("loudnorm_1", "loudnorm_2"),
+                   "detect_new": ("loudnorm_2", "detect_old", "detect_new")}
+        self.avo_hist_vars = {}
+        for action in actions.get(self.state, ()):
+            self.avo_hist_vars[action] = sql.hist_get_music_vars(
+                None, "volume", action, self.act_code)
+
+    def avo_get_music_var(self, music_id, action):
+        """ sql.hist_get_music_var() for "volume" action at this location.
+            Uses rows loaded by avo_load_music_vars() when available. """
+        loaded = self.avo_hist_vars.get(action)
+        if loaded is None:
+            return sql.hist_get_music_var(music_id, "volume", action,
+                                          self.act_code)
+        return loaded.get(music_id)
+
     def avo_trg_info(self, fake_path, new=False):
         """ Get target path, size, access, modify time, music ID & Base filename
 
@@ -6137,8 +6856,8 @@ filename.
             print(cmd)
             print("\n" + result)
 
-    def avo_run_ffmpeg(self, trg_path, size):
-        """ Run ffmpeg command to get Maximum Volume
+    def avo_ffmpeg_cmd(self, trg_path, size):
+        """ ffmpeg command to get Maximum Volume and seconds to wait for it.
             Called by avo_insert_tree_row() and avn_insert_tree_row()
 
 One-liner to copy and paste into terminal:
@@ -6150,14 +6869,14 @@ One-liner to copy and paste into terminal:
 
         wait = size / 1000000 * 3  # Wait 3 seconds per megabyte before quiting
         wait = 3 if not wait else wait
+        return cmd, wait
 
-        self.run_one_command(cmd, size, wait=wait, print_stats=False)
-
-        if not self.avo_run_retry(cmd, size, wait, trg_path):
-            return "N/A", "N/A"  # If retry not necessary it returns True
-
-        # Use mserve.py FileControl() class methods to parse ffmpeg results
-        self.trg_ctl.get_metadata(ffmpeg_results=self.TMP_STDERR, trg_path=trg_path)
+    def avo_ffmpeg_results(self, ok):
+        """ Mean Volume and Maximum Volume parsed by avo_job_done()
+            Called by avo_finish() and avn_finish()
+        """
+        if not ok:
+            return "N/A", "N/A"  # ffmpeg failed after retry
 
         # Note FileControl() converts all lower-case key names to upper-case
         mean_volume = self.trg_ctl.metadata.get("MEAN_VOLUME", "N/A")
@@ -6165,7 +6884,7 @@ One-liner to copy and paste into terminal:
         return mean_volume, max_volume
 
     def avo_run_retry(self, cmd, size, wait, trg_path):
-        """ shared by avo_ / aln_ / uln_ and avn_ ... _run_ffmpeg()
+        """ shared by avo_ / aln_ / uln_ and avn_ ... _finish() via avo_job_done()
         :param cmd: ffmpeg formatted command
         :param size: trg_path file size
         :param wait: how long to wait for command to finish execution
@@ -6204,7 +6923,8 @@ One-liner to copy and paste into terminal:
 
     def aln_insert_tree_row(self, fake_path, CurrAlbumId, iid, Title,
                             use_tv=True, current_tree=False):
-        """ Get Song's 'loudnorm' levels for pass 1.  """
+        """ Get Song's 'loudnorm' levels for pass 1.
+            Oct. 18 2026 - aln_finish() saves results after ffmpeg ends. """
 
         _who = self.who + "aln_insert_tree_row():"
         loc = self.act_code  # Just to get a shorter more meaningful var name
@@ -6214,9 +6934,11 @@ One-liner to copy and paste into terminal:
             self.avo_trg_info(fake_path)
         if trg_path is None:  # Target location is missing file in source loc.
             return True  # Nothing inserted into treeview but, not an error
+        job = self.avo_job(CurrAlbumId, iid, Title, use_tv, current_tree,
+                           trg_path, trg_size, trg_atime, music_id, OsBase)
 
         ''' History record exists for previous step? '''
-        d = sql.hist_get_music_var(music_id, "volume", "detect_old", loc)
+        d = self.avo_get_music_var(music_id, "detect_old")
         if not d:
             # TODO: 2024-04-15 - new change to skip files < 1 MB.
             print(_who, "MISSING Maximum Volume for location:", loc)
@@ -6245,39 +6967,14 @@ One-liner to copy and paste into terminal:
         else:
             return True  # Skip this song file
 
-        def insert_tv_row():
-            """ Shared function to Insert song into treeview """
-
-            input_i = json_dict.get("input_i", "N/A")
-            input_tp = json_dict.get("input_tp", "N/A")
-            input_lra = json_dict.get("input_lra", "N/A")
-            input_thresh = json_dict.get("input_thresh", "N/A")
-
-            if not use_tv:
-                if current_tree:  # Update current tree with new input vars.
-                    self.cmp_tree.set(iid, "Integrated", input_i)
-                    self.cmp_tree.set(iid, "TruePeak", input_tp)
-                    self.cmp_tree.set(iid, "LRA", input_lra)
-                    self.cmp_tree.set(iid, "Threshold", input_thresh)
-                return  # Processing single song already in Treeview.
-
-            self.cmp_tree.insert(
-                CurrAlbumId, "end", iid=iid, text=Title, tags=("Title",),
-                values=(input_i, input_tp, input_lra, input_thresh, music_id)
-            )
-            
-            self.cmp_tree.see(iid)
-            self.cmp_top.update_idletasks()  # Allow close button to abort
-            self.cmp_found += 1
-
         ''' Skip files already analyzed? '''
         if self.avo_skip_complete:
             # Skip over completed files (new only).
-            d = sql.hist_get_music_var(music_id, "volume", "loudnorm_1", loc)
+            d = self.avo_get_music_var(music_id, "loudnorm_1")
             if d:
                 json_dict = json.loads(d['Target'])
                 if d['Timestamp'] > trg_mtime:
-                    insert_tv_row()  # Show progress so far
+                    self.aln_tv_row(job, json_dict, music_id)  # Show progress so far
                     self.avo_skip_count += 1
                     return True  # Skip this song file
 
@@ -6291,23 +6988,32 @@ One-liner to copy and paste into terminal:
         self.loudnorm_cmd = 'loudnorm=I=' + IN + ':TP=' + self.avo_true_peak
         self.loudnorm_cmd += ':LRA=' + self.avo_lra
 
-        start_ffmpeg = time.time()
-        json_dict = self.aln_run_ffmpeg(trg_path, trg_size)
-        end_ffmpeg = time.time()
+        job['comment'] = self.loudnorm_cmd
+        cmd, wait = self.aln_ffmpeg_cmd(trg_path, trg_size)
+        return self.avo_submit(job, cmd, wait, self.aln_finish)
+
+    def aln_finish(self, job, ok):
+        """ ffmpeg 'loudnorm' pass 1 ended for aln_insert_tree_row() job.
+            :param ok: False when ffmpeg failed or timed out
+        """
+        _who = self.who + "aln_finish():"
+        # Get FileControl() class metadata dictionary's json formatted dictionary
+        json_dict = self.trg_ctl.metadata.get('json_dict', {}) if ok else {}
 
         if not self.cmp_top_is_active:
             return False  # Closing down
 
         ''' ffmpeg changes Last Access Time - Set it back '''
-        self.avo_trg_reset(trg_path, trg_atime, _who)
+        self.avo_trg_reset(job['trg_path'], job['trg_atime'], _who)
 
         ''' Save 'loudnorm_1' values in SQL History Table. '''
+        music_id = job['music_id']
         if json_dict == {}:  # No metadata, dictionary empty
-            d = sql.hist_get_music_var(music_id, "volume", "loudnorm_1", loc)
+            d = self.avo_get_music_var(music_id, "loudnorm_1")
             if d:
                 print(_who, "Not overwriting existing 'loudnorm_1' Filter':\n\t",
                       d['Target'], "with empty dictionary.")
-                print("for:", OsBase)
+                print("for:", job['OsBase'])
             music_id = 0  # Don't populate with "N/A"
 
         if not self.cmp_top_is_active:
@@ -6324,13 +7030,13 @@ One-liner to copy and paste into terminal:
 
         if music_id:
             sql.hist_add_music_var(
-                music_id, 'volume', 'loudnorm_1', SourceMaster=loc,
-                SourceDetail='Analyze', Comments=self.loudnorm_cmd,
-                Target=json.dumps(json_dict), Size=trg_size,
-                Seconds=round(end_ffmpeg - start_ffmpeg, 4))
+                music_id, 'volume', 'loudnorm_1', SourceMaster=self.act_code,
+                SourceDetail='Analyze', Comments=job['comment'],
+                Target=json.dumps(json_dict), Size=job['trg_size'],
+                Seconds=round(job['end'] - job['start'], 4))
 
         ''' Insert song into treeview '''
-        insert_tv_row()
+        self.aln_tv_row(job, json_dict, music_id)
         # json_dict key/values also available in regular metadata dictionary
         _input_i = self.trg_ctl.metadata.get("INPUT_I", "N/A")
         _input_tp = self.trg_ctl.metadata.get("INPUT_TP", "N/A")
@@ -6342,8 +7048,29 @@ One-liner to copy and paste into terminal:
 
         return self.cmp_top_is_active
 
-    def aln_run_ffmpeg(self, trg_path, size):
-        """ Analyze 'loudnorm' Filter. Return dictionary of results:
+    def aln_tv_row(self, job, json_dict, music_id):
+        """ Add treeview row for aln_insert_tree_row() or aln_finish() """
+
+        input_i = json_dict.get("input_i", "N/A")
+        input_tp = json_dict.get("input_tp", "N/A")
+        input_lra = json_dict.get("input_lra", "N/A")
+        input_thresh = json_dict.get("input_thresh", "N/A")
+
+        if not job['use_tv']:
+            if job['current_tree']:  # Update current tree with new input vars.
+                iid = job['iid']
+                self.cmp_tree.set(iid, "Integrated", input_i)
+                self.cmp_tree.set(iid, "TruePeak", input_tp)
+                self.cmp_tree.set(iid, "LRA", input_lra)
+                self.cmp_tree.set(iid, "Threshold", input_thresh)
+            return  # Processing single song already in Treeview.
+
+        self.avo_tv_insert(
+            job, (input_i, input_tp, input_lra, input_thresh, music_id))
+
+    def aln_ffmpeg_cmd(self, trg_path, size):
+        """ ffmpeg command to analyze 'loudnorm' Filter and seconds to wait.
+            aln_finish() gets dictionary of results:
 
 One-liner to copy and paste into terminal:
 ffmpeg -i ~/Music/"Jim Steinman/Bad for Good/06 Surf’s Up.oga" -af loudnorm=I=-23:TP=0.0:print_format=json -f null -
@@ -6389,13 +7116,8 @@ ffmpeg -i "$1" -loglevel panic -af loudnorm=I=-16:TP=-1.5:LRA=11:measured_I=$int
 
         wait = size / 1000000 * 8  # Wait 8 seconds per megabyte before quiting
         wait = 8 if not wait else wait
-        self.run_one_command(cmd, size, wait=wait, print_stats=False)
-
-        if not self.avo_run_retry(cmd, size, wait, trg_path):
-            return {}  # If retry not necessary it returns True
+        return cmd, wait
 
-        # Populate FileControl() class metadata dictionary
-        self.trg_ctl.get_metadata(ffmpeg_results=self.TMP_STDERR, trg_path=trg_path)
         """ Parse json formatted 'loudnorm' pass 1 values in output file:
             {
                 "input_i" : "-11.95",
@@ -6411,23 +7133,22 @@ ffmpeg -i "$1" -loglevel panic -af loudnorm=I=-16:TP=-1.5:LRA=11:measured_I=$int
             }
         """
 
-        # Get FileControl() class metadata dictionary's json formatted dictionary
-        return self.trg_ctl.metadata.get('json_dict', {})
-
     def uln_insert_tree_row(self, fake_path, CurrAlbumId, iid, Title,
                             use_tv=True, current_tree=False):
-        """ Normalize Song's Loudness using 'loudnorm' Filter pass 2 """
+        """ Normalize Song's Loudness using 'loudnorm' Filter pass 2
+            Oct. 18 2026 - uln_finish() saves results after ffmpeg ends. """
         _who = self.who + "uln_insert_tree_row():"
-        loc = self.act_code  # Just to get a shorter more meaningful var name
 
         ''' Get target path, size, access, modify time and SQL music ID '''
         trg_path, trg_size, trg_atime, trg_mtime, music_id, OsBase = \
             self.avo_trg_info(fake_path)
         if trg_path is None:  # Target location is missing file in source loc.
             return True  # Nothing inserted into treeview but, not an error
+        job = self.avo_job(CurrAlbumId, iid, Title, use_tv, current_tree,
+                           trg_path, trg_size, trg_atime, music_id, OsBase)
 
         ''' History record exists for previous step? '''
-        d = sql.hist_get_music_var(music_id, "volume", "loudnorm_1", loc)
+        d = self.avo_get_music_var(music_id, "loudnorm_1")
         if not d:
             # Most songs would not have 'loudnorm_1' pass 1 values
             return True  # Skip this song file
@@ -6452,38 +7173,14 @@ ffmpeg -i "$1" -loglevel panic -af loudnorm=I=-16:TP=-1.5:LRA=11:measured_I=$int
             print("for:", OsBase)
             return True  # Skip this song file
 
-        def insert_tv_row():
-            """ Shared function to Insert song into treeview """
-
-            output_i = json_dict.get("output_i", "N/A")
-            output_tp = json_dict.get("output_tp", "N/A")
-            output_lra = json_dict.get("output_lra", "N/A")
-            output_thresh = json_dict.get("output_thresh", "N/A")
-
-            if not use_tv:
-                if current_tree:  # Update current tree with new output vars.
-                    self.cmp_tree.set(iid, "Integrated", output_i)
-                    self.cmp_tree.set(iid, "TruePeak", output_tp)
-                    self.cmp_tree.set(iid, "LRA", output_lra)
-                    self.cmp_tree.set(iid, "Threshold", output_thresh)
-                return  # Processing single song already in Treeview.
-
-            self.cmp_tree.insert(
-                CurrAlbumId, "end", iid=iid, text=Title, tags=("Title",),
-                values=(output_i, output_tp, output_lra, output_thresh, music_id)
-            )
-            self.cmp_tree.see(iid)
-            self.cmp_top.update_idletasks()  # Allow close button to abort
-            self.cmp_found += 1
-
         ''' Skip files already updated? '''
         if self.avo_skip_complete:
-            d = sql.hist_get_music_var(music_id, "volume", "loudnorm_2", loc)
+            d = self.avo_get_music_var(music_id, "loudnorm_2")
             if d:
                 json_dict = json.loads(d['Target'])
                 # TODO: Check for .new file and .bak file
                 if d and d['Timestamp'] > trg_mtime:
-                    insert_tv_row()  # Show progress so far
+                    self.uln_tv_row(job, json_dict, music_id)  # Show progress so far
                     self.avo_skip_count += 1
                     return True  # Skip this song file
 
@@ -6541,15 +7238,25 @@ ffmpeg -i "$1" -loglevel panic -af loudnorm=I=-16:TP=-1.5:LRA=11:measured_I=$int
 
               -  Run ffmpeg 'loudnorm' (Pass 2)  
         '''
-        start_ffmpeg = time.time()
-        json_dict = self.uln_run_ffmpeg(trg_path, trg_size, cmd)
-        end_ffmpeg = time.time()
+        job['ar'] = ar
+        job['comment'] = comment
+        return self.avo_submit(job, cmd, self.uln_ffmpeg_wait(trg_size),
+                               self.uln_finish)
+
+    def uln_finish(self, job, ok):
+        """ ffmpeg 'loudnorm' pass 2 ended for uln_insert_tree_row() job.
+            :param ok: False when ffmpeg failed or timed out
+        """
+        _who = self.who + "uln_finish():"
+        # Populate FileControl() class metadata dictionary & return json_dict
+        json_dict = self.trg_ctl.metadata.get('json_dict', {}) if ok else {}
+        trg_path = job['trg_path']
 
         if not self.cmp_top_is_active:
             return False  # Closing down
 
         ''' ffmpeg changes Last Access Time - Set it back '''
-        date_str = datetime.datetime.fromtimestamp(trg_atime) \
+        date_str = datetime.datetime.fromtimestamp(job['trg_atime']) \
             .strftime('%Y-%m-%d %H:%M:%S')
         cmd = 'touch -a -c -d"' + date_str + '" "' + trg_path + '"'
         result = os.popen(cmd).read().strip()
@@ -6565,7 +7272,7 @@ ffmpeg -i "$1" -loglevel panic -af loudnorm=I=-16:TP=-1.5:LRA=11:measured_I=$int
         OsBase = OsBase[1:] if OsBase.startswith(os.sep) else OsBase
         music_id = sql.music_id_for_song(OsBase)
         if json_dict == {}:  # No metadata, dictionary empty
-            d = sql.hist_get_music_var(music_id, "volume", "loudnorm_2", loc)
+            d = self.avo_get_music_var(music_id, "loudnorm_2")
             if d:
                 print(_who, "Not overwriting existing 'loudnorm' Filter':\n\t",
                       d['Target'], "with empty dictionary.")
@@ -6576,20 +7283,40 @@ ffmpeg -i "$1" -loglevel panic -af loudnorm=I=-16:TP=-1.5:LRA=11:measured_I=$int
             return False  # Closing down
 
         # Audio Rate may have been reduced for ffmpeg codec limitations
-        json_dict["ar"] = ar  # m4a 192k -> 96k, mp3 192k -> 44.1k
+        json_dict["ar"] = job['ar']  # m4a 192k -> 96k, mp3 192k -> 44.1k
 
         if music_id:
             # 2024-06-30 - SourceDetail was 'Analyze' but 'Create' a better fit
             sql.hist_add_music_var(
-                music_id, 'volume', 'loudnorm_2', SourceMaster=loc,
-                SourceDetail='Create', Comments=comment,
-                Target=json.dumps(json_dict), Size=trg_size,
-                Seconds=round(end_ffmpeg - start_ffmpeg, 4))
+                music_id, 'volume', 'loudnorm_2', SourceMaster=self.act_code,
+                SourceDetail='Create', Comments=job['comment'],
+                Target=json.dumps(json_dict), Size=job['trg_size'],
+                Seconds=round(job['end'] - job['start'], 4))
 
         ''' Insert song into treeview '''
-        insert_tv_row()
+        self.uln_tv_row(job, json_dict, music_id)
         return self.cmp_top_is_active
 
+    def uln_tv_row(self, job, json_dict, music_id):
+        """ Add treeview row for uln_insert_tree_row() or uln_finish() """
+
+        output_i = json_dict.get("output_i", "N/A")
+        output_tp = json_dict.get("output_tp", "N/A")
+        output_lra = json_dict.get("output_lra", "N/A")
+        output_thresh = json_dict.get("output_thresh", "N/A")
+
+        if not job['use_tv']:
+            if job['current_tree']:  # Update current tree with new output vars.
+                iid = job['iid']
+                self.cmp_tree.set(iid, "Integrated", output_i)
+                self.cmp_tree.set(iid, "TruePeak", output_tp)
+                self.cmp_tree.set(iid, "LRA", output_lra)
+                self.cmp_tree.set(iid, "Threshold", output_thresh)
+            return  # Processing single song already in Treeview.
+
+        self.avo_tv_insert(
+            job, (output_i, output_tp, output_lra, output_thresh, music_id))
+
     def uln_build_comment(self, IN):
         """ Called from uln_insert_tree_row() above and from
             mserve.py chron_apply_filter()
@@ -6598,8 +7325,10 @@ ffmpeg -i "$1" -loglevel panic -af loudnorm=I=-16:TP=-1.5:LRA=11:measured_I=$int
         self.loudnorm_cmd += ':LRA=' + self.avo_lra
         return self.loudnorm_cmd + ":linear=" + self.avo_linear
 
-    def uln_run_ffmpeg(self, trg_path, size, cmd):
-        """ Analyze 'loudnorm' Filter. Return dictionary of results:
+    @staticmethod
+    def uln_ffmpeg_wait(size):
+        """ Seconds to wait for 'loudnorm' Filter. uln_finish() gets
+            dictionary of results:
 
 One-liner to copy and paste into terminal:
 ffmpeg -i ~/Music/"Jim Steinman/Bad for Good/06 Surf’s Up.oga" -af loudnorm=I=-23:TP=0.0:print_format=json -f null -
@@ -6637,25 +7366,15 @@ ffmpeg -i "$1" -loglevel panic -af loudnorm=I=-16:TP=-1.5
         """
 
         wait = size / 1000000 * 8  # Wait 8 seconds per megabyte before quiting
-        wait = 8 if not wait else wait
-        self.run_one_command(cmd, size, wait=wait, print_stats=False)
-
-        if not self.avo_run_retry(cmd, size, wait, trg_path):
-            return {}  # If retry not necessary it returns True
-
-        # Populate FileControl() class metadata dictionary & return json_dict
-        self.trg_ctl.get_metadata(ffmpeg_results=self.TMP_STDERR, trg_path=trg_path)
-        return self.trg_ctl.metadata.get('json_dict', {})
+        return 8 if not wait else wait
 
     def avn_insert_tree_row(self, fake_path, CurrAlbumId, iid, Title,
                             use_tv=True, current_tree=False):
         """ Analyze Mean Volume and Maximum Volume for New (Normalized) Song 
-            Calls self.avo_run_ffmpeg() shared with avo_insert_tree_row()
+            Calls self.avo_ffmpeg_cmd() shared with avo_insert_tree_row()
+            Oct. 18 2026 - avn_finish() saves results after ffmpeg ends.
         """
 
-        _who = self.who + "avn_insert_tree_row():"
-        loc = self.act_code  # Just to get a shorter more meaningful var name
-
         ''' Get target path, size, access, modify time and SQL music ID '''
         trg_path, trg_size, trg_atime, trg_mtime, music_id, OsBase = \
             self.avo_trg_info(fake_path)  # Do NOT use 'new', we need music_id
@@ -6663,13 +7382,13 @@ ffmpeg -i "$1" -loglevel panic -af loudnorm=I=-16:TP=-1.5
             return True  # Nothing inserted into treeview but, not an error
 
         ''' History record exists for previous step? '''
-        d = sql.hist_get_music_var(music_id, "volume", "loudnorm_2", loc)
+        d = self.avo_get_music_var(music_id, "loudnorm_2")
         if not d:
             # Most songs would not have 'loudnorm_2' pass 2 values
             return True  # Skip this song file
 
         ''' History record for original maximum volume? '''
-        d = sql.hist_get_music_var(music_id, "volume", "detect_old", loc)
+        d = self.avo_get_music_var(music_id, "detect_old")
         if not d:
             # Need error message - history record should exist
             return True  # Skip this song file
@@ -6684,74 +7403,80 @@ ffmpeg -i "$1" -loglevel panic -af loudnorm=I=-16:TP=-1.5
         if trg_path is None:  # Target location is missing file in source loc.
             return True  # Nothing inserted into treeview but, not an error
         trg_path_new = trg_path + ".new"
-
-        ''' Insert song into treeview '''
-        def insert_tv_row():
-            """ Shared inner-function to add treeview row """
-
-            if not use_tv:  # Nothing to insert into treeview for single song.
-                if current_tree:  # Update current tv item with new maximum vol.
-                    self.cmp_tree.set(iid, "Maximum", max_volume)
-                    self.set_missed_target(iid, old_max_volume, max_volume)
-                return  # Processing single song already in Treeview.
-
-            self.cmp_tree.insert(CurrAlbumId, "end", iid=iid, text=Title,
-                                 values=(old_max_volume, max_volume, music_id),
-                                 tags=("Title",))
-            self.set_missed_target(iid, old_max_volume, max_volume)
-            self.cmp_tree.see(iid)
-            self.cmp_top.update_idletasks()  # Allow close button to abort
-            self.cmp_found += 1
+        job = self.avo_job(CurrAlbumId, iid, Title, use_tv, current_tree,
+                           trg_path_new, trg_size, trg_atime, music_id, OsBase)
+        job['old_max_volume'] = old_max_volume
 
         ''' Skip files already analyzed? '''
         if self.avo_skip_complete:
             # Skip over completed files (new only).
-            d = sql.hist_get_music_var(music_id, 'volume', 'detect_new', loc)
+            d = self.avo_get_music_var(music_id, 'detect_new')
             if d:
                 mean_volume, max_volume = json.loads(d['Target'])
                 # Songs with 'N/A' before, will be analyzed again.
                 if max_volume != "N/A":
                     if d['Timestamp'] > trg_mtime:
-                        insert_tv_row()  # Show progress so far
+                        # Show progress so far
+                        self.avn_tv_row(job, max_volume, music_id)
                         self.avo_skip_count += 1
                         return True  # Skip this song file
 
         '''   B I G   T I C K E T   E V E N T   
 
               -  Run ffmpeg 'volumedetect' Filter  
-            Calls self.avo_run_ffmpeg() shared with avo_insert_tree_row()
+            Calls self.avo_ffmpeg_cmd() shared with avo_insert_tree_row()
         '''
-        start_ffmpeg = time.time()
-        mean_volume, max_volume = self.avo_run_ffmpeg(trg_path_new, trg_size)
-        end_ffmpeg = time.time()
+        cmd, wait = self.avo_ffmpeg_cmd(trg_path_new, trg_size)
+        return self.avo_submit(job, cmd, wait, self.avn_finish)
+
+    def avn_finish(self, job, ok):
+        """ ffmpeg 'volumedetect' ended for avn_insert_tree_row() job.
+            :param ok: False when ffmpeg failed or timed out
+        """
+        _who = self.who + "avn_finish():"
+        mean_volume, max_volume = self.avo_ffmpeg_results(ok)
         if not self.cmp_top_is_active:
             return False  # Closing down
 
         ''' ffmpeg changes Last Access Time - Set it back '''
-        self.avo_trg_reset(trg_path_new, trg_atime, _who)
+        self.avo_trg_reset(job['trg_path'], job['trg_atime'], _who)
 
         ''' Save ffmpeg results in SQL History Table. '''
+        music_id = job['music_id']
         if max_volume == "N/A":
-            d = sql.hist_get_music_var(music_id, "volume", "detect_new", loc)
+            d = self.avo_get_music_var(music_id, "detect_new")
             if d:
                 print(_who, "Not overwriting existing music volume:\n\t",
                       d['Target'], "with 'N/A'.")
-                print("for:", OsBase)
+                print("for:", job['OsBase'])
             music_id = 0  # Don't populate with "N/A"
         if not self.cmp_top_is_active:
             return False  # Closing down
 
         if music_id:
             sql.hist_add_music_var(
-                music_id, 'volume', 'detect_new', SourceMaster=loc,
+                music_id, 'volume', 'detect_new', SourceMaster=self.act_code,
                 SourceDetail='volumedetect', Comments=self.avo_comment,
-                Target=json.dumps([mean_volume, max_volume]), Size=trg_size,
-                Seconds=round(end_ffmpeg - start_ffmpeg, 4))
+                Target=json.dumps([mean_volume, max_volume]),
+                Size=job['trg_size'], Seconds=round(job['end'] - job['start'], 4))
 
         ''' Insert song into treeview '''
-        insert_tv_row()
+        self.avn_tv_row(job, max_volume, music_id)
         return self.cmp_top_is_active
 
+    def avn_tv_row(self, job, max_volume, music_id):
+        """ Add treeview row for avn_insert_tree_row() or avn_finish() """
+        iid = job['iid']
+        old_max_volume = job['old_max_volume']
+        if not job['use_tv']:  # Nothing to insert into treeview for single song.
+            if job['current_tree']:  # Update current tv item with new maximum vol.
+                self.cmp_tree.set(iid, "Maximum", max_volume)
+                self.set_missed_target(iid, old_max_volume, max_volume)
+            return  # Processing single song already in Treeview.
+
+        self.avo_tv_insert(job, (old_max_volume, max_volume, music_id))
+        self.set_missed_target(iid, old_max_volume, max_volume)
+
     def set_missed_target(self, iid, old_max_volume, max_volume):
         """ Missed target or volume level worse than before? """
         # split
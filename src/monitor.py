@@ -24,6 +24,7 @@ from __future__ import with_statement  # Error handling for file opens
 #       Oct. 09 2024 - check_window_geom(...) to force windows visibility
 #       Dec. 08 2024 - Suppress GObject future warnings originating from sql.py
 #       Jun. 08 2025 - Deprecate center(), get_monitors() & get_tk_window_mon...
+#       Oct. 18 2026 - get/save_window_geom() use sql.get_config() cache
 #
 # ==============================================================================
 
@@ -1565,18 +1566,11 @@ def get_window_geom(name):
         default_geom = '+%d+%d' % (xy[0], xy[1])
 
     ''' Override defaults when window was previously saved. '''
-    if sql.hist_check(0, 'window', name):
-        sql.hist_cursor.execute("SELECT * FROM History WHERE Id = ?",
-                                [sql.HISTORY_ID])
-        d = dict(sql.hist_cursor.fetchone())
-        if d is None:
-            # If we get here there is programmer error
-            print('monitor.get_window_geom(): No History ID:', sql.HISTORY_ID)
-            return default_geom
-        else:
-            # new_geom intention for windows off desktop but gnome seems to fix?
-            #new_geom = check_window_geom(d['SourceMaster'])
-            return d['SourceMaster']  # Geometry (Coordinates, width & height)
+    d = sql.get_config('window', name)  # Oct. 18 2026 - From sql.config_cache
+    if d is not None:
+        # new_geom intention for windows off desktop but gnome seems to fix?
+        #new_geom = check_window_geom(d['SourceMaster'])
+        return d['SourceMaster']  # Geometry (Coordinates, width & height)
     else:
         # First time.
         return default_geom
@@ -1650,19 +1644,13 @@ def save_window_geom(name, geom):
         of "width x height + x + y" with no spaces in between variables.
     """
 
-    if sql.hist_check(0, 'window', name):
-        sql.hist_cursor.execute("SELECT * FROM History WHERE Id = ?",
-                                [sql.HISTORY_ID])
-        d = dict(sql.hist_cursor.fetchone())
-        if d is None:
-            print('monitor.save_window_geom error no History ID:', sql.HISTORY_ID)
-            return False
-    else:
+    d = sql.get_config('window', name)  # Oct. 18 2026 - From sql.config_cache
+    if d is None:
         # First time add the record
         sql.hist_add(time.time(), 0, g.USER, 'window', name, geom,
                      'saved on exit, loaded on starting', None, 0, 0, 0.0,
                      "Used in conjunction with 'screen' History Record Id #")
-        sql.con.commit()
+        sql.commit()
         return True
 
     ''' We have the existing history record, simply replace the geometry field 
@@ -1671,11 +1659,14 @@ def save_window_geom(name, geom):
     # 2024-03-24 sql.py in bserve doesn't have Timestamp column
     if "bserve" in sql.FNAME_LIBRARY:
         sql_cmd = "UPDATE History SET SourceMaster=? WHERE Id = ?"
-        sql.hist_cursor.execute(sql_cmd, (geom, sql.HISTORY_ID))
+        sql.hist_cursor.execute(sql_cmd, (geom, d['Id']))
+        sql.config_cache.update(d['Id'], SourceMaster=geom)
     else:
+        now = time.time()
         sql_cmd = "UPDATE History SET Timestamp=?, SourceMaster=? WHERE Id = ?"
-        sql.hist_cursor.execute(sql_cmd, (time.time(), geom, sql.HISTORY_ID))
-    sql.con.commit()
+        sql.hist_cursor.execute(sql_cmd, (now, geom, d['Id']))
+        sql.config_cache.update(d['Id'], Timestamp=now, SourceMaster=geom)
+    sql.commit()
 
 
 def get_mouse_location(coord_only=True):
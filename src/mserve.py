@@ -108,6 +108,22 @@ warnings.simplefilter('default')  # in future Python versions.
 #       Mar. 30 2025 - Delete 200 lines of deprecated functions.
 #       June 14 2025 - get_running_apps() supports parameters from ps -ef.
 #       Dec. 25 2025 - Bug where "parameters" variable reused. Make "app_parm".
+#       Oct. 18 2026 - make_sorted_list() only lists directories that changed.
+#       Oct. 18 2026 - FileControl.get_metadata() uses mutagen before ffprobe.
+#       Oct. 18 2026 - FileControl.get_metadata() uses sql.meta_cache first.
+#       Oct. 18 2026 - VU meters read vu_meter.py shared memory ring buffer.
+#       Oct. 18 2026 - VU meter LEDs created once per resize, then toggled.
+#       Oct. 18 2026 - play_spin_art() cycles frames from img.SpinArtCache().
+#       Oct. 18 2026 - FileControl.get_artwork() uses on-disk ArtworkCache().
+#       Oct. 18 2026 - SQL Music and History views fetch pages on scroll.
+#       Oct. 18 2026 - Bulk SQL updates use sql.UnitOfWork() to batch commits.
+#       Oct. 18 2026 - History summary and debug counts use sql HistoryTally.
+#       Oct. 18 2026 - Window, resume and playlist config from sql.config_cache.
+#       Oct. 18 2026 - SQL Music text search uses sql.music_search() index.
+#       Oct. 18 2026 - LibCatalog() arrays for lib_tree totals and filters.
+#       Oct. 18 2026 - Large locations defer lib_tree Albums & Songs.
+#       Oct. 18 2026 - play_prefetch() readies next song before song ends.
+#       Oct. 18 2026 - play_to_end() TkScheduler timers instead of busy loop.
 #
 # ==============================================================================
 
@@ -471,12 +487,14 @@ except NameError:  # name 'reload' is not defined
 import shutil
 import json  # List and Dictionary storage to SQL column, Pickle or text file
 import glob  # For globbing files in /tmp/mserve_ffprobe*
+import base64  # Ogg METADATA_BLOCK_PICTURE artwork is base64 encoded
+import hashlib  # ArtworkCache() key for song path, size and modify time
 import time
 import datetime
 import re
 import copy
 import traceback  # To display call stack (functions that got us here)
-import locale  # Use decimals or commas for float remainder?
+import locale  # Use decimals or commas for float remainder? Thousands , or .
 import webbrowser
 import requests  # retrieve YouTube thumbnail images
 from io import BytesIO  # convert YouTube thumbnail images to TK image format
@@ -490,7 +508,6 @@ critical_function_lock = Lock()
 
 import pickle
 from random import shuffle
-import locale  # To set thousands separator as , or .
 
 locale.setlocale(locale.LC_ALL, '')  # Use '' for auto locale selecting
 
@@ -510,7 +527,8 @@ from selenium.common.exceptions import WebDriverException
 from selenium.common.exceptions import TimeoutException
 
 # Dist-packages copied underneath .../mserve/ directory
-import mutagen  # Get easy tags instead of ffprobe - testing stage
+import mutagen  # In-process metadata for FileControl(). ffprobe is fallback
+from mutagen.flac import Picture  # Ogg METADATA_BLOCK_PICTURE artwork
 
 # Pippim modules
 import global_variables as g
@@ -551,6 +569,9 @@ CFG_DIVISOR_UOM = "MB"      # Unit of Measure becomes Megabyte
 # Global variables
 RESTART_SLEEP = .3  # Delay for mserve close down - No longer used
 KEEP_AWAKE_MS = 250  # Milliseconds between time checks loc_keep_awake()
+LIB_TREE_LAZY_SONGS = 10000  # More songs, defer lib_tree Albums. 0 = never
+LIB_TREE_BATCH_SONGS = 500  # Deferred songs inserted per idle batch
+LIB_TREE_IDLE_MS = 50  # Milliseconds between idle batches
 META_DISPLAY_ROWS = 15  # Number of Metadata Rows displayed in frame
 SCROLL_WIDTH = 14  # Scroll bar width, July 3, 2023 used to be 12
 MON_FONTSIZE = 12  # Font size for monitor name
@@ -568,6 +589,7 @@ SONG_LABEL_STR = "song"  # For bolding metadata variable in play_top
 
 # Temporary directory work filenames
 TMP_CURR_SONG = g.TEMP_DIR + "mserve_song_playing"
+TMP_NEXT_SONG = g.TEMP_DIR + "mserve_song_next"  # play_prefetch() ffplay
 TMP_CURR_SAMPLE = g.TEMP_DIR + "mserve_song_sampling"
 TMP_CURR_SYNC = g.TEMP_DIR + "mserve_song_syncing"
 TMP_CURR_SONG_LOUD = g.TEMP_DIR + "mserve_song_playing_loud"
@@ -577,10 +599,51 @@ TMP_MBZ_GET1 = g.TEMP_DIR + "mserve_mbz_get1"
 TMP_MBZ_GET2 = g.TEMP_DIR + "mserve_mbz_get2"
 TMP_PRINT_FILE = g.TEMP_DIR + "mserve_print_file"  # _a5sd87 appended
 
+''' FileControl.get_artwork() keeps extracted and resized artwork in
+    ~/.local/share/mserve/L999/artwork/ so ffmpeg runs once per song. '''
+ARTWORK_CACHE = True  # Set to False to always run ffmpeg
+ARTWORK_CACHE_MB = 50  # Least recently used files removed over this size
+
+''' FileControl.get_metadata() reads tags, duration and streams in-process
+    using mutagen. Formats not listed fall back to ffprobe subprocess.
+    Mutagen names are converted to ffprobe names so self.metadata{} has the
+    same keys no matter which backend was used. '''
+METADATA_BACKEND = "mutagen"  # Set to "ffprobe" to always use subprocess
+METADATA_BENCH_SONGS = 20  # Tools menu benchmark_metadata() song limit
+MUTAGEN_FORMATS = {  # mutagen class name: ffprobe "Input #0, " format
+    "MP3": "mp3", "EasyMP3": "mp3", "MP4": "mov,mp4,m4a,3gp,3g2,mj2",
+    "EasyMP4": "mov,mp4,m4a,3gp,3g2,mj2", "OggVorbis": "ogg",
+    "OggOpus": "ogg", "OggFLAC": "ogg", "OggSpeex": "ogg", "FLAC": "flac",
+    "WAVE": "wav", "AIFF": "aiff"}
+MUTAGEN_CODECS = {  # mutagen class name: ffprobe "Audio: " codec
+    "MP3": "mp3", "EasyMP3": "mp3", "OggVorbis": "vorbis", "OggOpus": "opus",
+    "OggFLAC": "flac", "OggSpeex": "speex", "FLAC": "flac",
+    "AIFF": "pcm_s16be"}  # MP4 uses info.codec, WAVE uses bits_per_sample
+MUTAGEN_KEYS = {  # ID3 frame, MP4 atom or Vorbis comment: ffprobe key
+    "TIT2": "TITLE", "TPE1": "ARTIST", "TALB": "ALBUM",
+    "TPE2": "ALBUM_ARTIST", "TRCK": "TRACK", "TPOS": "DISC", "TDRC": "DATE",
+    "TYER": "DATE", "TCON": "GENRE", "TCOM": "COMPOSER", "COMM": "COMMENT",
+    "TSSE": "ENCODER", "TCMP": "COMPILATION", "TCOP": "COPYRIGHT",
+    "TENC": "ENCODED_BY", "TPUB": "PUBLISHER", "TLAN": "LANGUAGE",
+    "TIT1": "GROUPING", "TPE3": "PERFORMER", "TDEN": "CREATION_TIME",
+    "\xa9nam": "TITLE", "\xa9ART": "ARTIST", "\xa9alb": "ALBUM",
+    "aART": "ALBUM_ARTIST", "trkn": "TRACK", "disk": "DISC",
+    "\xa9day": "DATE", "\xa9gen": "GENRE", "gnre": "GENRE",
+    "\xa9wrt": "COMPOSER", "\xa9cmt": "COMMENT", "\xa9too": "ENCODER",
+    "cpil": "COMPILATION", "pgap": "GAPLESS_PLAYBACK", "cprt": "COPYRIGHT",
+    "catg": "CATEGORY", "keyw": "KEYWORDS", "\xa9grp": "GROUPING",
+    "desc": "DESCRIPTION", "tmpo": "BPM", "\xa9lyr": "LYRICS",
+    "TRACKNUMBER": "TRACK", "DISCNUMBER": "DISC",
+    "ALBUMARTIST": "ALBUM_ARTIST", "DESCRIPTION": "COMMENT"}
+MUTAGEN_SKIP = ("APIC", "PCNT", "POPM", "PRIV", "GEOB", "MCDI", "UFID",
+                "USLT", "SYLT", "covr", "METADATA_BLOCK_PICTURE", "COVERART",
+                "COVERARTMIME")  # Artwork becomes Video stream, rest unused
+
 ''' Volume Meter IPC filenames. Repeat change in vu_meter.py, homa.py & toolkit.py '''
 AMPLITUDE_MONO_FNAME = g.TEMP_DIR + "mserve_vu-meter-mono.txt"  # Mono output
 AMPLITUDE_LEFT_FNAME = g.TEMP_DIR + "mserve_vu-meter-left.txt"  # Stereo Left
 AMPLITUDE_RIGHT_FNAME = g.TEMP_DIR + "mserve_vu-meter-right.txt"  # Stereo Right
+AMPLITUDE_RING_FNAME = g.TEMP_DIR + "mserve_vu-meter-ring.bin"  # Shared memory
 
 ''' Webscraping lyrics - three files '''
 LYRICS_SCRAPE = g.TEMP_DIR + "mserve_scrape_*"
@@ -590,8 +653,9 @@ LYRICS_SCRAPE = g.TEMP_DIR + "mserve_scrape_*"
 TMP_ALL_NAMES = [TMP_CURR_SONG, TMP_CURR_SAMPLE, TMP_CURR_SYNC, TMP_FFPROBE + "*",
                  TMP_FFMPEG + "*", TMP_PRINT_FILE + "*", AMPLITUDE_MONO_FNAME,
                  AMPLITUDE_LEFT_FNAME, AMPLITUDE_RIGHT_FNAME, LYRICS_SCRAPE,
+                 AMPLITUDE_RING_FNAME,
                  lc.FNAME_TEST, lc.TMP_STDOUT + "*", lc.TMP_STDERR + "*",
-                 lc.TMP_FTP_RETRIEVE + "*", TMP_CURR_SONG_LOUD]
+                 lc.TMP_FTP_RETRIEVE + "*", TMP_CURR_SONG_LOUD, TMP_NEXT_SONG]
 
 # More names added later after lcs is initialized.
 
@@ -702,6 +766,8 @@ ATIME_THRESHOLD = 80  # playing 80% of song updates last access to now.
 # Number of seconds to Rewind or Fast Forward a song. Must be string
 REW_FF_SECS = "10"
 REW_CUTOFF = 12  # If current less than cutoff, play previous song
+PREFETCH_SECS = 10.0  # Seconds before song ends play_prefetch() readies next
+PREFETCH_SPAWN = True  # Start next song's ffplay muted to read song ahead
 
 PRUNED_COUNT = 0  # sys arg topdir = 0, artist = 1, album = 2
 # for a few seconds & system freezes once. It was compiz 'place' window bug.
@@ -731,6 +797,78 @@ SLEEP_PAUSED = 16  # ms refresh - play_top open but music paused
 SLEEP_PLAYING = 16  # ms refresh - play_top is playing music
 SLEEP_NO_PLAY = 16  # ms refresh - refresh_lib_top() running
 
+# Oct. 18, 2026 - play_to_end() waits while toolkit.TkScheduler() runs each
+#   subsystem with its own .after() timer. Artwork and VU meters keep the
+#   SLEEP_PLAYING speed, everything else slows down to what it needs.
+PLAY_SCHEDULER = True  # False = old play_to_end_loop() calling refresh
+PLAY_RATES = OrderedDict([  # Subsystem: (rate ms, budget ms)
+    ('exit', (100, 2)),  # pidfd wakes at once. Also Next, Prev and Close
+    ('fades', (SLEEP_PLAYING, 2)),  # pav.poll_fades()
+    ('tips', (33, 3)),  # self.tt.poll_tips()
+    ('controls', (250, 5)),  # Previous/Restart button, hockey countdown
+    ('progress', (50, 2)),  # "mm:ss.d of: mm:ss" and current_song_secs
+    ('art', (SLEEP_PLAYING, 8)),  # Rotates 1/2 degree each call
+    ('vu', (SLEEP_PLAYING, 4)),  # LED VU meters
+    ('lyrics', (100, 8)),  # Lyrics scroll and highlight
+    ('prefetch', (250, 100))])  # play_prefetch() reads metadata & artwork
+
+
+def make_work_path(subdir, f, start_dir):
+    """ Build fake path for song in SORTED_LIST.
+        Insert '/<No Artist>' and or '/<No Album>' subdirectory names when
+        song is sitting at Top Directory or Artist directory level.
+
+    :returns work_level, work_path: Depth 0, 1 or 2 and fake path
+    """
+    work_level = os.path.join(subdir, f).count(os.sep) - start_dir.count(os.sep)
+    work_f = f
+    if work_level == 0:
+        # song sitting at Artist directory level
+        work_f = g.NO_ARTIST_STR + os.sep + g.NO_ALBUM_STR + os.sep + work_f
+    if work_level == 1:
+        # song sitting at Album directory level
+        work_f = g.NO_ALBUM_STR + os.sep + work_f
+
+    # Build full path name from root directory
+    return work_level, os.path.join(subdir, work_f)
+
+
+def sorted_list_key(work_path):
+    """ Insert space in front of every / so Artist sorts before Artist 2 """
+    return work_path.replace(os.sep, " " + os.sep)
+
+
+def merge_sorted_list(sorted_list, depth_count, removed, start_dir):
+    """ Remove songs deleted since last session from last session's sorted
+        list from lc.DirSnapshot() instead of rebuilding it from every
+        directory. Songs added are passed through make_sorted_list() loop
+        so they get the same idle, legal name, depth and music file checks.
+
+        Returned list has fake ' /' inserted and is still sorted. New songs
+        appended by make_sorted_list() are merged by sort in one pass.
+
+    :param sorted_list: make_sorted_list() results last session
+    :param depth_count: Count of songs at topdir, artist, album last session
+    :param removed: Full paths of files removed since last session
+    :param start_dir: Location's Top Directory
+    :returns work_list, depth_count: Sorted list without removed songs
+    """
+    depth_count = list(depth_count)
+    gone = {}  # {work_path: work_level} Removed files, music or not
+    for full_path in removed:
+        subdir, f = os.path.split(full_path)
+        work_level, work_path = make_work_path(subdir, f, start_dir)
+        gone[work_path] = work_level
+
+    work_list = []
+    for work_path in sorted_list:
+        if work_path in gone:
+            depth_count[gone[work_path]] -= 1  # Only songs that were counted
+        else:
+            work_list.append(sorted_list_key(work_path))
+
+    return work_list, depth_count
+
 
 def make_sorted_list(start_dir, toplevel=None, idle=None, check_only=False):
     """ Build list of songs on storage device beginning at 'start_dir'
@@ -742,15 +880,14 @@ def make_sorted_list(start_dir, toplevel=None, idle=None, check_only=False):
         When check_only just ensure /Artist/Album/ levels have at least
         ten songs.
 
+        Oct 18/26 - Saved locations use lc.DirSnapshot() in ".../mserve/L999/
+            dir_snapshot". Only directories whose mtime changed are listed and
+            songs added or removed are merged into last session's sorted list.
+
         TODO:
             for lcs.open_host don't walk directory tree, because it takes
             over a minute for 3,800 songs using FTP over Wifi.
 
-            Inside location directory is ".../mserve/L999/last_sorted_list
-            Open file and use it to build skeleton sorted list without
-            last access times. Last play time still appears and applies for
-            all locations.   
-
             send info.fact() message and begin long running update with
             FTP list files one directory at a time with callback for each
             file/directory instigating play top or lib top refresh.
@@ -797,6 +934,7 @@ def make_sorted_list(start_dir, toplevel=None, idle=None, check_only=False):
     #   https://stackoverflow.com/questions/643694/
     #   what-is-the-difference-between-utf-8-and-unicode
     # print(who + "lcs.open_ftp:", lcs.open_ftp)
+    snap = None  # lc.DirSnapshot() when walking last session's snapshot
     if lcs.open_ftp:
         # print("mserve.py make_sorted_list() This is an FTP host")
         orig_list = ext.read_from_json(lc.FNAME_WALK_LIST)
@@ -804,16 +942,31 @@ def make_sorted_list(start_dir, toplevel=None, idle=None, check_only=False):
         for lin in orig_list:
             sfx, subdirs, files = lin
             walk_list.append((os.path.join(lcs.open_topdir, sfx), subdirs, files))
-    else:
+    elif check_only or NEW_LOCATION or not lc.LAST_LOCATION_SET:
         # Sep 5/23 - convert os.walk() to list in prep for using fake_paths_sizes
         walk_list = list(os.walk(start_dir, topdown=True))
+    else:
+        # Oct 18/26 - Only directories with new mtime are listed again
+        snap = lc.DirSnapshot(start_dir)
+        walk_list = snap.walk(update=dtb.update, workers=lcs.get_walk_workers())
+
+    if snap and snap.sorted_list is not None and snap.depth_count is not None:
+        ''' Merge songs added and removed since last session into sorted list.
+            Loop below checks songs added the same as a full walk. '''
+        work_list, depth_count = merge_sorted_list(
+            snap.sorted_list, snap.depth_count, snap.removed, start_dir)
+        added = {}  # {subdir: [files added]}
+        for full_path in snap.added:
+            subdir, f = os.path.split(full_path)
+            added.setdefault(subdir, []).append(f)
+        walk_list = [(subdir, [], files) for subdir, files in added.items()]
 
     for subdir, dirs, files in walk_list:
         ''' subdir + files[i] = full path.  dirs are ignored '''
 
         curr_depth = subdir.count(os.sep) - start_dir.count(os.sep)
         ''' Limit search to files in 2 levels (/Artist/Album) '''
-        if curr_depth == 2:
+        if curr_depth >= 2:  # Snapshot songs added may be deeper
             # Sanity check - delete directories below TopDir/Artist/Album/
             del dirs[:]
             continue
@@ -862,9 +1015,10 @@ def make_sorted_list(start_dir, toplevel=None, idle=None, check_only=False):
                 continue  # Not a music file
 
             # If FTP used don't waste time checking curlftpfs for ".isfile"
-            if lcs.open_ftp or os.path.isfile(full_path):
+            # Snapshot listing already separated files from directories
+            if lcs.open_ftp or snap or os.path.isfile(full_path):
                 # Count song occurrences at this level
-                work_level = full_path.count(os.sep) - start_dir.count(os.sep)
+                work_level, work_path = make_work_path(subdir, f, start_dir)
                 depth_count[work_level] += 1
 
                 ''' Were 100 files checked without success? '''
@@ -876,31 +1030,15 @@ def make_sorted_list(start_dir, toplevel=None, idle=None, check_only=False):
                 if check_only and depth_count[2] > 10:
                     return work_list, depth_count  # song paths & file counts
 
-                # Insert missing Artists and Albums directories into work_f
-                work_f = f
-                if NEW_LOCATION:
-                    # print('WIP work_f, work_level:', work_f, work_level)
-                    pass
-                if work_level == 0:
-                    # song sitting at Artist directory level
-                    work_f = g.NO_ARTIST_STR + os.sep + g.NO_ALBUM_STR \
-                             + os.sep + work_f
-                    #print("work_f:", work_f, subdir)
-                if work_level == 1:
-                    # song sitting at Album directory level
-                    work_f = g.NO_ALBUM_STR + os.sep + work_f
-                    #print("work_f:", work_f, subdir)
-
-                # Build full path name from root directory
-                work_path = os.path.join(subdir, work_f)
-
-                # Insert space in front of every / for proper sorting                   
-                work_path = work_path.replace(os.sep, " " + os.sep)
-                work_list.append(work_path)
+                # Insert space in front of every / for proper sorting
+                work_list.append(sorted_list_key(work_path))
 
     # Sort work list with fake ' /' inserted. Then normalize back to '/'
+    # After merge_sorted_list() this is one pass over two sorted runs
     work_list.sort()
     work_list = [w.replace(" " + os.sep, os.sep) for w in work_list]
+    if snap:
+        snap.save(work_list, depth_count)  # Before pruning <No Artist>/<No Album>
     dtb.close()
     # print('make_sorted_list idle loop count:', idle_loops)
 
@@ -972,12 +1110,17 @@ class MusicLocTreeCommonSelf:
         self.saved_DurationSecs = None  # FileControl().DurationSecs
         self.saved_DurationMin = None  # Duration in Min:Sec.Deci
         self.song_set_ndx_just_run = None  # Song manually set, don't use 'Next'
+        self.prefetch_stage = None  # play_prefetch() 'metadata' ... 'ready'
+        self.prefetch_path = None  # Full path of next song prefetched
+        self.prefetch_key = None  # SQL Music OsFileName of next song
+        self.prefetch_lyrics = None  # (key, score, time_list) for next song
         self.last_started = None  # self.ndx catch fast clicking Next
         self.play_opened_artist = None  # Play expanded artist in Library?
         self.play_opened_album = None  # Play expanded album in Library?
 
         # Below called with "python vu_meter.py stereo 2>/dev/null"
         self.vu_meter_pid = None  # Linux Process ID for vu_meter.py
+        self.vu_meter_ring = None  # toolkit.VuMeterRing() shared memory reader
         self.play_top_title = None  # Playlist: Xxx Xxx - mserve
         self.play_frm = None  # play_top master frame
         self.lyrics_on_right_side = True  # False = lyrics frame on bottom
@@ -996,6 +1139,8 @@ class MusicLocTreeCommonSelf:
         self.play_rotated_art = None  # Image.new(
         self.play_rotated_value = None  # Rotate art up to -365
         self.play_shifted_art = None  # Shift art with play_art_fade2()
+        self.spin_cache = img.SpinArtCache()  # Rotated, slide & fade frames
+        self.metadata_bench = None  # Last metadata_benchmark() results
         self.play_art_slide_count = None  # = 0 and
         self.play_art_fade_count = None  # = 0:
         self.step = None  # Number fade/slide steps taken
@@ -1073,6 +1218,10 @@ class MusicLocTreeCommonSelf:
         self.VU_HIST_SIZE = None  # History of six db levels
         self.vu_meter_left_hist = None  # Left & Right channel histories
         self.vu_meter_right_hist = None  # can be zero on race condition
+        self.vu_meter_leds = {}  # {canvas: dict} see play_vu_meter_build()
+        self.vu_meter_frame_cnt = 0  # play_vu_meter() calls timed
+        self.vu_meter_frame_secs = 0.0  # Total seconds in play_vu_meter()
+        self.vu_meter_frame_max = 0.0  # Longest play_vu_meter() call
 
         # Play frame # 3 (misleading frame number) - column 4
         self.lyrics_master_frm = None  # tk.Frame(self.play_frm child)
@@ -1175,6 +1324,7 @@ class MusicLocTreeCommonSelf:
 
         ''' File Control instances w/file metadata and methods for song play '''
         self.play_ctl = None  # instance of FileControl() class for playing songs
+        self.next_ctl = None  # play_prefetch() next song metadata & spawn
         self.loud_ctl = None  # Loudness Normalization - side by side w/play_ctl
         self.pav_ctl = None  # Pulse Audio volume control set to play or loud 
         self.ltp_ctl = None  # Music Location Tree right click to play song
@@ -1314,6 +1464,9 @@ class MusicLocTreeCommonSelf:
 
         ''' last_sleep_time for mor accurate 30 frames per second (fps) '''
         self.last_sleep_time = time.time()
+        self.play_sched = None  # toolkit.TkScheduler() built by play_to_end()
+        self.play_end_var = None  # play_to_end() waits for "ended", etc.
+        self.play_exit_watcher = None  # ext.ExitWatcher() for play_ctl.pid
 
         ''' self.lib_btn_frm needed for splash_msg '''
         self.lib_btn_frm = None  # Button Frame: Play, Refresh, Rip, Help & Close
@@ -1408,10 +1561,12 @@ class MusicLocationTree(MusicLocTreeCommonSelf):
 
         ''' CheckboxTreeview List Box, Columns and Headings '''
         self.lib_tree = \
-            CheckboxTreeview(frame2, show=('tree', 'headings'), selectmode='none',
-                             columns=("Access", "Size", "Selected", "StatTime",
-                                      "StatSize", "Count", "Seconds",
-                                      "SelSize", "SelCount", "SelSeconds"))
+            LibTreeview(frame2, show=('tree', 'headings'), selectmode='none',
+                        columns=("Access", "Size", "Selected", "StatTime",
+                                 "StatSize", "Count", "Seconds",
+                                 "SelSize", "SelCount", "SelSeconds"))
+        self.lib_tree.materialize_callback = self.lib_tree_materialized
+        self.lib_tree_idle_job = None  # Inserting deferred Albums & Songs
         # indices 3 (StatTime) to 9 (SelSeconds) are hidden.
         self.lib_tree.column("#0", width=630, stretch=tk.YES)  # 0='text' column
         self.lib_tree.heading(
@@ -1487,6 +1642,9 @@ class MusicLocationTree(MusicLocTreeCommonSelf):
         self.play_ctl = FileControl(self.lib_top, self.info,
                                     close_callback=self.close_lib_tree_song,
                                     get_thread=self.get_refresh_thread)
+        # Next song prepared by play_prefetch(). Never touches access time.
+        self.next_ctl = FileControl(self.lib_top, self.info,
+                                    get_thread=self.get_refresh_thread)
         # Loudness Normalization new maximum volume File Control.
         # Play two songs simultaneously - '.mp4' and '.mp4.new' extensions
         self.loud_ctl = FileControl(self.lib_top, self.info,
@@ -1509,6 +1667,7 @@ class MusicLocationTree(MusicLocTreeCommonSelf):
         #                           Play    Space  Size  Secs  sCount
         self.lib_top_totals[0] = str(lcs.open_name)
         self.lib_top_totals[1] = ""  # Playlist name makes title too long
+        self.lib_cat = LibCatalog()  # Song sizes, seconds & selections arrays
         self.lib_top_playlist_name = ""  # appended to lib_top.title after totals
 
         ''' Music Location Dropdown Menu references Playlists() and InfoCentre() '''
@@ -2014,7 +2173,7 @@ class MusicLocationTree(MusicLocTreeCommonSelf):
             music_id_list = [mus_id]
             self.delete_from_memory(music_id_list)
             self.write_playlist_to_disk(show_info=False)
-            sql.con.commit()
+            sql.commit()
 
             self.populate_chron_tree()
             # Reset checkboxes and totals
@@ -2052,49 +2211,53 @@ class MusicLocationTree(MusicLocTreeCommonSelf):
             music_id_list = []
             size_deltas = []  # (music_id, old_size, new_size)
             # process all filtered songs in attached list
+            # Files are renamed one song at a time. Commit each song's SQL
+            # changes with its renames so a crash leaves at most one song
+            # out of step with its files.
             for chron_iid in self.chron_attached:
-                mus_id = self.chron_tree.item(chron_iid)['values'][2]
-                music_id_list.append(mus_id)  # SQL MusicId to remove from playlist
-                music_dict = sql.music_get_row(mus_id)
-                if music_dict is None:
-                    print(this_who)
-                    print("  Invalid MusicId:", mus_id)
-                    continue
+                with sql.UnitOfWork():  # One commit per song
+                    mus_id = self.chron_tree.item(chron_iid)['values'][2]
+                    music_id_list.append(mus_id)  # SQL MusicId to remove from playlist
+                    music_dict = sql.music_get_row(mus_id)
+                    if music_dict is None:
+                        print(this_who)
+                        print("  Invalid MusicId:", mus_id)
+                        continue
 
-                # Setup new self.play_ctl.path & self.loud_ctl.path
-                org_path = PRUNED_DIR + music_dict['OsFileName']
-                dtb.update(org_path)  # Update delayed text box with filename
-                try:
-                    os.rename(org_path, org_path + u'.old')
-                except OSError as err:
-                    print(this_who, "Rename Error:")
-                    print("  From:", org_path)
-                    print("  To  :", org_path + u'.old')
-                    print(err)
+                    # Setup new self.play_ctl.path & self.loud_ctl.path
+                    org_path = PRUNED_DIR + music_dict['OsFileName']
+                    dtb.update(org_path)  # Update delayed text box with filename
+                    try:
+                        os.rename(org_path, org_path + u'.old')
+                    except OSError as err:
+                        print(this_who, "Rename Error:")
+                        print("  From:", org_path)
+                        print("  To  :", org_path + u'.old')
+                        print(err)
 
-                try:
-                    os.rename(org_path + u'.new', org_path)
-                except OSError as err:
-                    print(this_who, "Rename Error:")
-                    print("  From:", org_path + u'.new')
-                    print("  To  :", org_path)
-                    print(err)
-
-                # Update SQL metadata with new file size and times
-                new_dict = sql.music_update_stat(music_dict['OsFileName'], org_path)
-                if new_dict is None:
-                    print(this_who)
-                    print("  ERROR MusicId:", mus_id,
-                          "sql.music_update_stat(music_dict['OsFileName'] FAILED!")
-                    continue
+                    try:
+                        os.rename(org_path + u'.new', org_path)
+                    except OSError as err:
+                        print(this_who, "Rename Error:")
+                        print("  From:", org_path + u'.new')
+                        print("  To  :", org_path)
+                        print(err)
 
-                # Append tuple to old and new sizes list
-                size_deltas.append(  # MusicId, lib_tree_iid, old size, new size
-                    (mus_id, self.saved_selections[int(chron_iid) - 1],
-                     music_dict['OsFileSize'], new_dict['OsFileSize']))
+                    # Update SQL metadata with new file size and times
+                    new_dict = sql.music_update_stat(music_dict['OsFileName'], org_path)
+                    if new_dict is None:
+                        print(this_who)
+                        print("  ERROR MusicId:", mus_id,
+                              "sql.music_update_stat(music_dict['OsFileName'] FAILED!")
+                        continue
+
+                    # Append tuple to old and new sizes list
+                    size_deltas.append(  # MusicId, lib_tree_iid, old size, new size
+                        (mus_id, self.saved_selections[int(chron_iid) - 1],
+                         music_dict['OsFileSize'], new_dict['OsFileSize']))
 
-                # Remove SQL History loudness normalization 'volume' records
-                remove_normalize(prompt=False, mus_id=mus_id)
+                    # Remove SQL History loudness normalization 'volume' records
+                    remove_normalize(prompt=False, mus_id=mus_id)
 
             self.delete_from_memory(music_id_list)
             self.write_playlist_to_disk(show_info=False)
@@ -2102,7 +2265,7 @@ class MusicLocationTree(MusicLocTreeCommonSelf):
             # Update size_deltas to all playlists
             self.update_playlist_sizes(size_deltas)
 
-            sql.con.commit()  # Write changes to disk
+            sql.commit()  # Write changes to disk
 
             # Remove from chronology tree & reset filtered lists to none
             self.populate_chron_tree()
@@ -2153,7 +2316,7 @@ class MusicLocationTree(MusicLocTreeCommonSelf):
             self.update_playlist_sizes(size_deltas)
 
             self.write_playlist_to_disk(show_info=False)
-            sql.con.commit()
+            sql.commit()
 
             # Remove from chronology tree & filtered lists
             song_iid = str(self.ndx + 1)
@@ -2374,6 +2537,8 @@ class MusicLocationTree(MusicLocTreeCommonSelf):
 
         self.tools_menu.add_command(label="Debug Information", font=g.FONT,
                                     underline=0, command=self.show_debug)
+        self.tools_menu.add_command(label="Benchmark Metadata", font=g.FONT,
+                                    underline=0, command=self.metadata_benchmark)
 
         self.tools_menu.add_cascade(label="Volume", font=g.FONT, underline=0,
                                     menu=self.volume_menu)
@@ -3291,9 +3456,19 @@ class MusicLocationTree(MusicLocTreeCommonSelf):
         # Update new size in lib_tree. Parent responsible for calling:
         #   self.set_all_checks_and_opened()
         for i, size_tuple in enumerate(size_deltas):
-            _music_id, _lib_tree_iid, _old_size, _new_size = size_tuple
-            # Wrong technique. self.saved_selections has lib_tree_iid in
-            # playlist order
+            _music_id, lib_tree_iid, _old_size, new_size = size_tuple
+            self.lib_cat.set_size(lib_tree_iid, new_size)
+            converted = float(new_size) / float(g.CFG_DIVISOR_AMT)
+            self.lib_tree.set(lib_tree_iid, "Size", '{:n}'.format(
+                round(converted, g.CFG_DECIMAL_PLACES)))
+            self.lib_tree.set(lib_tree_iid, "StatSize", new_size)
+
+        # Oct. 18 2026 - Artist, Album and title bar sizes from self.lib_cat
+        for iid, adj_list in self.lib_cat.parent_totals().items():
+            if iid in self.lib_tree.pending_owner:
+                continue  # Deferred Album. lib_tree_materialized() sets it
+            self.tree_col_range_replace(iid, 5, adj_list)
+        self.lib_top_totals[5:8] = self.lib_cat.totals()
 
     def pending_reset(self, ShowInfo=True):
         """ Pending Music Location Tree checkboxes have been processed. """
@@ -3325,7 +3500,9 @@ class MusicLocationTree(MusicLocTreeCommonSelf):
         """ Add Artist, Album and Song to treeview listbox.
             Set tags "Artist", "Album" or "Title".
             Initialize artists expanded and albums collapsed.
-            Songs are NOT selected(checked). Checkboxes set LATER. """
+            Songs are NOT selected(checked). Checkboxes set LATER.
+            Oct. 18 2026 - Large locations only insert Artists. Albums and
+                Songs are deferred to self.lib_tree.materialize(). """
 
         who = "mserve.py populate_lib_tree() - "
         LastArtist = ""
@@ -3338,6 +3515,12 @@ class MusicLocationTree(MusicLocTreeCommonSelf):
         global PRUNED_COUNT
         # print(who + 'PRUNED_COUNT:', PRUNED_COUNT)
         start_dir_sep = start_dir_sep - PRUNED_COUNT
+        self.lib_cat = LibCatalog(len(self.fake_paths))  # Song iid is str(i)
+        artist_ndx = album_ndx = -1
+        lazy = LIB_TREE_LAZY_SONGS and len(self.fake_paths) > LIB_TREE_LAZY_SONGS
+        if self.lib_tree_idle_job:
+            self.lib_top.after_cancel(self.lib_tree_idle_job)
+            self.lib_tree_idle_job = None
 
         for i, os_name in enumerate(self.fake_paths):
 
@@ -3365,9 +3548,18 @@ class MusicLocationTree(MusicLocTreeCommonSelf):
                 self.lib_tree.tag_bind(
                     CurrArtistId, '<Motion>', self.lib_highlight_row
                 )
+                artist_ndx = self.lib_cat.add_artist(CurrArtistId)
                 LastArtist = Artist
                 LastAlbum = ""  # Force subtotal break for Album
 
+            if Album != LastAlbum and lazy:
+                level_count[1] += 1  # Increment album count
+                # Treeview generated iids are "I001", "I00A", etc. No "_"
+                CurrAlbumId = "I_" + str(level_count[1])
+                self.lib_tree.defer_album(CurrArtistId, CurrAlbumId, Album)
+                album_ndx = self.lib_cat.add_album(CurrAlbumId, artist_ndx)
+                LastAlbum = Album
+
             if Album != LastAlbum:
                 level_count[1] += 1  # Increment album count
                 opened = False  # New installation would be more concise view for user
@@ -3383,6 +3575,7 @@ class MusicLocationTree(MusicLocTreeCommonSelf):
                 self.lib_tree.tag_bind(
                     CurrAlbumId, '<Motion>', self.lib_highlight_row
                 )
+                album_ndx = self.lib_cat.add_album(CurrAlbumId, artist_ndx)
                 LastAlbum = Album
 
             ''' Build full song path from song_list[] '''
@@ -3441,9 +3634,9 @@ class MusicLocationTree(MusicLocTreeCommonSelf):
                     print(" " + full_path)
                 continue  # Causes error because in sorted_list
 
-            self.tree_col_range_add(CurrAlbumId, 5, [size, 1, seconds])
-            self.tree_col_range_add(CurrArtistId, 5, [size, 1, seconds])
-            self.tree_title_range_add(5, [size, 1, seconds])  # update title bar
+            # Album, Artist and title bar totals added up after loop
+            self.lib_cat.add_song(i, album_ndx, size, seconds, play_time,
+                                  d['Id'] if d else 0)
             converted = float(size) / float(g.CFG_DIVISOR_AMT)
             fsize = '{:n}'.format(round(converted, g.CFG_DECIMAL_PLACES))
 
@@ -3451,13 +3644,72 @@ class MusicLocationTree(MusicLocTreeCommonSelf):
             ftime = tmf.ago(float(play_time), seconds=True)
 
             ''' Insert song title in format: "99 title.ext" '''
+            values = (ftime, fsize, '', play_time, size, 1, seconds, 0, 0, 0)
+            if lazy:
+                self.lib_tree.defer_song(CurrArtistId, str(i), Song, values)
+                continue
             self.lib_tree.insert(
                 CurrAlbumId, "end", iid=str(i), text=Song, tags=("Title", "unchecked"),
-                values=(ftime, fsize, '', play_time, size, 1, seconds, 0, 0, 0))
+                values=values)
             self.lib_tree.tag_bind(str(i), '<Motion>', self.lib_highlight_row)
 
+        ''' Artist and Album StatSize, Count and Seconds from catalog.
+            Deferred Albums get theirs from lib_tree_materialized(). '''
+        for iid, adj_list in self.lib_cat.parent_totals().items():
+            if iid in self.lib_tree.pending_owner:
+                continue  # set() would insert Artist's Albums right now
+            self.tree_col_range_replace(iid, 5, adj_list)
+        self.lib_top_totals[5:8] = self.lib_cat.totals()  # Title bar totals
         self.display_lib_title(splash_msg=False)
         # Splash message displayed when set_all_checks_and_opened() is called.
+        if self.lib_tree.pending:
+            self.lib_tree_idle_job = self.lib_top.after(
+                LIB_TREE_IDLE_MS, self.lib_tree_idle_batch)
+
+    def lib_tree_idle_batch(self):
+        """ Insert deferred Albums and Songs a batch at a time so lib_top
+            stays responsive. Expanded Artists are inserted right away by
+            LibTreeview.open_pending(). """
+        self.lib_tree_idle_job = None
+        count = 0
+        try:
+            while self.lib_tree.pending and count < LIB_TREE_BATCH_SONGS:
+                count += self.lib_tree.materialize(next(iter(self.lib_tree.pending)))
+        except tk.TclError:
+            return  # lib_top closed
+        if self.lib_tree.pending:
+            self.lib_tree_idle_job = self.lib_top.after(
+                LIB_TREE_IDLE_MS, self.lib_tree_idle_batch)
+
+    def lib_tree_materialized(self, artist):
+        """ Deferred Albums and Songs were just inserted under Artist.
+            Apply totals, "song_sel", checkboxes and open states that
+            set_all_checks_and_opened() kept in self.lib_cat. """
+        cat = self.lib_cat
+        digits = len(str(len(self.playlist_paths)))
+        for Album in self.lib_tree.get_children(artist):
+            self.lib_tree.tag_bind(Album, '<Motion>', self.lib_highlight_row)
+            self.tree_col_range_replace(Album, 5, cat.totals(Album))
+            self.tree_col_range_replace(Album, 8, cat.totals(Album, selected=True),
+                                        tagsel='album_sel')
+            self.apply_open_state(artist, Album, self.lib_tree_open_states)
+            for Song in self.lib_tree.get_children(Album):
+                self.lib_tree.tag_bind(Song, '<Motion>', self.lib_highlight_row)
+                if not cat.selected[int(Song)]:
+                    continue
+                number = int(cat.number[int(Song)])
+                tags = self.lib_tree.item(Song)['tags']
+                tags.append("song_sel")
+                self.lib_tree.item(Song, tags=tags)
+                self.lib_tree.set(Song, "Selected", play_padded_number(
+                    str(number), digits) if number else "Adding")
+                self.lib_tree.change_state(Song, "checked")
+                self.tree_col_range_replace(Song, 8, cat.totals(Song, True))
+            for Song in self.lib_tree.get_children(Album):
+                if "song_sel" in self.lib_tree.item(Song)['tags']:
+                    # noinspection PyProtectedMember
+                    self.lib_tree._check_ancestor(Song)  # in CheckboxTreeview()
+                    break  # Only one Song has to be tested
 
     @staticmethod
     def key_press(event):
@@ -3521,9 +3773,7 @@ Call search.py when these control keys occur
         """
         # 0=PlayTime, 1=Size MB, 2=Selected Str, 3=Time, 4=StatSize,
         # 5=Count, 6=Seconds, 7=SelSize, 8=SelCount, 9=SelSeconds
-        # Set slice to StatSize, Count, Seconds
-        total_values = slice(4, 7)  # start at index, stop before index
-        # select_values = slice(7, 10)  # start at index, stop before index
+        # Oct. 18 2026 - Totals from self.lib_cat, not treeview values
 
         tags = self.lib_tree.item(song)['tags']
         if "song_sel" in tags:
@@ -3537,10 +3787,7 @@ Call search.py when these control keys occur
             self.lib_tree.item(song, tags=tags)
             # noinspection PyProtectedMember
             self.lib_tree._uncheck_ancestor(song)  # in CheckboxTreeview()
-            # Get StatSize, Count and Seconds multiplying by negative 1
-            adj_list = [element * -1 for element in
-                        self.lib_tree.item(song)['values'][total_values]]
-            # [total_values] = slice(4,7)
+            self.lib_cat.select(song, False)
         else:
             # Toggle on and add to selected parent totals
             tags.append("song_sel")
@@ -3550,19 +3797,23 @@ Call search.py when these control keys occur
                     song_number, len(str(len(self.saved_selections))))
             except ValueError:
                 # print('mserve.py toggle_select(): song not found iid:', song)
+                song_number = 0
                 number_str = "Adding"  # Number will be assigned when inserted
 
             self.lib_tree.set(song, "Selected", number_str)
             self.lib_tree.item(song, tags=tags)
             # noinspection PyProtectedMember
             self.lib_tree._check_ancestor(song)  # in CheckboxTreeview()
-            # Get StatSize, Count and Seconds
-            adj_list = self.lib_tree.item(song)['values'][total_values]  # 1 past
-
-        self.tree_col_range_add(song, 8, adj_list)  # Column number passed
-        self.tree_col_range_add(album, 8, adj_list, tagsel='album_sel')
-        self.tree_col_range_add(artist, 8, adj_list, tagsel='artist_sel')
-        self.tree_title_range_add(8, adj_list)  # Pass start index
+            self.lib_cat.select(song, True, song_number)
+
+        # Selected StatSize, Count and Seconds from self.lib_cat arrays
+        cat = self.lib_cat
+        self.tree_col_range_replace(song, 8, cat.totals(song, selected=True))
+        self.tree_col_range_replace(album, 8, cat.totals(album, selected=True),
+                                    tagsel='album_sel')
+        self.tree_col_range_replace(artist, 8, cat.totals(artist, selected=True),
+                                    tagsel='artist_sel')
+        self.lib_top_totals[8:11] = cat.totals(selected=True)
         self.display_lib_title()  # Format sizes and selected in title bar
 
     def tree_col_range_replace(self, iid, numb, init_list, tagsel=None):
@@ -3594,16 +3845,15 @@ Call search.py when these control keys occur
         tags = self.lib_tree.item(iid)['tags']
 
         # Update last played column with number of songs selected
-        # set with no argument performs a get
-        song_count = self.lib_tree.set(iid, "Count")
-        selected_count = self.lib_tree.set(iid, "SelCount")
+        # Oct. 18 2026 - Totals from self.lib_cat, not treeview values
+        size, song_count, _seconds = self.lib_cat.totals(iid)
+        sel_size, selected_count, _seconds = self.lib_cat.totals(iid, True)
 
         # Human readable size. eg 12345678 becomes 12 MB
-        size = self.lib_tree.set(iid, "StatSize")
         converted = float(size) / float(g.CFG_DIVISOR_AMT)
         all_sizes = '{:n}'.format(round(converted, g.CFG_DECIMAL_PLACES))
         # all_sizes of 1824.5 but should be 1,824.5
-        size = self.lib_tree.set(iid, "SelSize")
+        size = sel_size
         converted = float(size) / float(g.CFG_DIVISOR_AMT)
         all_selected = '{:n}'.format(round(converted, g.CFG_DECIMAL_PLACES))
 
@@ -4530,6 +4780,7 @@ Call search.py when these control keys occur
                              old_name, old_path, "Rename FAILED. Target exists.",
                              duplicate_count, 0, 0.0, legal_string)
                 continue
+            sql.music_search_update(music_id=music_id)  # New Artist/Album/Title
 
             ''' os.renames(old, new) 
                 2024-07-21 - TODO: On startup, read history for files that have
@@ -4583,7 +4834,7 @@ Call search.py when these control keys occur
                 rename_path(-3, old_artist, new_artist, self.real_paths)
                 rename_path(-3, old_artist, new_artist, self.playlist_paths)
 
-        sql.con.commit()  # Write changes to disk
+        sql.commit()  # Write changes to disk
         if not self.lib_top_is_active:
             return False  # Shutting down
 
@@ -4924,7 +5175,8 @@ Call search.py when these control keys occur
                 self.playlists.open_seconds = self.playlists.act_seconds + 1 - 1
                 self.playlists.save_playlist()
 
-        sql.con.commit()  # Write changes to disk
+        sql.commit()  # Write changes to disk
+        self.lib_cat.remove(Id)  # Before children are gone from lib_tree
         self.lib_tree.delete(Id)  # Update Music Location Tree
         self.lib_top.update_idletasks()
 
@@ -5812,6 +6064,21 @@ Call search.py when these control keys occur
         self.calc_top = None  # Prevent lifting window
         self.calculator = None  # Prevent lifting window
 
+    def metadata_benchmark(self):
+        """ Tools menu. Time mutagen and ffprobe reading the same songs.
+            Runs ffprobe for each song so it isn't done by show_debug().
+            Results are kept for show_debug() to display. """
+        toolkit.wait_cursor(self.lib_top)
+        bench_ctl = FileControl(self.lib_top, self.info, silent=True)
+        self.metadata_bench = bench_ctl.benchmark_metadata(
+            PRUNED_DIR, limit=METADATA_BENCH_SONGS)
+        self.lib_top.config(cursor="")
+        text = "Metadata benchmark for " + \
+            str(self.metadata_bench['songs']) + " songs:\n\n"
+        for key, value in self.metadata_bench.items():
+            text += key + ": " + str(value) + "\n"
+        self.info.cast(text)
+
     def show_debug(self):
         """ Debugging - show machine info, monitors, windows, tooltips 
             locations, sql, metadata, global variables """
@@ -6268,6 +6535,51 @@ Call search.py when these control keys occur
             self.debug_detail("-------------------------------------------------------\n")
             for i in self.mus_ctl.metadata:
                 self.debug_detail(i, ":", self.mus_ctl.metadata[i])
+
+        self.debug_detail("\nFileControl.get_metadata() cache (sql.meta_cache):")
+        self.debug_detail("-" * 51 + "\n")
+        for key, value in sql.meta_cache.counts().items():
+            self.debug_detail(key.ljust(12), ":", value)
+
+        self.debug_detail("\nget_config() / save_config() cache (sql.config_cache):")
+        self.debug_detail("-" * 51 + "\n")
+        for key, value in sql.config_cache.counts().items():
+            self.debug_detail(key.ljust(12), ":", value)
+
+        self.debug_detail("\nFileControl.get_artwork() cache (artwork_cache):")
+        self.debug_detail("-" * 51 + "\n")
+        for key, value in artwork_cache.counts().items():
+            self.debug_detail(key.ljust(12), ":", value)
+
+        self.debug_detail("\nSpinning artwork cache (img.SpinArtCache):")
+        self.debug_detail("-" * 51 + "\n")
+        for key, value in self.spin_cache.counts().items():
+            self.debug_detail(key.ljust(12), ":", value)
+
+        self.debug_detail("\nVU Meter frame time (play_vu_meter):")
+        self.debug_detail("-" * 51 + "\n")
+        frames = self.vu_meter_frame_cnt
+        self.debug_detail("frames      :", frames)
+        self.debug_detail("average ms  :", round(
+            self.vu_meter_frame_secs * 1000.0 / frames, 3) if frames else 0.0)
+        self.debug_detail("maximum ms  :", round(
+            self.vu_meter_frame_max * 1000.0, 3))
+
+        self.debug_detail("\nFileControl.benchmark_metadata() mutagen vs. ffprobe:")
+        self.debug_detail("-" * 51 + "\n")
+        if self.metadata_bench is None:
+            self.debug_detail("Not run yet. Use Tools menu 'Benchmark Metadata'")
+        else:
+            for key, value in self.metadata_bench.items():
+                self.debug_detail(key.ljust(12), ":", value)
+
+        self.debug_detail("\nplay_to_end() subsystem budgets (play_sched):")
+        self.debug_detail("-" * 51 + "\n")
+        if self.play_sched:
+            for line in self.play_sched.report():
+                self.debug_detail(line)
+        else:
+            self.debug_detail("Music has not been played yet.")
         self.debug_output()
 
         # Global variables ------------------------------------------
@@ -6349,6 +6661,8 @@ Call search.py when these control keys occur
         self.debug_show_sql_table_size("SQL Location Table", "Location")
         self.debug_show_sql_table_size("SQL Music Table", "Music")
         self.debug_show_sql_table_size("SQL History Table", "History")
+        self.debug_show_sql_table_size("SQL MetaCache Table", "MetaCache")
+        self.debug_show_sql_table_size("SQL JobQueue Table", "JobQueue")
         self.debug_show_sql_type_action('file', 'init')
         self.debug_show_sql_type_action('file', 'edit')
         self.debug_show_sql_type_action('meta', 'init')
@@ -6746,13 +7060,25 @@ Call search.py when these control keys occur
         self.mus_view.tree.tag_configure('no_audio', background='Red',
                                          foreground='White')
 
-    def mus_populate(self, delayed_textbox, dd_view):
-        """ Stuff SQL Music Table rows into treeview """
-        sql.cursor.execute("SELECT * FROM Music INDEXED BY OsFileNameIndex\
-                           ORDER BY OsFileName")
-        rows = sql.cursor.fetchall()
-        if rows:
-            self.insert_view_lines(dd_view, rows, delayed_textbox)
+    def mus_populate(self, _delayed_textbox, dd_view):
+        """ Stuff first page of SQL Music Table rows into treeview. More
+            pages are read when scrolling. Keyset is OsFileName because
+            view is sorted by OsFileName. """
+        dd_view.page_init(sql.music_page, key='OsFileName',
+                          convert=self.view_music_row, fetch_ids=sql.music_rows)
+
+    @staticmethod
+    def view_music_row(row):
+        """ Music Location row with no metadata appears blank.
+            Use directory names for Artist and Album. """
+        filename_parts = row['OsFileName'].split(os.sep)
+        if row['Artist'] is None:
+            row['Artist'] = filename_parts[0]
+        if row['Album'] is None:
+            row['Album'] = filename_parts[1]
+        #if row['Title'] is None:  # Title must stay none for test.
+        #    row['Title'] = filename_parts[2]
+        return row
 
     def mus_text_search(self):
         """ Search all Music Table treeview columns for text string.
@@ -6761,11 +7087,17 @@ Call search.py when these control keys occur
             Title, OS File Size, Lyrics and Time Index are also searched.
             To view hidden results pick "View SQL Row" and search matched
             words are highlighted.
+
+            Oct. 18 2026 - When SQLite has FTS5 or FTS4, sql.music_search()
+                finds songs by word prefix in Title, Artist, Album, Composer,
+                Comment and Lyrics. Rows not paged in yet aren't all read.
+                Rows paged in are also searched for words in any column.
         """
         if self.mus_search:  # Already running? Close last search.
             self.mus_search.close()
+        index = sql.music_search if sql.FTS_VERSION else None
         self.mus_search = toolkit.SearchText(self.mus_view, tt=self.tt,
-                                             keypress=True)
+                                             keypress=True, index=index)
         self.mus_search.find()  # Search the text string in all columns
 
     def mus_metadata(self):
@@ -6892,8 +7224,10 @@ Call search.py when these control keys occur
             self.mus_view, callback=self.mus_artwork_callback,
             find_str='callback', thread=self.get_refresh_thread)
 
-        ''' Perform search for missing artwork & update metadata at same time '''
-        self.mus_search.find_callback()  # 2024-05-19 - verify if needed & explain
+        ''' Perform search for missing artwork & update metadata at same time
+            Commit every 50 songs, webscrape.py may be writing lyrics. '''
+        with sql.UnitOfWork(rows=50):
+            self.mus_search.find_callback()  # 2024-05-19 - verify if needed & explain
         self.end_long_running_process()
 
         ''' Close delayed text window '''
@@ -7151,12 +7485,11 @@ Call search.py when these control keys occur
         self.ignore_item = None
         self.his_view.tree.tag_configure('menu_sel', background='Yellow')
 
-    def his_populate(self, delayed_textbox, dd_view):
-        """ Stuff SQL header rows into treeview """
-        sql.hist_cursor.execute("SELECT * FROM History")
-        rows = sql.hist_cursor.fetchall()
-        if rows:
-            self.insert_view_lines(dd_view, rows, delayed_textbox)
+    @staticmethod
+    def his_populate(_delayed_textbox, dd_view):
+        """ Stuff first page of SQL History rows into treeview. More pages
+            are read when scrolling so window opens in constant time. """
+        dd_view.page_init(sql.hist_page, key='Id')
 
     def his_text_search(self):
         """ Search all History Table treeview columns for search words.
@@ -7446,14 +7779,7 @@ Call search.py when these control keys occur
         for sql_row in rows:
             row = dict(sql_row)
             if dd_view.sql_type == "sql_music":
-                # Music Location row with no metadata appears blank
-                filename_parts = row['OsFileName'].split(os.sep)
-                if row['Artist'] is None:
-                    row['Artist'] = filename_parts[0]
-                if row['Album'] is None:
-                    row['Album'] = filename_parts[1]
-                #if row['Title'] is None:  # Title must stay none for test.
-                #    row['Title'] = filename_parts[2]
+                row = self.view_music_row(row)
 
             sql_row_id = row['Id']  # Used for treeview iid ('Id' in both tables)
 
@@ -7505,41 +7831,46 @@ Call search.py when these control keys occur
         use_seconds = "seconds" in view.columns
         use_duration = "duration" in view.columns  # add total seconds
         _use_lyrics = "lyrics" in view.columns  # calculate total words
-
-        for iid in view.tree.get_children():
-            # Loop through all rows
-            row_count += 1
-            values = view.tree.item(iid, "values")
-            if use_file_size:
-                size = view.column_value(values, "os_file_size")  # Music Table
-            else:
+        if view is self.his_view and not view.page_done:
+            ''' Unread pages so no search done. Totals from HistoryTally '''
+            row_count, total_size, total_seconds = sql.hist_tally_totals()
+        else:
+            view.page_all()  # Paging mode, read rows not scrolled to yet
+
+            for iid in view.tree.get_children():
+                # Loop through all rows
+                row_count += 1
+                values = view.tree.item(iid, "values")
+                if use_file_size:
+                    size = view.column_value(values, "os_file_size")  # Music Table
+                else:
+                    try:
+                        size = view.column_value(values, "size")  # History Table
+                    except ValueError:
+                        size = None
+                        print("show_sql_summary() view.columns:", view.columns)
+                if size is None:
+                    print('mserve.py - show_sql_summary() size is None. iid:', iid)
+                    size = "0"
                 try:
-                    size = view.column_value(values, "size")  # History Table
+                    int_size = int(size.replace(',', ''))  # TODO: Use locale
                 except ValueError:
-                    size = None
-                    print("show_sql_summary() view.columns:", view.columns)
-            if size is None:
-                print('mserve.py - show_sql_summary() size is None. iid:', iid)
-                size = "0"
-            try:
-                int_size = int(size.replace(',', ''))  # TODO: Use locale
-            except ValueError:
-                int_size = 0
-            total_size += int_size  # TODO: Use locale
+                    int_size = 0
+                total_size += int_size  # TODO: Use locale
 
-            if use_seconds:
-                # seconds column might not be in treeview displaycolumns
-                seconds = view.column_value(values, "seconds")  # Music/History
-                try:
-                    total_seconds += float(seconds.replace(",", ""))
-                except ValueError:  # SQL Music Table row with no metadata
-                    #print(_who, "invalid seconds:", seconds)
-                    pass
+                if use_seconds:
+                    # seconds column might not be in treeview displaycolumns
+                    seconds = view.column_value(values, "seconds")  # Music/History
+                    try:
+                        total_seconds += float(seconds.replace(",", ""))
+                    except ValueError:  # SQL Music Table row with no metadata
+                        #print(_who, "invalid seconds:", seconds)
+                        pass
 
-            if use_duration:
-                duration = view.column_value(values, "duration")  # Music Table
-                if duration is not "":  # Songs with no metadata have no duration
-                    total_seconds += float(tmf.get_sec(duration))
+                if use_duration:
+                    duration = view.column_value(values, "duration")  # Music Table
+                    if duration is not "":  # Songs with no metadata have no duration
+                        total_seconds += float(tmf.get_sec(duration))
 
         text = "Total size:  " + "{:,}".format(total_size) + \
                "\nRow count:  " + "{:,}".format(row_count)
@@ -8176,6 +8507,12 @@ Call search.py when these control keys occur
         open_list = list()
         for Artist in self.lib_tree.get_children():  # Process artists
             self.append_if_open(Artist, None, open_list)
+            if Artist in self.lib_tree.pending:
+                # Deferred Albums keep open states they will be given
+                art_text = self.lib_tree.item(Artist, 'text')
+                open_list.extend([state for state in self.lib_tree_open_states
+                                  if state[0] == art_text and state[1]])
+                continue
             for Album in self.lib_tree.get_children(Artist):  # Process albums
                 self.append_if_open(Artist, Album, open_list)
         return open_list
@@ -8224,6 +8561,8 @@ Call search.py when these control keys occur
         """
         for Artist in self.lib_tree.get_children():  # Read all artists
             self.apply_open_state(Artist, None, open_states)
+            if Artist in self.lib_tree.pending:
+                continue  # Album open states applied when Albums inserted
             for Album in self.lib_tree.get_children(Artist):  # Read all albums
                 self.apply_open_state(Artist, Album, open_states)
 
@@ -8384,6 +8723,8 @@ Call search.py when these control keys occur
         self.lib_tree_open_states = []
         for Artist in self.lib_tree.get_children():  # Read all Artists
             self.clear_item_check_and_open(Artist, force_close=True)
+            if Artist in self.lib_tree.pending:
+                continue  # Deferred Albums and Songs are cleared in lib_cat
             for Album in self.lib_tree.get_children(Artist):  # Read all Albums
                 self.clear_item_check_and_open(Album, force_close=True)
                 for Song in self.lib_tree.get_children(Album):  # Read all Albums
@@ -8445,17 +8786,22 @@ Call search.py when these control keys occur
         ''' Set opened states for Artists and Albums, play number for Songs '''
         selected_count = 0
         not_selected_count = 0
-        bs = BatchSelect(self.lib_tree)
+        self.lib_cat.clear_selected()  # All items must be "unchecked"
+        bs = BatchSelect(self.lib_tree, self.lib_cat)
+        sel_ndx = {}  # {lib_tree iid: index in self.saved_selections}
+        for ndx, iid in enumerate(self.saved_selections):
+            sel_ndx.setdefault(iid, ndx)  # Same as .index() first occurrence
         ext.t_init('Set open/closed, add BatchSelect totals')
         for Artist in self.lib_tree.get_children():  # Artists in lib_top
             self.apply_open_state(Artist, None, self.lib_tree_open_states)
+            if Artist in self.lib_tree.pending:
+                continue  # Closed and Albums deferred. Songs selected below
             for Album in self.lib_tree.get_children(Artist):  # Albums in lib_top
                 ''' Opening Album chevron automatically opens Artist chevron '''
                 self.apply_open_state(Album, None, self.lib_tree_open_states)
                 for Song in self.lib_tree.get_children(Album):  # Read all songs
-                    try:  # Song in playlist?
-                        ndx = self.saved_selections.index(Song)
-                    except ValueError:
+                    ndx = sel_ndx.get(Song)  # Song in playlist?
+                    if ndx is None:
                         not_selected_count += 1
                         continue
 
@@ -8463,10 +8809,19 @@ Call search.py when these control keys occur
                     selected_count += 1
                     number_str = play_padded_number(
                         str(ndx + 1), len(str(len(self.playlist_paths))))
-                    adj_list = bs.add_select(Song, Album, Artist, number_str)
+                    adj_list = bs.add_select(Song, Album, Artist, number_str,
+                                             ndx + 1)
                     # Treeview columns: selected size, sel. count, sel. seconds
                     self.tree_col_range_replace(Song, 8, adj_list)  # 8=Column #
 
+        ''' Deferred songs are selected in self.lib_cat. When inserted into
+            lib_tree, self.lib_tree_materialized() sets "song_sel", etc. '''
+        for Song, ndx in sel_ndx.items():
+            if Song in self.lib_tree.pending_owner:
+                selected_count += 1
+                self.lib_cat.select(Song, True, ndx + 1)
+        bs.totals = None  # BatchSelect totals include deferred songs
+
         ext.t_end('no_print')  # Jun 13, 2023 - open/closed and BatchSelect: 0.32
 
         ext.t_init('Apply totals to Artists & Albums + set checkbox')
@@ -8474,6 +8829,13 @@ Call search.py when these control keys occur
             adj_list = bs.get_totals(Artist)
             # May 30, 2023 - was range_add()
             self.tree_col_range_replace(Artist, 8, adj_list, tagsel='artist_sel')
+            if Artist in self.lib_tree.pending:
+                # Checkbox from self.lib_cat counts, Albums don't exist yet
+                if adj_list[1]:
+                    self.lib_tree.change_state(Artist, "checked" if adj_list[1]
+                                               == self.lib_cat.totals(Artist)[1]
+                                               else "tristate")
+                continue
             for Album in self.lib_tree.get_children(Artist):  # Read all Albums
                 adj_list = bs.get_totals(Album)
                 # May 30, 2023 - was range_add()
@@ -8558,8 +8920,12 @@ Call search.py when these control keys occur
 
         ''' Override to play songs checked in lib_top.tree? '''
         if self.play_from_start:
-            ''' Get list of items tagged for playing in Artist/Album order '''
-            new_selections = self.lib_tree.tag_has("song_sel")  # Alphabetical order
+            ''' Get list of items tagged for playing in Artist/Album order
+                Oct 18 2026 - tag_has() misses songs of deferred Albums '''
+            if self.lib_tree.pending:
+                new_selections = self.lib_cat.selected_iids()
+            else:
+                new_selections = self.lib_tree.tag_has("song_sel")  # Alphabetical order
             if len(new_selections) != len(self.saved_selections):
                 # Play new selections because old save out of date.
                 self.saved_selections = list(new_selections)
@@ -8597,6 +8963,7 @@ Call search.py when these control keys occur
         ext_name = "./vu_meter.py stereo mserve 2>/dev/null"
         self.vu_meter_pid = \
             ext.launch_command(ext_name, toplevel=self.play_top)
+        self.vu_meter_ring = toolkit.VuMeterRing(AMPLITUDE_RING_FNAME)
 
         ''' Place Window top-left of parent window with g.PANEL_HGT padding '''
         self.play_top.minsize(width=g.BTN_WID * 10, height=g.PANEL_HGT * 10)
@@ -8777,6 +9144,7 @@ Call search.py when these control keys occur
         # A better method is to paint line where peak used to be 1/3 second ago
         self.vu_meter_left_hist = [0.0] * self.VU_HIST_SIZE
         self.vu_meter_right_hist = [0.0] * self.VU_HIST_SIZE
+        self.vu_meter_leds = {}  # New canvases, LEDs built on first paint
 
         ''' self.lyrics_master_frm: Lyrics Frame - Title & Textbox with scrollbar
             Further divided into self.lyrics_frm and lyrics_score_box
@@ -9824,6 +10192,8 @@ Call search.py when these control keys occur
 
         ''' Tell queue_next_song() not to increment self.ndx '''
         self.song_set_ndx_just_run = True  # self.ndx set, don't use 'Next'
+        if self.play_sched:
+            self.play_sched.trigger('exit')  # play_to_end() notices now
 
         ''' 2024-05-13 getting tooltip error on close. set_pp_button_text() '''
         if not self.play_top_is_active:
@@ -10315,7 +10685,9 @@ Call search.py when these control keys occur
 
             return "N/A dB", "0 Bytes"
 
-        ''' Start ffplay, get Linux PID and Pulseaudio Input Sink # '''
+        ''' Start ffplay, get Linux PID and Pulseaudio Input Sink #
+            Oct 18 2026 - Muted ffplay play_prefetch() spawned is killed '''
+        self.play_prefetch_cancel()
         self.play_ctl.start(start_secs, 0, 1, 0, TMP_CURR_SONG, dead_start)
 
         if self.is_loudnorm_playlist:
@@ -10400,6 +10772,87 @@ Call search.py when these control keys occur
         self.loud_ctl.close()
         return True
 
+    def play_prefetch(self):
+        """ Prepare next song PREFETCH_SECS before current song ends so the
+            gap between songs is just ffplay startup. Called by
+            play_to_end() each refresh, one stage per call so animations
+            keep running:
+
+            'metadata' - next_ctl.prefetch() fills sql.meta_cache
+            'artwork'  - next_ctl.get_artwork() fills artwork_cache
+            'lyrics'   - sql.get_lyrics() saved for play_init_lyrics()
+            'spawn'    - ffplay started paused, muted, sink found
+            'ready'    - Nothing more to do until next song starts
+
+            The spawned ffplay reads song and codecs into memory ahead of
+            time. It runs with '-volume 0' so it is silent before it is
+            found and stopped. ffplay can't raise its own volume afterwards
+            so play_one_song() calls play_prefetch_cancel() to kill it.
+        """
+        stage = self.prefetch_stage
+        if stage == 'ready':
+            return
+
+        if stage is None:
+            if self.pp_state != "Playing" or not self.saved_DurationSecs:
+                return
+            if self.saved_DurationSecs - self.current_song_secs > PREFETCH_SECS:
+                return
+            self.prefetch_stage = 'ready'  # When no next song to prefetch
+            ndx = self.play_prefetch_ndx()
+            if ndx is not None:
+                self.prefetch_path = self.playlist_paths[ndx]
+                self.prefetch_key = \
+                    self.real_paths[int(self.saved_selections[ndx])][
+                        len(PRUNED_DIR):]
+                self.prefetch_stage = 'metadata'
+            return
+
+        if stage == 'metadata':
+            ok = self.next_ctl.prefetch(self.prefetch_path)
+            self.prefetch_stage = 'artwork' if ok else 'ready'
+        elif stage == 'artwork':
+            if not self.runSlideShow:
+                self.next_ctl.get_artwork(self.art_width, self.art_height)
+            self.prefetch_stage = 'lyrics'
+        elif stage == 'lyrics':
+            score, time_list = sql.get_lyrics(self.prefetch_key)
+            self.prefetch_lyrics = (self.prefetch_key, score, time_list)
+            self.prefetch_stage = 'spawn' if PREFETCH_SPAWN else 'ready'
+        elif stage == 'spawn':
+            # ffplay output file not used by song playing now
+            ff_name = TMP_NEXT_SONG if self.play_ctl.ff_name != TMP_NEXT_SONG \
+                else TMP_CURR_SONG
+            self.next_ctl.start(0.0, 0, 1, 0, ff_name, dead_start=True,
+                                extra_opt=' -volume 0')  # Silent until stopped
+            if self.next_ctl.sink == "":
+                self.play_prefetch_cancel()  # Sink not found
+            self.prefetch_stage = 'ready'
+
+    def play_prefetch_ndx(self):
+        """ Index of song queue_next_song() will play or None when next song
+            can't be known now (chronology filter, loudness normalization,
+            'Next' / 'Prev' already clicked). """
+        if self.chron_has_filter is not None or self.is_loudnorm_playlist:
+            return None
+        if self.song_set_ndx_just_run or len(self.saved_selections) < 2:
+            return None
+        if self.ndx >= len(self.playlist_paths) - 1:
+            return 0  # On last so go to first
+        return self.ndx + 1
+
+    def play_prefetch_cancel(self):
+        """ Kill ffplay spawned by play_prefetch() and start over with next
+            song. Cached metadata, artwork and lyrics are harmless. """
+        if self.next_ctl and self.next_ctl.pid:
+            ext.kill_pid_running(self.next_ctl.pid)
+            # ffplay read the song for a moment. Restore last access time.
+            if self.next_ctl.stat_start:
+                self.next_ctl.touch_it(self.next_ctl.stat_start)
+        if self.next_ctl:
+            FileControlCommonSelf.__init__(self.next_ctl)  # Don't touch atime
+        self.prefetch_stage = None
+
     def queue_next_song(self):
         """ Song ended. Get next song in list unless already done. """
         if True is True:
@@ -10549,12 +11002,142 @@ Call search.py when these control keys occur
         self.lib_tree.set(iid, 'Access', f_time)
 
     def play_to_end(self):
-        """ Play single song, refreshing screen 30 fps with refresh_play_top()
+        """ Play single song. Tk runs self.play_sched timers for artwork,
+            VU meters, lyrics, etc. until self.play_end_var is set by
+            play_check_end() or play_close().
 
         Called from:
             play_one_song() to start a new song
             Indirectly called by refresh_play_top() when it calls play_one_song()
                 when song ends during long running process like update metadata
+
+        :returns: True when song ended or another song picked. False when
+            play_top is closing.
+        """
+        if not PLAY_SCHEDULER:
+            return self.play_to_end_loop()
+        if self.play_sched is None:
+            self.play_sched_build()
+
+        self.play_end_var.set("")
+        self.play_exit_watcher = ext.ExitWatcher(
+            self.play_ctl.pid, self.lib_top, self.play_exit_ready)
+        self.play_sched.start()
+        while True:
+            if self.play_check_end() is not False:  # Not ended already?
+                self.lib_top.wait_variable(self.play_end_var)
+            end = self.play_end_var.get()
+            if end in ("changed", "ended") and self.play_pid_changed():
+                # Long running process held this wait while song ended and
+                # refresh_play_top() started next one. Keep playing it.
+                self.play_end_var.set("")
+                self.play_sched.start('exit')  # Stopped when end was set
+                continue
+            break
+        self.play_sched.stop()
+        self.play_exit_watcher.close()
+
+        if end == "shutdown":
+            # SIGTERM to shut down / reboot was received
+            print('\nmserve.py play_to_end() closed by SIGTERM')
+            self.play_close()
+        return end in ("changed", "ended")
+
+    def play_sched_build(self):
+        """ Create self.play_sched timers for subsystems in PLAY_RATES.
+            Timers belong to lib_top so play_close() can't orphan them. """
+        self.play_end_var = tk.StringVar(master=self.lib_top)
+        self.play_sched = toolkit.TkScheduler(self.lib_top, who="play_sched")
+
+        def playing(func):
+            """ Only call func when song is playing in play_top. Skipped
+                while FineTune() is synchronizing lyrics like old loop. """
+            def call():
+                """ Scheduled by self.play_sched """
+                if not self.play_top_is_active or lcs.host_down:
+                    return
+                if self.fine_tune and self.fine_tune.top:
+                    return
+                if self.pp_state == "Playing":
+                    func()
+            return call
+
+        calls = {
+            'exit': self.play_check_end,
+            'fades': pav.poll_fades,
+            'tips': lambda: self.tt.poll_tips(),
+            'controls': self.play_sched_controls,
+            'progress': playing(self.play_update_progress),
+            'art': playing(self.play_spin_art),
+            'vu': playing(self.play_vu_meter),
+            'lyrics': playing(self.play_paint_lyrics),
+            'prefetch': self.play_prefetch}
+        for name, (ms, budget) in PLAY_RATES.items():
+            self.play_sched.add(name, calls[name], ms, budget)
+
+    def play_sched_controls(self):
+        """ 'controls' subsystem of self.play_sched """
+        if not self.play_top_is_active or lcs.host_down:
+            return
+        if self.fine_tune and self.fine_tune.top:
+            return  # Old loop skipped buttons while synchronizing lyrics
+        self.play_refresh_controls()
+
+    def play_check_end(self):
+        """ 'exit' subsystem of self.play_sched. When song has ended or
+            play_top is closing, set self.play_end_var which ends
+            wait_variable() in play_to_end().
+
+        :returns: False to stop 'exit' timer when play_end_var was set.
+        """
+        if self.killer.kill_now:
+            end = "shutdown"
+        elif not self.play_top_is_active:
+            end = "closed"
+        elif self.play_pid_changed():
+            return True  # Keep playing song refresh_play_top() started
+        elif self.last_started != self.ndx:
+            end = "changed"  # self.song_set_ndx() used prev/next/restart
+        elif self.play_exit_watcher.ended():
+            self.play_ctl.check_pid()  # Sets pid to 0 and sink to ""
+            end = "ended"  # Song ended naturally
+        else:
+            return True
+
+        self.play_end(end)
+        return False
+
+    def play_pid_changed(self):
+        """ Did refresh_play_top() start next song during a long running
+            process? Old loop kept playing it because it checked again
+            after the process returned. When so, watch new ffplay PID.
+
+        :returns: True when play_ctl.pid is running and isn't watched yet.
+        """
+        pid = self.play_ctl.pid
+        if pid == self.play_exit_watcher.pid or self.last_started != self.ndx:
+            return False
+        if not ext.check_pid_running(pid):
+            return False
+        self.play_exit_watcher.close()
+        self.play_exit_watcher = ext.ExitWatcher(
+            pid, self.lib_top, self.play_exit_ready)
+        return True
+
+    def play_exit_ready(self, _pid):
+        """ ExitWatcher() pidfd callback. ffplay ended, don't wait for
+            next 'exit' timer. """
+        if self.play_sched:
+            self.play_sched.trigger('exit')
+
+    def play_end(self, end):
+        """ Set self.play_end_var once. First reason wins. """
+        if self.play_end_var is not None and not self.play_end_var.get():
+            self.play_end_var.set(end)
+
+    def play_to_end_loop(self):
+        """ Play single song, refreshing screen 30 fps with refresh_play_top()
+            Oct. 18, 2026 - Used when PLAY_SCHEDULER is False
         """
 
         while True:
@@ -10580,6 +11163,7 @@ Call search.py when these control keys occur
             if not self.play_ctl.check_pid():
                 return True  # Song ended naturally
             self.refresh_play_top()  # Rotate art, update vu meter after(.033)
+            self.play_prefetch()  # Ready next song near end of this one
 
     def refresh_play_top(self, tk_after=True):
         """ Common code for updating graphics that can be called from anywhere
@@ -10623,41 +11207,7 @@ Call search.py when these control keys occur
                 self.fine_tune.top.after(sleep)  # Wait until lyric sync
             return False  # Looks like True causes animations to freeze
 
-        ''' Set previous or restart into button text '''
-        if self.prev_button_text == self.previous_text:
-            if self.current_song_secs > float(REW_CUTOFF):
-                self.prev_button_text = self.restart_text
-                self.prev_button['text'] = self.prev_button_text
-                self.tt.set_text(self.prev_button, "Restart song at beginning.")
-
-                ''' 
-                # Quick test ShowInfo on program startup
-                text = "Hello World !\n\n"
-                text += "\tOne Tab\tTab 2\n"
-                text += "\t\tDouble Tab\tAnother Tab"
-                message.ShowInfo(self.play_top, text=text, align='left',
-                                 thread=self.get_refresh_thread,
-                                 title="debug if ShowInfo freezes")
-                '''
-        else:  # Previous button text says "Restart"
-            if self.current_song_secs < float(REW_CUTOFF):
-                self.prev_button_text = self.previous_text
-                self.prev_button['text'] = self.prev_button_text
-                self.tt.set_text(self.prev_button, "Play previous song.")
-
-        ''' Playing music for Hockey Commercial or Intermission '''
-        if self.play_hockey_active:  # Is hockey active?
-            elapsed = int(time.time() -
-                          self.play_hockey_t_start)  # Elapsed time Hockey
-            self.hockey_countdown(elapsed)  # Remaining in buttons
-            if elapsed > self.play_hockey_secs:  # Has countdown ended?
-                if self.pp_state is "Playing":  # Is music playing?
-                    self.pp_toggle()
-                # Important line below is done AFTER pp_toggle() is called
-                # Otherwise getting sound spike below because moving
-                # from 100% instead of 60% volume down
-                # 2024-05-01 - Fix above error in comments in pp_toggle()
-                self.play_hockey_active = False  # Turn off timer
+        self.play_refresh_controls()  # Previous button & Hockey countdown
 
         ''' When current state is "Paused" there is nothing to do but sleep now '''
         if self.pp_state is "Paused":
@@ -10720,11 +11270,14 @@ Call search.py when these control keys occur
 
         ''' Updated song progress and graphics for song that is playing 
             TODO: Review each function below for being called faster than 30 FPS
+            Oct. 18, 2026 - When self.play_sched is running its timers do
+                this during self.play_top.update() below.
         '''
-        self.play_update_progress()  # Update screen with song progress
-        self.play_spin_art()  # Rotate artwork 1°
-        self.play_vu_meter()  # Left & Right VU Meters
-        self.play_paint_lyrics()  # Uses the lyrics time index
+        if not (self.play_sched and self.play_sched.running):
+            self.play_update_progress()  # Update screen with song progress
+            self.play_spin_art()  # Rotate artwork 1°
+            self.play_vu_meter()  # Left & Right VU Meters
+            self.play_paint_lyrics()  # Uses the lyrics time index
         if not self.play_top_is_active:
             return False  # Play window closed so shutting down
         self.play_top.update()  # Update artwork spinner & text
@@ -10743,6 +11296,46 @@ Call search.py when these control keys occur
             self.lib_top.after(sleep)  # Aug 9/23 - Try lib_top.after() seems OK?
         return self.play_top_is_active
 
+    def play_refresh_controls(self):
+        """ Previous/Restart button text and Hockey countdown.
+            Called by refresh_play_top() and self.play_sched 'controls'.
+        """
+        ''' Set previous or restart into button text '''
+        if self.prev_button_text == self.previous_text:
+            if self.current_song_secs > float(REW_CUTOFF):
+                self.prev_button_text = self.restart_text
+                self.prev_button['text'] = self.prev_button_text
+                self.tt.set_text(self.prev_button, "Restart song at beginning.")
+
+                ''' 
+                # Quick test ShowInfo on program startup
+                text = "Hello World !\n\n"
+                text += "\tOne Tab\tTab 2\n"
+                text += "\t\tDouble Tab\tAnother Tab"
+                message.ShowInfo(self.play_top, text=text, align='left',
+                                 thread=self.get_refresh_thread,
+                                 title="debug if ShowInfo freezes")
+                '''
+        else:  # Previous button text says "Restart"
+            if self.current_song_secs < float(REW_CUTOFF):
+                self.prev_button_text = self.previous_text
+                self.prev_button['text'] = self.prev_button_text
+                self.tt.set_text(self.prev_button, "Play previous song.")
+
+        ''' Playing music for Hockey Commercial or Intermission '''
+        if self.play_hockey_active:  # Is hockey active?
+            elapsed = int(time.time() -
+                          self.play_hockey_t_start)  # Elapsed time Hockey
+            self.hockey_countdown(elapsed)  # Remaining in buttons
+            if elapsed > self.play_hockey_secs:  # Has countdown ended?
+                if self.pp_state is "Playing":  # Is music playing?
+                    self.pp_toggle()
+                # Important line below is done AFTER pp_toggle() is called
+                # Otherwise getting sound spike below because moving
+                # from 100% instead of 60% volume down
+                # 2024-05-01 - Fix above error in comments in pp_toggle()
+                self.play_hockey_active = False  # Turn off timer
+
     def play_update_progress(self, start_secs=None):
         """ Calculate song progress. This is approximate value. Exact value
             obtained using: self.play_ctl.elapsed()
@@ -10804,6 +11397,10 @@ Call search.py when these control keys occur
             Spin artwork clockwise, rotate artwork -1° each decisecond
             at 0° slide up and pixelate, -90° slide right, -180° slide down,
             and at -270° slide left.
+
+            Oct. 18 2026 - Frames are rendered once for artwork, size and
+                background color by self.spin_cache (img.SpinArtCache) and
+                then cycled. Slide and fade effects are cached there too.
         """
         if not self.play_top_is_active:
             return  # Play window closed?
@@ -10827,32 +11424,31 @@ Call search.py when these control keys occur
                 self.play_rotated_value = 0  # At 1 image wobbles-Interesting?
             self.play_rotated_value -= .5  # Rotate 1/2 degree
 
-            ''' If Pillow < 5 background fill for corners more complicated '''
-            im = self.play_resized_art.convert('RGBA')
-            # Instead of 200,200 use height and width
-            self.play_rotated_art = Image.new(
-                "RGBA", (self.art_width, self.art_height), self.theme_bg)
-            rot = im.rotate(self.play_rotated_value)
-            self.play_rotated_art.paste(rot, (0, 0), rot)
-            ''' July 3, 2023, change self.play_frm_bg to self.theme_bg '''
-            ''' ――If Pillow version >= 5 solution is simple
-            self.play_rotated_art = self.play_resized_art. \
-                                    rotate(self.play_rotated_value, \
-                                    fillcolor=self.theme_bg)
-            '''
-
-            self.play_current_song_art = \
-                ImageTk.PhotoImage(self.play_rotated_art)
+            ''' Frame 0 is -0.5°, frame 719 is -360°. Rendering (and the
+                Pillow < 5 background fill for corners) is in image.py '''
+            ndx = int(round(-self.play_rotated_value * 2)) - 1
+            frames = self.play_spin_frames(ndx)
+            if ndx in frames.keep:
+                # Slide and fade effects start from quarter turn image
+                self.play_rotated_art = frames.image(ndx)
+            self.play_current_song_art = frames.photo(ndx)
         else:
-            self.play_current_song_art = \
-                ImageTk.PhotoImage(self.play_shifted_art)
+            self.play_current_song_art = self.play_shifted_art  # PhotoImage
 
         self.art_label.configure(image=self.play_current_song_art)
 
+    def play_spin_frames(self, ndx=0):
+        """ Rotated frames for current artwork, size and background color.
+            New artwork starts background worker rendering from frame ndx. """
+        return self.spin_cache.frames(self.play_resized_art, self.theme_bg,
+                                      ndx=ndx)
+
     def play_art_slide(self, direction):
         """
             Slide artwork in 100 steps.
             at 0° slide up, -90° slide right, -180° slide down, -270° slide left
+
+            Returns PhotoImage cached by self.spin_cache
         """
         if self.play_art_slide_count == 100 or self.art_width < 10:
             # Completed a loop + 1 idle loop using 100 %
@@ -10864,8 +11460,10 @@ Call search.py when these control keys occur
 
         self.play_art_slide_count += 1  # Increment slide count
         percent = float(self.play_art_slide_count) / 100.0
-        return img.shift_image(self.play_rotated_art, direction,
-                               self.art_width, self.art_height, percent)
+        return self.play_spin_frames().effect(
+            direction, self.play_art_slide_count,
+            lambda: img.shift_image(self.play_rotated_art, direction,
+                                    self.art_width, self.art_height, percent))
 
     def play_art_fade_numpy(self):
         """ NUMPY VERSION (not used):
@@ -10939,6 +11537,9 @@ Call search.py when these control keys occur
         """ PILLOW VERSION:
             Fade in artwork in 100 chunks leaving loop after 1% chunk and
             reentering after tkinter updates screen and pauses.
+
+            Returns PhotoImage cached by self.spin_cache. Shuffled order is
+            kept with the frames so every fade in is the same sequence.
         """
         if self.play_art_fade_count == 100:
             # Completed a full cycle. Force graphical effects exit
@@ -10958,13 +11559,15 @@ Call search.py when these control keys occur
                 self.step = 1
             size = self.play_rotated_art.size[0] - self.step
 
-            self.xy_list = [
-                (x, y)
-                for x in range(0, size, self.step)
-                for y in range(0, size, self.step)
-            ]
-
-            shuffle(self.xy_list)
+            frames = self.play_spin_frames()
+            if frames.fade_order is None:
+                frames.fade_order = [
+                    (x, y)
+                    for x in range(0, size, self.step)
+                    for y in range(0, size, self.step)
+                ]
+                shuffle(frames.fade_order)
+            self.xy_list = frames.fade_order
             # Convert numpy array into python list & calculate chunk size
             self.current_chunk = 0
             self.chunk_size = int(len(self.xy_list) / 100)
@@ -10984,7 +11587,8 @@ Call search.py when these control keys occur
             self.current_chunk += 1
 
         self.play_art_fade_count += 1
-        return self.fade
+        return self.play_spin_frames().effect(
+            'fade', self.play_art_fade_count, lambda: self.fade)
 
     # ==============================================================================
     #
@@ -11002,6 +11606,10 @@ Call search.py when these control keys occur
 
     def play_vu_meter_blank_side(self, canvas, rectangle):
         """ Display one blank VU Meter (Left or Right), when music paused. """
+        leds = self.vu_meter_leds.get(canvas, None)
+        if leds:
+            self.play_vu_meter_light(canvas, leds, [False] * len(leds['lit']))
+            leds['blank'] = True  # Next paint deletes blank rectangle
         x0, y0, x1, y1 = 0, 0, self.vu_width, self.vu_height
         canvas.coords(rectangle, x0, y0, x1, y1)
         canvas.create_rectangle(x0, y0, self.vu_width, y1,
@@ -11009,7 +11617,19 @@ Call search.py when these control keys occur
                                 width=1, outline='black', tag="rect")
 
     def play_vu_meter(self, stop='no'):
-        """ Update VU Meter display, either 'mono' or 'left' and 'right' """
+        """ Update VU Meter display, either 'mono' or 'left' and 'right'
+            Oct. 18 2026 - Time spent is added to self.vu_meter_frame_xxx
+        """
+        start = time.time()
+        self.play_vu_meter_sides(stop)
+        elapsed = time.time() - start
+        self.vu_meter_frame_cnt += 1
+        self.vu_meter_frame_secs += elapsed
+        if elapsed > self.vu_meter_frame_max:
+            self.vu_meter_frame_max = elapsed
+
+    def play_vu_meter_sides(self, stop='no'):
+        """ Called by play_vu_meter() to paint left and right channels """
         if stop == 'yes':
             # Stop display
             self.play_vu_meter_side(
@@ -11024,21 +11644,30 @@ Call search.py when these control keys occur
         # Regular display
         self.play_vu_meter_side(
             AMPLITUDE_LEFT_FNAME, self.vu_meter_left,
-            self.vu_meter_left_rect, self.vu_meter_left_hist)
+            self.vu_meter_left_rect, self.vu_meter_left_hist, 0)
 
         self.play_vu_meter_side(
             AMPLITUDE_RIGHT_FNAME, self.vu_meter_right,
-            self.vu_meter_right_rect, self.vu_meter_right_hist)
+            self.vu_meter_right_rect, self.vu_meter_right_hist, 1)
 
-    def play_vu_meter_side(self, fname, canvas, rectangle, history):
+    def play_vu_meter_side(self, fname, canvas, rectangle, history, channel=0):
         """ Update one VU Meter display
             One time bug: Aug 12/23 - 40 LED's were treated as two LED's of
                 20 blocks each.
+            Oct. 18 2026 - Shared memory ring before text file fname.
         """
+        sample = None
+        if fname != 'stop' and self.vu_meter_ring:
+            sample = self.vu_meter_ring.latest(channel)
+        vu_hold = 0.0  # Peak hold from vu_meter.py, not in text files
         if fname == 'stop':
             # Pausing music but vu_meter.py will wait for sounds and
             # not update the files with zero values. So manually do it here.
             vu_max, vu_amp = 0.0, 0.0
+        elif sample:
+            _time, vu_max, vu_amp, _peak, vu_hold = sample
+        elif not os.path.isfile(fname):
+            return False  # Ring buffer mode and vu_meter.py hasn't started
         else:
             with open(fname, "r") as f:
                 line = f.readline()
@@ -11070,10 +11699,12 @@ Call search.py when these control keys occur
         if vu_max == 0.0:
             # No sound (can't divide by zero) set y0 for no rectangle displayed
             percent_height = self.vu_height
+            hold_height = 0
         else:
             # Have vu_max. set y0 to percentage of volume, 0 = 100% volume
             percent_height = self.vu_height - \
                              (self.vu_height * smoothed_amp / vu_max)
+            hold_height = int(self.vu_height * min(vu_hold / vu_max, 1.0))
 
         self.play_vu_meter_style = 'led'  # Use LED rectangles
         # What style of bar?
@@ -11085,7 +11716,8 @@ Call search.py when these control keys occur
         else:
             # Function to display multiple smaller rectangles simulating LEDs
             bar_hgt = self.vu_height - int(percent_height)
-            self.play_vu_meter_paint(canvas, bar_hgt, self.vu_height)
+            self.play_vu_meter_paint(canvas, bar_hgt, self.vu_height,
+                                     hold_height)
 
         # Save current amplitude in sample history list
         history.pop(0)
@@ -11093,7 +11725,46 @@ Call search.py when these control keys occur
         # print(t(time.time()),history)
         return True
 
-    def play_vu_meter_paint(self, canvas, bar_height, height):
+    def play_vu_meter_paint(self, canvas, bar_height, height, hold_height=0):
+        """ Light the LED rectangles below bar_height plus the peak hold LED
+            at hold_height. LEDs are created once by play_vu_meter_build()
+            and only LEDs that change between lit and unlit are configured.
+
+            Oct. 18 2026 - Was canvas.delete("rect") and create_rectangle()
+                for every LED, both channels, every frame.
+        """
+        leds = self.vu_meter_leds.get(canvas, None)
+        if leds is None or leds['height'] != height or \
+                leds['width'] != self.vu_width:
+            leds = self.play_vu_meter_build(canvas, height)
+        if leds['blank']:
+            canvas.delete("rect")  # Blank rectangle from pause covers LEDs
+            leds['blank'] = False
+
+        num_rect = len(leds['lit'])
+        # TODO: Analyze why there is rect_count and num_rect
+        rect_count = int(round(float(bar_height) / height * num_rect))
+        if rect_count > num_rect:
+            rect_count = num_rect  # Fix rounding errors
+        # print('bar_height:', bar_height, 'rect_count:', rect_count)
+
+        ''' LED index 0 is rect_no 1. Range (1, rect_count) is lit. '''
+        lit = [i < rect_count - 1 for i in range(num_rect)]
+        hold_ndx = int(round(float(hold_height) / height * num_rect)) - 2
+        if 0 <= hold_ndx < num_rect:
+            lit[hold_ndx] = True  # Peak hold LED above (or in) the bar
+        self.play_vu_meter_light(canvas, leds, lit)
+
+    @staticmethod
+    def play_vu_meter_light(canvas, leds, lit):
+        """ Show or hide LEDs whose lit state changed since last frame. """
+        for i, item in enumerate(leds['items']):
+            if lit[i] != leds['lit'][i]:
+                canvas.itemconfigure(
+                    item, state=tk.NORMAL if lit[i] else tk.HIDDEN)
+        leds['lit'] = lit
+
+    def play_vu_meter_build(self, canvas, height):
         """ Number of rectangles depends on height:
                 A rectangle must be at least 2 pixels high
                 Space between rectangles must be at least 1 pixel
@@ -11113,7 +11784,11 @@ Call search.py when these control keys occur
                 3 blue rectangles
                 5 orange rectangles
                 5 red rectangles
-                17 green rectangles (the remainder of 30 - others) """
+                17 green rectangles (the remainder of 30 - others)
+
+            Oct. 18 2026 - Create all LEDs hidden when canvas is first painted
+                or resized. Returns dictionary saved in self.vu_meter_leds.
+        """
         num_rect = height / 13  # How many rectangles will fit in height?
         if num_rect < 1:
             num_rect = 1  # Not enough height for rectangles
@@ -11122,18 +11797,14 @@ Call search.py when these control keys occur
         if r_hgt < 1:
             r_hgt = 1  # Not enough height for rectangles
 
-        canvas.delete("rect")  # Remove rectangles from last time
+        canvas.delete("led")  # Remove LEDs for last height
+        canvas.delete("rect")  # Remove blank rectangle
 
         '''
             Create list of rectangle coordinate tuples (y0, y1). x0 and
             x1 will be constant for left side and right side to form a box
             of (x0, y0, x1, y1). The padding for x0 and x1 defaults to 2 from
             canvas border line.
-
-            Future modification will be to have peek hold 1 second.
-            
-            Version after peek hold will have opaque colors between peek hold
-            and current color.
         '''
 
         ''' Generate list of all possible rectangles '''
@@ -11147,18 +11818,9 @@ Call search.py when these control keys occur
 
         num_rect = len(y_list)  # May end up with fewer rectangles
 
-        # print('height:', height, 'number:', num_rect, 'r_hgt_pad:', r_hgt_pad, \
-        #       'r_hgt:', r_hgt, 'pad:', pad, 'y_list', y_list)
-
-        # TODO: Analyze why there is rect_count and num_rect
-        rect_count = int(round(float(bar_height) / height * num_rect))
-        if rect_count > num_rect:
-            rect_count = num_rect  # Fix rounding errors
-        # print('bar_height:', bar_height, 'rect_count:', rect_count)
-
-        ''' Paint the rectangles '''
-        for rect_no in range(1, rect_count):
-
+        ''' Create the rectangles hidden '''
+        items = []
+        for rect_no in range(1, num_rect + 1):
             y0, y1 = y_list[rect_no - 1]
             percent = rect_no * 100 / num_rect
             if percent < 10:
@@ -11171,8 +11833,14 @@ Call search.py when these control keys occur
                 color = 'Orange'
             else:
                 color = 'Red'
-            canvas.create_rectangle(3, y0, self.vu_width - 2, y1, fill=color,
-                                    width=1, outline='black', tag="rect")
+            items.append(canvas.create_rectangle(
+                3, y0, self.vu_width - 2, y1, fill=color, width=1,
+                outline='black', tag="led", state=tk.HIDDEN))
+
+        leds = {'height': height, 'width': self.vu_width, 'items': items,
+                'lit': [False] * num_rect, 'blank': False}
+        self.vu_meter_leds[canvas] = leds
+        return leds
 
     # ==============================================================================
     #
@@ -11185,8 +11853,13 @@ Call search.py when these control keys occur
             return  # Is user editing lyrics?
         self.play_clear_lyrics()  # Reset all fields
 
-        self.lyrics_score, self.lyrics_time_list = \
-            sql.get_lyrics(self.play_make_sql_key())
+        key = self.play_make_sql_key()
+        if self.prefetch_lyrics and self.prefetch_lyrics[0] == key:
+            _key, self.lyrics_score, self.lyrics_time_list = \
+                self.prefetch_lyrics  # Read by play_prefetch()
+        else:
+            self.lyrics_score, self.lyrics_time_list = sql.get_lyrics(key)
+        self.prefetch_lyrics = None  # Lyrics can be edited from now on
         if not self.play_top_is_active:
             return
 
@@ -11497,7 +12170,7 @@ Call search.py when these control keys occur
                 self.info.cast("sql.sqlite3.ProgrammingError: " + artist, 'error', 'update')
                 return
 
-            sql.con.commit()
+            sql.commit()
             # Aug 25 fudge parameter list to skip no_parameters()
             # 2024-05-17 Note MusicId is passed but not used in webscrape.py yet?
             parm = '"' + artist + ' ' + title + '" ' + str(MusicId)
@@ -13138,6 +13811,10 @@ mark set markName index"
         #    pav.set_volume(self.play_ctl.sink, 100)
         self.play_ctl.close()  # If playing song update last access time
         self.loud_ctl.close()  # Simply closes and doesn't update metadata
+        self.play_prefetch_cancel()  # Kill paused ffplay for next song
+        if self.play_sched:
+            self.play_sched.stop()  # play_to_end() returns when unwound
+        self.play_end("closed")
 
         # chron filters changed song index but saved it first
         if self.chron_has_filter:
@@ -13155,6 +13832,9 @@ mark set markName index"
 
         self.play_top_is_active = False  # 2024-05-13 document why now not later...
         ext.kill_pid_running(self.vu_meter_pid)
+        if self.vu_meter_ring:
+            self.vu_meter_ring.close()  # vu_meter.py reuses same ring file
+        self.spin_cache.clear()  # Release PhotoImages while tkinter is alive
 
         # Last known window position for playlist, saved to SQL
         last_playlist_geom = monitor.get_window_geom_string(
@@ -13893,18 +14573,9 @@ TV_MOVE_WITH_COMPIZ = False  # Smooth monitor jump but prone to glitches
             # Get artist in music library and build list of all checked songs
             album = self.lib_tree.parent(iid)
             artist = self.lib_tree.parent(album)  # Get the artist
-            for album in self.lib_tree.get_children(artist):  # Read all albums
-                for song in self.lib_tree.get_children(album):  # Read all songs
-                    # if "checked" in self.lib_tree.item(song)['tags']:
-                    # May 26, 2023 - "checked" brings up many irrelevant songs
-                    if "song_sel" in self.lib_tree.item(song)['tags']:
-                        values = self.lib_tree.item(song)['values']
-                        pretty_no = values[2]  # E.G. "No.__21"
-                        num = ""
-                        for c in pretty_no:
-                            if c.isdigit():
-                                num = num + c  # E.G. Get "21"
-                        self.chron_iid_dict[int(num)] = True
+            # Oct. 18 2026 - Play numbers of "song_sel" songs from self.lib_cat
+            for num in self.lib_cat.numbers(artist):
+                self.chron_iid_dict[num] = True
 
         if option is "time_index":
             for i, iid in enumerate(self.chron_tree.get_children()):
@@ -15797,6 +16468,292 @@ class FineTune:
         self.fine_tune_closed_callback(ret_lyrics_score, ret_time_list)
 
 
+# ==============================================================================
+#
+#       LibCatalog() class. Song totals in arrays instead of lib_tree values
+#
+# ==============================================================================
+class LibCatalog:
+    """ Columnar catalog of songs in Music Location Tree (lib_tree).
+
+        Song iid in lib_tree is str(ndx) where ndx is the index into
+        self.fake_paths, so parallel numpy arrays are indexed by int(iid).
+        Artists and Albums have their own index numbers and every song
+        stores the index of its Album and Artist.
+
+        Totals for Artists, Albums and title bar are added up here with
+        numpy and written into lib_tree columns StatSize, Count, Seconds,
+        SelSize, SelCount and SelSeconds. lib_tree values are not read
+        back to calculate totals.
+
+    Usage:
+
+    cat = LibCatalog(len(self.fake_paths))
+    artist_ndx = cat.add_artist(artist_iid)
+    album_ndx = cat.add_album(album_iid, artist_ndx)
+    cat.add_song(ndx, album_ndx, size, seconds, play_time, music_id)
+    cat.select(song_iid, True, number)  # number is play order, 0 = unknown
+    cat.totals(iid, selected=True)  # [Size, Count, Seconds] song/parent/all
+    cat.parent_totals(selected=True)  # {parent iid: [Size, Count, Seconds]}
+    cat.numbers(artist_iid)  # Play order numbers of selected songs
+    cat.selected_iids()  # Selected songs, deferred ones too
+
+    """
+
+    def __init__(self, count=0):
+        """ :param count: Number of songs in self.fake_paths """
+        self.present = np.zeros(count, dtype=bool)  # Song in lib_tree?
+        self.size = np.zeros(count, dtype=np.int64)  # StatSize
+        self.seconds = np.zeros(count, dtype=np.int64)  # Duration
+        self.play_time = np.zeros(count, dtype=np.float64)  # Last play time
+        self.music_id = np.zeros(count, dtype=np.int64)  # SQL Music Id or 0
+        self.selected = np.zeros(count, dtype=bool)  # "song_sel" tag
+        self.number = np.zeros(count, dtype=np.int32)  # Play order number
+        self.album = np.full(count, -1, dtype=np.int32)  # Album index
+        self.artist = np.full(count, -1, dtype=np.int32)  # Artist index
+        self.album_iids = []  # lib_tree iid for Album index
+        self.artist_iids = []  # lib_tree iid for Artist index
+        self.album_artist = []  # Artist index for Album index
+        self.parents = {}  # {lib_tree iid: ("Album" or "Artist", index)}
+
+    def add_artist(self, iid):
+        """ New Artist inserted into lib_tree. Returns Artist index """
+        self.artist_iids.append(iid)
+        self.parents[iid] = ("Artist", len(self.artist_iids) - 1)
+        return len(self.artist_iids) - 1
+
+    def add_album(self, iid, artist_ndx):
+        """ New Album inserted into lib_tree. Returns Album index """
+        self.album_iids.append(iid)
+        self.album_artist.append(artist_ndx)
+        self.parents[iid] = ("Album", len(self.album_iids) - 1)
+        return len(self.album_iids) - 1
+
+    def add_song(self, ndx, album_ndx, size, seconds, play_time, music_id=0):
+        """ New song inserted into lib_tree with iid=str(ndx) """
+        self.present[ndx] = True
+        self.size[ndx] = size
+        self.seconds[ndx] = seconds
+        self.play_time[ndx] = play_time or 0.0
+        self.music_id[ndx] = music_id or 0
+        self.album[ndx] = album_ndx
+        self.artist[ndx] = self.album_artist[album_ndx]
+
+    def mask(self, iid=None, selected=False):
+        """ Boolean array of songs in lib_tree under iid (Artist or Album),
+            just the song iid or all songs when iid is None. """
+        mask = self.present & self.selected if selected else self.present.copy()
+        if iid is None:
+            return mask
+        if iid in self.parents:
+            level, ndx = self.parents[iid]
+            return mask & ((self.album if level == "Album" else self.artist) == ndx)
+        song = np.zeros(len(mask), dtype=bool)
+        song[int(iid)] = mask[int(iid)]
+        return song
+
+    def totals(self, iid=None, selected=False):
+        """ [Size, Count, Seconds] for song, Album, Artist or all songs """
+        if iid is not None and iid not in self.parents:
+            ndx = int(iid)  # Single song doesn't need a mask
+            on = self.present[ndx] and (self.selected[ndx] or not selected)
+            return [int(self.size[ndx]), 1, int(self.seconds[ndx])] if on \
+                else [0, 0, 0]
+        mask = self.mask(iid, selected)
+        return [int(self.size[mask].sum()), int(mask.sum()),
+                int(self.seconds[mask].sum())]
+
+    def parent_totals(self, selected=False):
+        """ {Artist or Album iid: [Size, Count, Seconds]} in one pass """
+        mask = self.mask(selected=selected)
+        totals = {}
+        for iids, parent in ((self.album_iids, self.album),
+                             (self.artist_iids, self.artist)):
+            count = len(iids)
+            ndx = parent[mask]
+            sizes = np.bincount(ndx, weights=self.size[mask], minlength=count)
+            counts = np.bincount(ndx, minlength=count)
+            seconds = np.bincount(ndx, weights=self.seconds[mask],
+                                  minlength=count)
+            for i, iid in enumerate(iids):
+                totals[iid] = [int(sizes[i]), int(counts[i]), int(seconds[i])]
+        return totals
+
+    def select(self, iid, selected, number=0):
+        """ Set song selected (checked) or not and play order number """
+        ndx = int(iid)
+        self.selected[ndx] = selected
+        self.number[ndx] = number if selected else 0
+
+    def selected_iids(self):
+        """ lib_tree iids of selected songs in lib_tree order, including
+            songs of deferred Albums not inserted yet. Same as
+            lib_tree.tag_has("song_sel") when nothing is deferred. """
+        return tuple(str(ndx) for ndx in
+                     np.nonzero(self.selected & self.present)[0])
+
+    def clear_selected(self):
+        """ All songs unchecked. E.G. before set_all_checks_and_opened() """
+        self.selected[:] = False
+        self.number[:] = 0
+
+    def set_size(self, iid, size):
+        """ Song file size changed. E.G. loudness normalization """
+        self.size[int(iid)] = size
+
+    def numbers(self, iid):
+        """ Play order numbers of selected songs under Artist or Album """
+        return [int(n) for n in self.number[self.mask(iid, selected=True)]
+                if n > 0]
+
+    def remove(self, iid):
+        """ Song, Album or Artist deleted from lib_tree """
+        self.present[self.mask(iid)] = False
+
+
+# ==============================================================================
+#
+#       LibTreeview() class. Albums and Songs inserted when Artist is needed
+#
+# ==============================================================================
+class LibTreeview(CheckboxTreeview):
+    """ Music Location Tree (lib_tree) that can defer Albums and Songs.
+
+        For large locations populate_lib_tree() inserts only Artists and
+        defers their Albums and Songs. An Artist's children are inserted
+        when the Artist is expanded, when any of its items are referenced
+        (item(), set(), see(), parent(), tag_has() or get_children()) or
+        by MusicLocationTree.lib_tree_idle_batch() when lib_top is idle.
+
+        A placeholder child is inserted under each deferred Artist so the
+        expand chevron appears.
+
+    Usage:
+
+    self.lib_tree = LibTreeview(frame2, show=..., columns=...)
+    self.lib_tree.materialize_callback = self.lib_tree_materialized
+    self.lib_tree.defer_album(artist_iid, album_iid, album_text)
+    self.lib_tree.defer_song(artist_iid, song_iid, song_text, values)
+    if artist_iid in self.lib_tree.pending:
+        ...  # Use self.lib_cat, children not in lib_tree yet
+    count = self.lib_tree.materialize(iid)  # Artist, Album, Song or all
+
+    """
+
+    def __init__(self, master=None, **kw):
+        """ Same parameters as CheckboxTreeview() """
+        CheckboxTreeview.__init__(self, master, **kw)
+        self.pending = OrderedDict()  # {Artist iid: [(iid, text, [songs])]}
+        self.pending_owner = {}  # {deferred Album or Song iid: Artist iid}
+        self.materialize_callback = None  # Called with Artist iid
+        self.bind('<<TreeviewOpen>>', self.open_pending, add=True)
+
+    @staticmethod
+    def placeholder(artist):
+        """ iid of "Loading..." child under deferred Artist """
+        return artist + "_pending"
+
+    def defer_album(self, artist, iid, text):
+        """ Album will be inserted under Artist later """
+        if artist not in self.pending:
+            self.pending[artist] = []
+            CheckboxTreeview.insert(
+                self, artist, "end", iid=self.placeholder(artist),
+                text="Loading...", tags=("Pending", "unchecked"),
+                values=("", "", "", 0.0, 0, 0, 0, 0, 0, 0))
+        self.pending[artist].append((iid, text, []))
+        self.pending_owner[iid] = artist
+
+    def defer_song(self, artist, iid, text, values):
+        """ Song will be inserted under last Album deferred for Artist """
+        self.pending[artist][-1][2].append((iid, text, values))
+        self.pending_owner[iid] = artist
+
+    def materialize(self, iid=None):
+        """ Insert deferred Albums and Songs for the Artist owning iid.
+            When iid is None, insert everything deferred.
+            :return: Number of songs inserted """
+        if iid is None:
+            artists = list(self.pending)
+        else:
+            artist = self.pending_owner.get(iid, iid)
+            artists = [artist] if artist in self.pending else []
+
+        count = 0
+        for artist in artists:
+            albums = self.pending.pop(artist)
+            CheckboxTreeview.delete(self, self.placeholder(artist))
+            for album, text, songs in albums:
+                CheckboxTreeview.insert(
+                    self, artist, "end", iid=album, text=text, open=False,
+                    tags=("Album", "unchecked"),
+                    values=("", "", "", 0.0, 0, 0, 0, 0, 0, 0))
+                self.pending_owner.pop(album, None)
+                for song, song_text, values in songs:
+                    CheckboxTreeview.insert(
+                        self, album, "end", iid=song, text=song_text,
+                        tags=("Title", "unchecked"), values=values)
+                    self.pending_owner.pop(song, None)
+                count += len(songs)
+            if self.materialize_callback:
+                self.materialize_callback(artist)
+        return count
+
+    def need(self, iid):
+        """ Deferred Album or Song is about to be referenced """
+        if self.pending_owner and iid in self.pending_owner:
+            self.materialize(iid)
+
+    def open_pending(self, _event):
+        """ <<TreeviewOpen>> is generated before Artist is opened """
+        if self.focus() in self.pending:
+            self.materialize(self.focus())
+
+    def item(self, item, option=None, **kw):
+        """ Insert deferred children when Artist is opened by program """
+        self.need(item)
+        if kw.get('open') and item in self.pending:
+            self.materialize(item)
+        return CheckboxTreeview.item(self, item, option, **kw)
+
+    def set(self, item, column=None, value=None):
+        """ ttk.Treeview.set() after inserting deferred item """
+        self.need(item)
+        return CheckboxTreeview.set(self, item, column, value)
+
+    def see(self, item):
+        """ ttk.Treeview.see() after inserting deferred item """
+        self.need(item)
+        return CheckboxTreeview.see(self, item)
+
+    def parent(self, item):
+        """ ttk.Treeview.parent() after inserting deferred item """
+        self.need(item)
+        return CheckboxTreeview.parent(self, item)
+
+    def tag_has(self, tagname, item=None):
+        """ ttk.Treeview.tag_has() after inserting deferred item """
+        if item is not None:
+            self.need(item)
+        return CheckboxTreeview.tag_has(self, tagname, item)
+
+    def get_children(self, item=None):
+        """ ttk.Treeview.get_children() after inserting deferred children """
+        if item and item in self.pending:
+            self.materialize(item)
+        return CheckboxTreeview.get_children(self, item)
+
+    def delete(self, *items):
+        """ Deleted Artists have nothing left to defer """
+        for item in items:
+            self.need(item)
+            for album, _text, songs in self.pending.pop(item, []):
+                self.pending_owner.pop(album, None)
+                for song in songs:
+                    self.pending_owner.pop(song[0], None)
+        return CheckboxTreeview.delete(self, *items)
+
+
 # ==============================================================================
 #
 #       BatchSelect() class. Speed up processing from .82 second to .15 seconds
@@ -15808,9 +16765,9 @@ class BatchSelect:
 
     Usage:
 
-    bs = BatchSelect(self.lib_tree)
+    bs = BatchSelect(self.lib_tree, self.lib_cat)
     for all songs:
-        adj_list = bs.add_select(song, album, artist, song_number)
+        adj_list = bs.add_select(song, album, artist, number_str, number)
         self.tree_col_range_add(song, 8, adj_list)  # Column number passed
 
     for artist in all artists:
@@ -15826,7 +16783,7 @@ class BatchSelect:
 
     """
 
-    def __init__(self, treeview):
+    def __init__(self, treeview, catalog):
         """
         BatchSelect replaces toggle_select() function on startup.
         Updating is done after thousands of playlist songs are selected in
@@ -15841,16 +16798,19 @@ class BatchSelect:
             Artist (I4)
 
         :param treeview: self.lib_tree
+        :param catalog: self.lib_cat LibCatalog() arrays of song values
         """
         # root window is the parent window
         self.tree = treeview  # self.lib_tree
-        self.totals = {}  # keyed by iid for Artist and Album or 'lib_top_totals'
+        self.catalog = catalog  # Oct. 18 2026 - Totals added up by LibCatalog
+        self.totals = None  # keyed by iid for Artist and Album
         # Data elements are StatSize, Count, Seconds
 
-    def add_select(self, song, album, artist, number_str):
+    def add_select(self, song, album, artist, number_str, number=0):
         """ Toggle song selection on.
             Roll up totals into list of dictionaries.
             DO NOT update parents here. Update parents with batch_update()
+            :param number: Play order number in number_str
         """
         # 0=PlayTime, 1=Size MB, 2=Selected Str, 3=Time, 4=StatSize,
         # 5=Count, 6=Seconds, 7=SelSize, 8=SelCount, 9=SelSeconds
@@ -15874,33 +16834,20 @@ class BatchSelect:
         # noinspection PyProtectedMember
         # self.tree._check_ancestor(song)  # in CheckboxTreeview()
 
-        # Get StatSize, Count and Seconds
-        # adj_list = self.tree.item(song)['values'][total_values]
-        adj_list = self.tree.item(song)['values'][4:7]
-        self.totals_add(album, adj_list)
-        self.totals_add(artist, adj_list)
-        self.totals_add("lib_top_totals", adj_list)
-        return adj_list
-
-    def totals_add(self, iid, add_list):
-        """ Add list of 3 values to values list in dictionary, key = iid
-        """
-        curr_values = self.get_totals(iid)
-
-        for i, add_val in enumerate(add_list):
-            curr_values[i] += add_val
-
-        self.totals[iid] = curr_values
+        # Get StatSize, Count and Seconds from catalog, not treeview values
+        self.catalog.select(song, True, number)
+        self.totals = None  # Add up again on next get_totals()
+        return self.catalog.totals(song)
 
     def get_totals(self, iid):
-        """ Get list of 3 total values in dictionary, key = iid
+        """ Get list of 3 selected total values for Artist or Album iid.
             :param iid: When 'lib_top_totals' used for self.lib_top_totals
         """
-        if iid in self.totals:
-            curr_values = self.totals[iid]  # iid found in totals dictionary
-        else:
-            curr_values = [0, 0, 0]  # Size, Count, Seconds not selected
-        return curr_values
+        if iid == 'lib_top_totals':
+            return self.catalog.totals(selected=True)
+        if self.totals is None:  # All parents added up in one numpy pass
+            self.totals = self.catalog.parent_totals(selected=True)
+        return self.totals.get(iid, [0, 0, 0])  # Size, Count, Seconds
 
 
 # ==============================================================================
@@ -16251,6 +17198,196 @@ TV_MOVE_WITH_COMPIZ = False  # Smooth monitor jump but prone to glitches
             self.close()
 
 
+# ==============================================================================
+#
+#   ArtworkCache() - Extracted and resized artwork kept in location directory
+#
+# ==============================================================================
+class ArtworkCache:
+    """ On-disk artwork cache shared by every FileControl() instance:
+        play window, lib_tree_play(), SQL Music viewer and mus_artwork().
+
+        Files in lc.FNAME_ARTWORK_DIR (~/.local/share/mserve/L999/artwork/):
+
+            <key>.orig      - Artwork as extracted by ffmpeg
+            <key>_WxH.png   - Artwork resized to width x height
+            <key>.none      - Empty. ffmpeg found no artwork in song
+
+        <key> is md5 of song path, file size and modification time so a
+        changed song file is a new key. Old keys are evicted eventually.
+        Each hit updates the file modification time so eviction removes
+        least recently used files first when ARTWORK_CACHE_MB is exceeded.
+    """
+    def __init__(self, max_mb=ARTWORK_CACHE_MB):
+        self.max_bytes = max_mb * 1000000
+        self.dir = None  # Location directory, changes with location
+        self.used = None  # Bytes in self.dir. None = not scanned yet
+        self.hits = self.misses = self.puts = self.evictions = 0
+        self.none_hits = self.none_puts = 0  # Songs without artwork
+
+    def directory(self):
+        """ Return cache directory, creating it when necessary """
+        if not ARTWORK_CACHE:
+            return None
+        if self.dir != lc.FNAME_ARTWORK_DIR:
+            self.dir = lc.FNAME_ARTWORK_DIR
+            self.used = None
+        if not os.path.isdir(self.dir):
+            try:
+                os.makedirs(self.dir)
+            except OSError as err:
+                print("mserve.py ArtworkCache.directory() error:", err)
+                return None
+        return self.dir
+
+    @staticmethod
+    def key(path, size, mtime):
+        """ md5 of file identity """
+        if isinstance(path, bytes):
+            path = path.decode('utf-8', 'replace')  # Python 2 str
+        ident = path + u"|" + str(size) + u"|" + repr(float(mtime))
+        return hashlib.md5(ident.encode('utf-8')).hexdigest()
+
+    def get(self, path, size, mtime, width, height, source=None):
+        """ Return (resized_art, original_art) PIL images or (None, None)
+            when artwork hasn't been put() into cache.
+
+            :param source: Image filename used as original, E.G. ArtworkAlbum.jpg,
+                instead of copy in cache. Only resized image is cached.
+        """
+        resized_art, original_art = self.load(path, size, mtime,
+                                              width, height, source)
+        if resized_art is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return resized_art, original_art
+
+    def load(self, path, size, mtime, width, height, source=None):
+        """ get() and put() without counting hits and misses """
+        cache_dir = self.directory()
+        if cache_dir is None:
+            return None, None
+        base = cache_dir + self.key(path, size, mtime)
+        orig = source if source else base + ".orig"
+        thumb = base + "_" + str(width) + "x" + str(height) + ".png"
+        if not os.path.isfile(orig):
+            return None, None
+
+        try:
+            original_art = Image.open(orig)  # Decoded when first used
+            if os.path.isfile(thumb):
+                resized_art = Image.open(thumb)
+                resized_art.load()
+                os.utime(thumb, None)
+            else:
+                resized_art = original_art.resize((width, height),
+                                                  Image.ANTIALIAS)
+                self.save(thumb, resized_art)
+            if not source:
+                os.utime(orig, None)
+        except (IOError, OSError) as err:  # Truncated or deleted by eviction
+            print("mserve.py ArtworkCache.get() error:", err)
+            self.remove(thumb)
+            if not source:
+                self.remove(orig)
+            return None, None
+
+        return resized_art, original_art
+
+    def is_none(self, path, size, mtime):
+        """ Did put_none() record that song file has no artwork? """
+        cache_dir = self.directory()
+        if cache_dir is None:
+            return False
+        marker = cache_dir + self.key(path, size, mtime) + ".none"
+        if not os.path.isfile(marker):
+            return False
+        self.none_hits += 1
+        return True
+
+    def put_none(self, path, size, mtime):
+        """ Song has no artwork ffmpeg can extract. Changed song file has
+            a new key so it is probed again. """
+        cache_dir = self.directory()
+        if cache_dir is None:
+            return
+        try:
+            open(cache_dir + self.key(path, size, mtime) + ".none", "w").close()
+        except (IOError, OSError) as err:
+            print("mserve.py ArtworkCache.put_none() error:", err)
+            return
+        self.none_puts += 1
+
+    def put(self, path, size, mtime, source, width, height):
+        """ Copy extracted artwork file into cache then load() it """
+        cache_dir = self.directory()
+        if cache_dir is None:
+            return None, None
+        orig = cache_dir + self.key(path, size, mtime) + ".orig"
+        try:
+            shutil.copyfile(source, orig)
+        except (IOError, OSError) as err:
+            print("mserve.py ArtworkCache.put() error:", err)
+            return None, None
+        self.puts += 1
+        self.add(os.path.getsize(orig))
+        return self.load(path, size, mtime, width, height)
+
+    def save(self, thumb, resized_art):
+        """ Save resized artwork. Some modes (E.G. CMYK) can't be PNG """
+        try:
+            resized_art.save(thumb, "PNG")
+        except (IOError, OSError, KeyError) as err:
+            print("mserve.py ArtworkCache.save() error:", err)
+            self.remove(thumb)
+            return
+        self.add(os.path.getsize(thumb))
+
+    def remove(self, fname):
+        """ Remove cache file and subtract size """
+        try:
+            size = os.path.getsize(fname)
+            os.remove(fname)
+        except OSError:
+            return
+        if self.used is not None:
+            self.used -= size
+
+    def add(self, nbytes):
+        """ Track bytes used. Evict least recently used files over cap """
+        if self.used is None:
+            self.used = sum(os.path.getsize(self.dir + name)
+                            for name in os.listdir(self.dir))
+        else:
+            self.used += nbytes
+        if self.used <= self.max_bytes:
+            return
+
+        files = []
+        for name in os.listdir(self.dir):
+            fname = self.dir + name
+            files.append((os.path.getmtime(fname), fname))
+        files.sort()
+        target = self.max_bytes * 9 // 10  # Leave room for 10% new files
+        for _mtime, fname in files:
+            if self.used <= target:
+                break
+            self.remove(fname)
+            self.evictions += 1
+
+    def counts(self):
+        """ Counters for show_debug() """
+        return OrderedDict([
+            ("hits", self.hits), ("misses", self.misses),
+            ("puts", self.puts), ("evictions", self.evictions),
+            ("none hits", self.none_hits), ("none puts", self.none_puts),
+            ("used MB", round((self.used or 0) / 1000000.0, 1))])
+
+
+artwork_cache = ArtworkCache()  # Shared by all FileControl() instances
+
+
 # ==============================================================================
 #
 #   FileControl() Last File Access Time overrides. E.G. Look but do not touch.
@@ -16284,6 +17421,7 @@ class FileControlCommonSelf:
         ''' Fields extracted from Metadata '''
         ''' ID3 TAGS https://exiftool.org/TagNames/ID3.html'''
         self.metadata = None  # Dictionary containing metadata from music file
+        self.metadata_backend = None  # "cache", "mutagen" or "ffprobe"
         self.artwork = []  # List of lines about artwork found
         self.audio = []  # List of lines about audio streams found
         self.valid_audio = None  # len(self.audio) > 0
@@ -16498,7 +17636,31 @@ class FileControl(FileControlCommonSelf):
         self.new_WIP = False  # Signal new requests will be accepted.
         return True  # Needed for mserve.py mus_artwork()
 
-    def get_metadata(self, ffmpeg_results=None, trg_path=None):
+    def prefetch(self, path):
+        """ Like .new() for song that will play next. Metadata is read into
+            sql.meta_cache but access time is not touched and nothing is
+            logged. MusicLocationTree.play_prefetch() is the caller.
+
+        :param path: Full path to music file
+        :return: True when file exists and metadata was read
+        """
+        FileControlCommonSelf.__init__(self)
+        if lcs.host_down or path is None:
+            return False
+
+        self.path = path
+        try:
+            self.stat_start = os.stat(self.path)
+            self.file_exists = True
+        except OSError:  # [Errno 2] No such file or directory
+            self.path = None
+            return False
+
+        self.get_metadata()  # Get all specifications into self.metadata
+        self.check_metadata()  # Get audio and video (artwork) specs
+        return True
+
+    def get_metadata(self, ffmpeg_results=None, trg_path=None, backend=None):
         """ Use ffprobe to write metadata to file self.TMP_FFPROBE
             Loop through self.TMP_FFPROBE lines to create dictionary self.metadata
 
@@ -16507,7 +17669,15 @@ class FileControl(FileControlCommonSelf):
 
             2024-04-12 Add support for ffmpeg_results (normalize loudness).
 
-            TODO: Huge time lag with .oga image of 10 MB inside 30 MB file.
+            Oct. 18 2026 - Use get_mutagen_metadata() first. ffprobe is only
+            called when mutagen can't read the format. Fixes huge time lag
+            with .oga image of 10 MB inside 30 MB file.
+
+            Oct. 18 2026 - sql.meta_cache used when file size and modification
+            time haven't changed since last call.
+
+            :param backend: None = sql.meta_cache then METADATA_BACKEND.
+                "ffprobe" or "mutagen" bypasses cache (benchmark_metadata).
         """
 
         _who = self.who + "get_metadata(): "
@@ -16526,7 +17696,33 @@ class FileControl(FileControlCommonSelf):
         if lcs.host_down:
             return
 
+        use_cache = ffmpeg_results is None and backend is None
+        if use_cache:
+            metadata = sql.meta_cache.get(
+                self.last_path, self.stat_start.st_size,
+                self.stat_start.st_mtime)
+            if metadata:
+                self.metadata = metadata
+                self.metadata_backend = "cache"
+                self.get_metadata_fields(trg_path)
+                return
+
+        backend = METADATA_BACKEND if backend is None else backend
+        if ffmpeg_results is None and backend == "mutagen":
+            ext.t_init("FileControl.get_metadata() - mutagen")
+            read_ok = self.get_mutagen_metadata()
+            ext.t_end('no_print')  # 40 times faster than ffprobe: 0.002
+            if read_ok:
+                self.metadata_backend = "mutagen"
+                if use_cache:
+                    sql.meta_cache.put(
+                        self.last_path, self.stat_start.st_size,
+                        self.stat_start.st_mtime, self.metadata)
+                self.get_metadata_fields(trg_path)
+                return
+
         if ffmpeg_results is None:
+            self.metadata_backend = "ffprobe"
             # print(who + "Calling ffprobe.")
             ext.t_init("FileControl.get_metadata() - ffprobe")
             ''' Problem ffprobe -xerror will crash on good files '''
@@ -16544,59 +17740,6 @@ class FileControl(FileControlCommonSelf):
             # 3-12 - Poison.oga (30 MB with 10 MB image) : 10.9 seconds !!!
             # 3-12 - Poison.oga using kid3 < 1 second
 
-            # print(who + "Calling mutagen.")
-            ext.t_init("FileControl.get_metadata() - mutagen")
-            try:
-                # Song: Heart/GreatestHits/17 Rock and Roll (Live).m4a
-                # Song: /media/rick/SANDISK128/Music/Hello/There/smile.mp3
-                m = mutagen.File(self.last_path)
-                if m:  # .wav files have no metadata
-                    for _line in m:
-                        # print("mutagen line:", _line)  # keys are in lowercase with _ removed
-                        pass
-            except Exception as err:
-                print("Mutagen error on:", self.last_path)
-                print("Exception:", err)
-
-            #   File "/home/rick/python/mserve.py", line 12871, in get_metadata
-            #     m = mutagen.File(self.last_path)
-            #   File "/usr/lib/python2.7/dist-packages/mutagen/_file.py", line 251, in File
-            #     return Kind(filename)
-            #   File "/usr/lib/python2.7/dist-packages/mutagen/_file.py", line 42, in __init__
-            #     self.load(filename, *args, **kwargs)
-            #   File "/usr/lib/python2.7/dist-packages/mutagen/id3/__init__.py", line 1093, in load
-            #     self.info = self._Info(file obj, offset)
-            #   File "/usr/lib/python2.7/dist-packages/mutagen/mp3.py", line 185, in __init__
-            #     self.__try(file obj, offset, size - offset, False)
-            #   File "/usr/lib/python2.7/dist-packages/mutagen/mp3.py", line 223, in __try
-            #     raise HeaderNotFoundError("can't sync to an MPEG frame")
-            # HeaderNotFoundError: can't sync to an MPEG frame
-
-            #     m = mutagen.File(self.last_path, easy=True)
-            #   File "/usr/lib/python2.7/dist-packages/mutagen/_file.py", line 251, in File
-            #     return Kind(filename)
-            #   File "/usr/lib/python2.7/dist-packages/mutagen/_file.py", line 42, in __init__
-            #     self.load(filename, *args, **kwargs)
-            #   File "/usr/lib/python2.7/dist-packages/mutagen/id3/__init__.py", line 1093, in load
-            #     self.info = self._Info(file obj, offset)
-            #   File "/usr/lib/python2.7/dist-packages/mutagen/mp3.py", line 185, in __init__
-            #     self.__try(file obj, offset, size - offset, False)
-            #   File "/usr/lib/python2.7/dist-packages/mutagen/mp3.py", line 223, in __try
-            #     raise HeaderNotFoundError("can't sync to an MPEG frame")
-            # HeaderNotFoundError: can't sync to an MPEG frame
-
-            # print("Mutagen m['title']:", m['title'])
-            # print("Mutagen m['artist']:", m['artist'])
-            # print("Mutagen m['album']:", m['album'])
-            # print("Mutagen m:", m)
-            # {'album':, 'title':, 'artist':, 'bpm':, 'genre':, 'date':,
-            # 'tracknumber': [u'1/11'], 'disc number': [u'2/2']}
-            ext.t_end('no_print')  # 40 times faster than ffprobe: 0.002
-            # Jim Stein man Bad for Good: mutagen: 0.01
-            # Coverart STREAM is in main tag section not in separate
-            # DURATION  is in main tag section not in separate
-            # 'Title' and 'Title(1)' are duplicated
-
             if len(result) > 1:
                 print(_who, 'ffprobe result:', result)
 
@@ -16841,6 +17984,40 @@ Input #0, mov,mp4,m4a,3gp,3g2,mj2, from '/media/rick/SANDISK128/Music/Compilatio
 
 
         '''
+        if use_cache:
+            sql.meta_cache.put(self.last_path, self.stat_start.st_size,
+                               self.stat_start.st_mtime, self.metadata)
+        self.get_metadata_fields(trg_path, ffmpeg_results)
+
+        ''' 2024-04-13 ffmpeg_results containing json dictionary '''
+        if json_dict:
+            self.metadata['json_dict'] = json_dict
+
+        ''' 2024-04-12 print_spam introduced with ffmpeg_results flag '''
+
+        def print_spam(count, text):
+            """ Check if spam error occurred and print. """
+            if count == 0:
+                return
+            print("\tSpammed error '" + text + "' occurred:",
+                  count, "times.")
+            # print("line:", line)  # 2024-04-24 'line' value irrelevant now?
+
+        if spam_err1_cnt or spam_err2_cnt or spam_err3_cnt or \
+                spam_err4_cnt or spam_err5_cnt:
+            print("\n" + _who, "Errors reported by ffmpeg on file:")
+            print(trg_path)
+
+        print_spam(spam_err1_cnt, spam_err1_text)
+        print_spam(spam_err2_cnt, spam_err2_text)
+        print_spam(spam_err3_cnt, spam_err3_text)
+        print_spam(spam_err4_cnt, spam_err4_text)
+        print_spam(spam_err5_cnt, spam_err5_text)
+
+    def get_metadata_fields(self, trg_path=None, ffmpeg_results=None):
+        """ Set self.Title, self.Artist, etc. from self.metadata dictionary
+            filled by ffprobe, ffmpeg_results or get_mutagen_metadata().
+        """
         if trg_path is None:
             path_parts = self.path.split(os.sep)  # In case metadata missing
         else:
@@ -16928,34 +18105,217 @@ Input #0, mov,mp4,m4a,3gp,3g2,mj2, from '/media/rick/SANDISK128/Music/Compilatio
         self.MusicBrainzDiscId = \
             toolkit.uni_str(self.metadata.get('MUSICBRAINZ_DISCID', None))
 
-        if ffmpeg_results is None:
+        if ffmpeg_results is None:  # Not loudness normalization results
             self.OsFileSize = self.stat_start.st_size
             self.OsAccessTime = self.stat_start.st_atime
 
-        ''' 2024-04-13 ffmpeg_results containing json dictionary '''
-        if json_dict:
-            self.metadata['json_dict'] = json_dict
+    def get_mutagen_metadata(self):
+        """ Read tags, duration and streams in-process with mutagen.
+            Fill self.metadata with the same keys ffprobe would create.
 
-        ''' 2024-04-12 print_spam introduced with ffmpeg_results flag '''
+            Returns False when mutagen doesn't support the format, the file
+            is corrupted or there is no duration. Caller then uses ffprobe.
 
-        def print_spam(count, text):
-            """ Check if spam error occurred and print. """
-            if count == 0:
-                return
-            print("\tSpammed error '" + text + "' occurred:",
-                  count, "times.")
-            # print("line:", line)  # 2024-04-24 'line' value irrelevant now?
+            mutagen error on corrupted file instead of ffprobe's stderr:
+                HeaderNotFoundError: can't sync to an MPEG frame
+        """
+        _who = self.who + "get_mutagen_metadata(): "
+        self.metadata = OrderedDict()
+        try:
+            m = mutagen.File(self.last_path)
+        except Exception as err:
+            print(_who + "mutagen error on:", self.last_path)
+            print("Exception:", err)
+            return False
 
-        if spam_err1_cnt or spam_err2_cnt or spam_err3_cnt or \
-                spam_err4_cnt or spam_err5_cnt:
-            print("\n" + _who, "Errors reported by ffmpeg on file:")
-            print(trg_path)
+        if m is None:
+            return False  # Format mutagen can't handle
+        kind = type(m).__name__
+        fmt = MUTAGEN_FORMATS.get(kind, None)
+        length = getattr(m.info, 'length', 0.0)
+        if fmt is None or not length:
+            return False  # Let ffprobe report unknown format or duration
+
+        def uni(value):
+            """ ffprobe output was read from text file. Match str type. """
+            if PYTHON_VER == "2" and isinstance(value, type(u"")):
+                return value.encode('utf-8')
+            return value
+
+        def text(value):
+            """ Convert ID3 frame, MP4 list or Vorbis list to ffprobe value """
+            if hasattr(value, 'text'):
+                value = value.text  # ID3 frame
+            if not isinstance(value, list):
+                value = [value]
+            parts = []
+            for v in value:
+                if isinstance(v, tuple):  # MP4 'trkn' & 'disk' (1, 11)
+                    v = u"/".join(str(i) for i in v if i)
+                elif isinstance(v, bool):  # MP4 'cpil' & 'pgap'
+                    v = u"1" if v else u"0"
+                elif isinstance(v, bytes):  # MP4 '----' freeform
+                    v = v.decode('utf-8', 'replace')
+                elif not isinstance(v, type(u"")):  # ID3TimeStamp, int
+                    v = toolkit.uni_str(str(v))
+                parts.append(v)
+            return uni(u";".join(parts).strip())
+
+        ''' Input #0, Metadata: key/values and Duration: '''
+        self.metadata['INPUT #0'] = uni(fmt + ", from '" + self.last_path + "':")
+        for key, value in (m.tags.items() if m.tags else []):
+            frame_id = key.split(':')[0]
+            if frame_id in MUTAGEN_SKIP or key.upper() in MUTAGEN_SKIP:
+                continue
+            if frame_id == "TXXX" or frame_id == "----":
+                key = key.split(':')[-1]  # ID3 desc or MP4 freeform name
+            elif frame_id == "COMM" and getattr(value, 'desc', ""):
+                continue  # iTunNORM, iTunSMPB, etc. comments
+            else:
+                key = MUTAGEN_KEYS.get(frame_id, key)
+            if key == "CDDB DiscID" or key == "MusicBrainz DiscID":
+                continue  # gstreamer bug - doubled up MP3 tags
+            if key == 'category' or key == 'CATEGORY':
+                key = "discid"  # .m4a 'catg' hijacked, see encoding.py
+            if key == 'keywords' or key == 'KEYWORDS':
+                key = "musicbrainz_discid"  # .m4a 'keyw' hijacked
+            val = text(value)
+            if not key or not val:
+                continue
+            key_unique = toolkit.unique_key(uni(key).upper(), self.metadata)
+            self.metadata[key_unique] = val
+
+        bitrate = self.stat_start.st_size * 8 / length / 1000.0
+        # Same rounding to 1/100 second as ffprobe "Duration: 00:03:59.99"
+        secs, hundredths = divmod(int(length * 100 + 0.5), 100)
+        mins, secs = divmod(secs, 60)
+        hrs, mins = divmod(mins, 60)
+        self.metadata['DURATION'] = \
+            "%02d:%02d:%02d.%02d, start: 0.000000, bitrate: %d kb/s" % \
+            (hrs, mins, secs, hundredths, bitrate)
+
+        ''' STREAM #0:0 audio and STREAM #0:1 artwork (video) '''
+        codec = MUTAGEN_CODECS.get(kind, None)
+        if kind == "WAVE":
+            codec = "pcm_s%dle" % getattr(m.info, 'bits_per_sample', 16)
+        elif codec is None:  # MP4 "mp4a.40.2" or "alac"
+            codec = getattr(m.info, 'codec', "aac")
+            codec = "aac" if codec.startswith("mp4a") else codec
+        rate = getattr(m.info, 'sample_rate', 0)
+        channels = getattr(m.info, 'channels', 0)
+        channels = {1: "mono", 2: "stereo"}.get(
+            channels, str(channels) + " channels")
+        audio = "Audio: " + codec + ", " + str(rate) + " Hz, " + channels
+        if getattr(m.info, 'bitrate', 0):
+            audio += ", " + str(int(m.info.bitrate / 1000)) + " kb/s"
+            self.metadata['BIT_RATE'] = str(int(m.info.bitrate / 1000))
+        self.metadata['AUDIO_RATE'] = str(rate)
+        self.metadata['STREAM #0:0'] = audio
+
+        for i, (data, mime, width, height) in enumerate(self.mutagen_art(m)):
+            codec = "mjpeg" if "jpeg" in mime or "jpg" in mime else \
+                mime.split('/')[-1]
+            if not width:
+                try:  # Only reads image header, not whole image
+                    width, height = Image.open(BytesIO(data)).size
+                except Exception as err:
+                    print(_who + "artwork error:", err)
+            video = "Video: " + codec
+            if width:
+                video += ", " + str(width) + "x" + str(height)
+            self.metadata['STREAM #0:' + str(i + 1)] = video + " (attached pic)"
 
-        print_spam(spam_err1_cnt, spam_err1_text)
-        print_spam(spam_err2_cnt, spam_err2_text)
-        print_spam(spam_err3_cnt, spam_err3_text)
-        print_spam(spam_err4_cnt, spam_err4_text)
-        print_spam(spam_err5_cnt, spam_err5_text)
+        return True
+
+    @staticmethod
+    def mutagen_art(m):
+        """ Return list of (data, mime, width, height) for artwork in
+            mutagen file. width and height are 0 when mutagen doesn't know.
+        """
+        art = []
+        if hasattr(m, 'pictures'):  # FLAC
+            for p in m.pictures:
+                art.append((p.data, p.mime, p.width, p.height))
+        if not m.tags:
+            return art
+        for key, value in m.tags.items():
+            if key.startswith("APIC"):  # MP3
+                art.append((value.data, value.mime, 0, 0))
+            elif key == "covr":  # MP4 imageformat 13 = JPEG, 14 = PNG
+                for c in value:
+                    mime = "image/png" if c.imageformat == 14 else "image/jpeg"
+                    art.append((bytes(c), mime, 0, 0))
+            elif key.upper() == "METADATA_BLOCK_PICTURE":  # OGG
+                for b64 in value:
+                    try:
+                        p = Picture(base64.b64decode(b64))
+                        art.append((p.data, p.mime, p.width, p.height))
+                    except Exception as err:
+                        print("FileControl.mutagen_art() error:", err)
+        return art
+
+    def benchmark_metadata(self, music_dir, limit=100):
+        """ Compare get_metadata() "mutagen" and "ffprobe" backends.
+            Walk music_dir reading up to limit songs with each backend.
+            Print seconds used and songs where key fields are different.
+
+            :param music_dir: Directory of sample music files
+            :param limit: Maximum songs to read. 0 = all songs.
+            :returns: dictionary of results for caller to display
+        """
+        _who = self.who + "benchmark_metadata(): "
+        paths = []
+        for subdir, dirs, files in os.walk(music_dir):
+            dirs.sort()
+            for f in sorted(files):
+                if os.path.splitext(f)[1].lower() in \
+                        (".mp3", ".m4a", ".mp4", ".oga", ".ogg", ".opus",
+                         ".flac", ".wav", ".aif", ".aiff", ".wma"):
+                    paths.append(os.path.join(subdir, f))
+            if limit and len(paths) >= limit:
+                break  # Don't walk entire library
+        if limit:
+            paths = paths[:limit]
+
+        fields = ('Title', 'Artist', 'Album', 'TrackNumber', 'FirstDate',
+                  'Genre', 'EncodingFormat', 'valid_audio', 'valid_artwork')
+        results = OrderedDict([("songs", len(paths)), ("mutagen_secs", 0.0),
+                               ("ffprobe_secs", 0.0), ("fallback", 0),
+                               ("different", 0)])
+        for path in paths:
+            found = {}
+            for backend in ("mutagen", "ffprobe"):
+                self.path = self.last_path = path
+                self.stat_start = os.stat(path)
+                start = time.time()
+                self.get_metadata(backend=backend)
+                results[backend + "_secs"] += time.time() - start
+                if backend == "mutagen" and self.metadata_backend == "ffprobe":
+                    results['fallback'] += 1
+                self.artwork = [v for k, v in self.metadata.items()
+                                if k.startswith("STREAM") and "Video:" in v]
+                self.audio = [v for k, v in self.metadata.items()
+                              if k.startswith("STREAM") and "Audio:" in v]
+                self.valid_artwork = len(self.artwork) > 0
+                self.valid_audio = len(self.audio) > 0
+                found[backend] = [getattr(self, f) for f in fields]
+                found[backend].append(round(self.DurationSecs or 0.0, 1))
+
+            if found["mutagen"] != found["ffprobe"]:
+                results['different'] += 1
+                print(_who + "different:", path)
+                for f, m_val, f_val in zip(fields + ('DurationSecs',),
+                                           found["mutagen"], found["ffprobe"]):
+                    if m_val != f_val:
+                        print("\t", f, "mutagen:", m_val, "ffprobe:", f_val)
+
+        self.path = self.last_path = None  # So .new() doesn't .close()
+        print(_who + "songs:", results['songs'],
+              " mutagen:", round(results['mutagen_secs'], 3),
+              " ffprobe:", round(results['ffprobe_secs'], 3),
+              " fallback:", results['fallback'],
+              " different:", results['different'])
+        return results
 
     def check_metadata(self):
         """ Ensure Audio stream exists. """
@@ -17146,6 +18506,12 @@ Input #0, mov,mp4,m4a,3gp,3g2,mj2, from '/media/rick/SANDISK128/Music/Compilatio
 
             set_artwork_colors()
             lib_tree_play()
+            toolkit.py pretty_meta_row()
+            displayMusicIds()
+
+            Oct. 18 2026 - artwork_cache (ArtworkCache) is checked first.
+                ffmpeg extraction and ArtworkAlbum.xxx resizing are cached.
+                Songs whose metadata has no artwork are cached as well.
         """
 
         _who = self.who + "get_artwork():"
@@ -17156,6 +18522,12 @@ Input #0, mov,mp4,m4a,3gp,3g2,mj2, from '/media/rick/SANDISK128/Music/Compilatio
             # Cannot use "ext" because that is imported module name ("external")
             substitute = self.path.replace(basename, u"ArtworkAlbum." + extension)
             if os.path.isfile(substitute):
+                stat = os.stat(substitute)
+                resized_art, original_art = artwork_cache.get(
+                    substitute, stat.st_size, stat.st_mtime, width, height,
+                    source=substitute)
+                if resized_art is not None:
+                    return ImageTk.PhotoImage(resized_art), resized_art, original_art
                 try:
                     original_art = Image.open(substitute)
                     resized_art = original_art.resize(
@@ -17166,12 +18538,25 @@ Input #0, mov,mp4,m4a,3gp,3g2,mj2, from '/media/rick/SANDISK128/Music/Compilatio
 
         if len(self.artwork) == 0:
             # Song has no artwork that ffmpeg can identify.
+            if self.stat_start and not artwork_cache.is_none(
+                    self.path, self.stat_start.st_size,
+                    self.stat_start.st_mtime):
+                artwork_cache.put_none(self.path, self.stat_start.st_size,
+                                       self.stat_start.st_mtime)
             return None, None, None
 
         ''' Is host down? '''
         if lcs.host_down:
             return None, None, None
 
+        ''' Extracted by ffmpeg before? '''
+        if self.stat_start:
+            resized_art, original_art = artwork_cache.get(
+                self.path, self.stat_start.st_size, self.stat_start.st_mtime,
+                width, height)
+            if resized_art is not None:
+                return ImageTk.PhotoImage(resized_art), resized_art, original_art
+
         # Don't reuse last artwork in temp file
         if os.path.isfile(self.TMP_FFMPEG):
             os.remove(self.TMP_FFMPEG)
@@ -17236,7 +18621,14 @@ Input #0, mov,mp4,m4a,3gp,3g2,mj2, from '/media/rick/SANDISK128/Music/Compilatio
             # /run/user/1000/mserve_ffmpeg.jpg_ftoad0.jpg 2>
             # /run/user/1000/mserve_ffprobe_ftoad0
 
-            return None, None, None
+            return None, None, None  # Error isn't cached. Try again next play
+
+        if self.stat_start:
+            resized_art, original_art = artwork_cache.put(
+                self.path, self.stat_start.st_size, self.stat_start.st_mtime,
+                self.TMP_FFMPEG, width, height)
+            if resized_art is not None:
+                return ImageTk.PhotoImage(resized_art), resized_art, original_art
 
         original_art = Image.open(self.TMP_FFMPEG)
 
@@ -17293,7 +18685,7 @@ Input #0, mov,mp4,m4a,3gp,3g2,mj2, from '/media/rick/SANDISK128/Music/Compilatio
         self.info.cast(text, 'error')
 
     def start(self, start_sec=0.0, limit_sec=0.0, fade_in_sec=0.0,
-              fade_out_sec=0.0, ff_name=None, dead_start=None):
+              fade_out_sec=0.0, ff_name=None, dead_start=None, extra_opt=''):
 
         """ Call start_ffplay() converting parameters to extra_opt format.
 
@@ -17303,6 +18695,7 @@ Input #0, mov,mp4,m4a,3gp,3g2,mj2, from '/media/rick/SANDISK128/Music/Compilatio
         :param fade_out_sec: Number of seconds to fade out
         :param ff_name: Filename containing ffplay output. E.G TMP_CURR_SONG
         :param dead_start: Set to volume to 0 and immediately stop play
+        :param extra_opt: More ffplay options. E.G. ' -volume 0'
         :return self.pid, self.sink:
         """
 
@@ -17319,7 +18712,7 @@ Input #0, mov,mp4,m4a,3gp,3g2,mj2, from '/media/rick/SANDISK128/Music/Compilatio
 
         ''' extra options passed to ffplay for fade-in, etc. '''
 
-        extra_opt = ' -ss ' + str(self.start_sec)  # start position
+        extra_opt = ' -ss ' + str(self.start_sec) + extra_opt  # start position
 
         if self.fade_in_sec > 0.0:
             # noinspection SpellCheckingInspection
@@ -17529,10 +18922,9 @@ Input #0, mov,mp4,m4a,3gp,3g2,mj2, from '/media/rick/SANDISK128/Music/Compilatio
             self.sink = ""
             return 0
 
-        try:
-            # os.kill 2nd parameter with 0 checks if process is active
-            os.kill(self.pid, 0)
-        except OSError:
+        # Oct 18 2026 - ext.launch_command() child must be reaped. A zombie
+        #   still passes os.kill(self.pid, 0) check.
+        if not ext.check_pid_running(self.pid):
             # Do not blank out self.current_song! It controls song_set_ndx('next')
             self.pid = 0
             self.sink = ""
@@ -18743,12 +20135,13 @@ You can also tap the playlist, tap the More button, then tap Delete from Library
         """ Delete Playlist using History Row ID """
         sql.hist_cursor.execute("DELETE FROM History WHERE Id = ?",
                                 [self.act_row_id])
+        sql.config_cache.remove_id(self.act_row_id)
         # Same as location.py Locations().delete_location()
         sql.delete_config("resume", self.act_code)
         sql.delete_config("chron_state", self.act_code)
         sql.delete_config("hockey_state", self.act_code)
         sql.delete_config("open_states", self.act_code)
-        sql.con.commit()
+        sql.commit()
 
     def reset(self, shutdown=False):
         """ Close Playlists Maintenance Window
@@ -23,6 +23,8 @@ warnings.filterwarnings("ignore", "ResourceWarning")  # PIL python 3 unclosed fi
 #           Music - Master table of songs in all locations
 #           History - History table of events and settings
 #           Location - Storage locations with host controls, last song, etc.
+#           MetaCache - FileControl.get_metadata() by (path, size, mtime)
+#           JobQueue - Resumable file operations for location.py
 #
 #       May. 07 2023 - Convert gmtime to localtime. Before today needs update.
 #       Jun. 04 2023 - Use OsFileNameBlacklist() class for reading by song
@@ -40,6 +42,16 @@ warnings.filterwarnings("ignore", "ResourceWarning")  # PIL python 3 unclosed fi
 #       Aug. 24 2024 - SQL Music Table speed boost using OsFileNameIndex
 #       Oct. 20 2024 - Begin adaptation for homa.py - open_homa_db(), etc.
 #       Dec. 08 2024 - homa-indicator.py via monitor.py suppress GObject warn
+#       Oct. 18 2026 - populate_bulk() set-based existence check and insert
+#       Oct. 18 2026 - MetadataCache() for FileControl.get_metadata()
+#       Oct. 18 2026 - MetadataCache() deletes stale rows, caps row count
+#       Oct. 18 2026 - music_page() and hist_page() keyset pagination
+#       Oct. 18 2026 - MusicIdTypeActionIndex for hist_get_music_var(s)()
+#       Oct. 18 2026 - UnitOfWork() batches commits. WAL journal mode.
+#       Oct. 18 2026 - HistoryTally summary table maintained by triggers.
+#       Oct. 18 2026 - ConfigCache() for get_config(), save_config(), Config()
+#       Oct. 18 2026 - MusicSearch FTS5/FTS4 index and music_search()
+#       Oct. 18 2026 - JobQueue() durable queue with throughput and ETA
 
 #   TODO:
 
@@ -131,8 +143,10 @@ import os
 import re
 import json
 import math
+import struct  # music_search_score() FTS4 matchinfo blob
 import time
 import datetime
+import threading  # stat_paths() worker threads
 from collections import OrderedDict
 
 # dist-package?
@@ -201,9 +215,185 @@ SORTED_LIST = START_DIR = lcs = LODICT = None
 PRUNED_DIR = ""  # When needed, the /artist/album/ prepended to build filename
 PRUNED_COUNT = len(PRUNED_DIR)  # Length of prepended path
 
+# Oct 18 2026 - PRAGMAs applied by open_db(). WAL lets homa.py & webscrape.py
+#   read while mserve.py writes and makes each commit one sequential append.
+SQL_JOURNAL_MODE = "WAL"  # Was "DELETE" (sqlite3 default)
+SQL_SYNCHRONOUS = "NORMAL"  # "FULL" fsync each commit, "NORMAL" at checkpoint
+SQL_CACHE_KB = 16000  # Page cache size in KB. sqlite3 default is 2000
+BATCH_ROWS = 500  # UnitOfWork() commits after this many deferred commits
+BATCH = threading.local()  # UnitOfWork() depth, pending & rows per thread
+META_CACHE_ROWS = 50000  # MetadataCache() rows kept in SQL MetaCache Table
+META_CACHE_PRUNE = 100  # MetadataCache.put() calls between prune() checks
+
+# Oct 18 2026 - MusicSearch full-text index. music_search() ranks Title
+#   matches highest then Artist, Album, Composer, Comment and Lyrics.
+FTS_VERSION = None  # "fts5" or "fts4" set by music_search_create()
+FTS_COLUMNS = ["Title", "Artist", "Album", "Composer", "Comment", "Lyrics"]
+FTS_SELECT = "Id, Title, Artist, Album, Composer, Comment, " + \
+             "CAST(LyricsScore AS TEXT)"  # Music Table columns for FTS_COLUMNS
+FTS_WEIGHTS = [10.0, 6.0, 4.0, 2.0, 1.0, 1.0]  # Same order as FTS_COLUMNS
+
+
+def batch_state():
+    """ UnitOfWork() state for current thread. A batch on one thread
+        never defers commit() called by another thread. """
+    if not hasattr(BATCH, 'depth'):
+        BATCH.depth = 0  # Nested UnitOfWork() count. commit() defers when > 0
+        BATCH.pending = 0  # commit() calls deferred in current UnitOfWork()
+        BATCH.rows = BATCH_ROWS  # Outer UnitOfWork() rows limit
+    return BATCH
+
+
+def commit():
+    """ Commit database changes unless inside 'with sql.UnitOfWork():'.
+        Mutators in sql.py (and callers using sql.con) call this instead
+        of con.commit() so bulk jobs pay for one commit per batch. """
+    state = batch_state()
+    if state.depth == 0:
+        con.commit()
+        return
+
+    state.pending += 1
+    if state.rows and state.pending >= state.rows:
+        con.commit()  # Long batch, don't lock out other writers for long
+        state.pending = 0
+
+
+def flush():
+    """ Commit now, even inside 'with sql.UnitOfWork():'. For callers that
+        batch by time as well as by rows, E.G. location.py avo_job_done(). """
+    batch_state().pending = 0
+    con.commit()
+
+
+commit_work = commit  # update_metadata(commit=True) parameter hides commit()
+
+
+class UnitOfWork:
+    """ Defer commits to end of a batch:
+
+            with sql.UnitOfWork():
+                for music_id in music_ids:
+                    sql.hist_add_music_var(music_id, ...)
+
+        Nested units commit when outer unit ends. After 'rows' deferred
+        commits a commit is done anyway. rows=0 defers all to end. When
+        an exception ends the outer unit, uncommitted changes roll back.
+
+        Batch state is per thread. Use in single threaded sections only:
+        sql.con is shared, so a rollback here would also discard writes
+        another thread has not committed yet.
+    """
+    def __init__(self, rows=BATCH_ROWS):
+        self.rows = rows
+
+    def __enter__(self):
+        state = batch_state()
+        if state.depth == 0:
+            state.pending = 0
+            state.rows = self.rows
+        state.depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        state = batch_state()
+        state.depth -= 1
+        if state.depth:
+            return False  # Outer unit commits
+
+        if exc_type is None:
+            con.commit()
+        else:
+            con.rollback()
+        state.pending = 0
+        return False  # Don't suppress exception
+
+
+def benchmark_writes(rows=500):
+    """ Rows/second for common write paths, one commit per row versus one
+        UnitOfWork() batch, with old (DELETE/FULL) and new PRAGMAs.
+
+        Uses a scratch copy of the schema in g.TEMP_DIR. library.db isn't
+        touched. From a terminal:
 
-def populate_tables(SortedList, start_dir, pruned_dir, lodict):
+            python -c "import sql; sql.benchmark_writes()"
+    """
+    global FNAME_LIBRARY, con, cursor, hist_cursor, loc_cursor
+    saved = (FNAME_LIBRARY, con, cursor, hist_cursor, loc_cursor)
+    scratch = g.TEMP_DIR + "mserve_benchmark.db"
+
+    def remove_scratch():
+        """ Database, WAL and shared memory files """
+        for suffix in ("", "-wal", "-shm", "-journal"):
+            if os.path.isfile(scratch + suffix):
+                os.remove(scratch + suffix)
+
+    def hist_add_music_var_path(i):
+        """ hist_add_music_var() lookup then insert """
+        hist_add_music_var(i + 1, 'volume', 'benchmark', SourceMaster="L999",
+                           Target="[1.0, 2.0]", Size=i)
+
+    def save_config_path(i):
+        """ save_config() lookup then update """
+        save_config('benchmark', 'row', Target=str(i), Size=i)
+
+    def update_lyrics_path(i):
+        """ update_lyrics() UPDATE Music by OsFileName """
+        update_lyrics("Artist/Album/Song.m4a", "Lyrics " + str(i), None)
+
+    paths = [("hist_add_music_var", hist_add_music_var_path),
+             ("save_config", save_config_path),
+             ("update_lyrics", update_lyrics_path)]
+    pragmas = [("DELETE", "FULL"), (SQL_JOURNAL_MODE, SQL_SYNCHRONOUS)]
+
+    print("\nsql.py benchmark_writes() -", rows, "rows per test\n")
+    print("Write path".ljust(20), "Journal".ljust(8), "Sync".ljust(7),
+          "Per row commit".rjust(15), "UnitOfWork()".rjust(15))
+    print("-" * 69)
+    try:
+        for journal_mode, synchronous in pragmas:
+            remove_scratch()
+            FNAME_LIBRARY = scratch
+            config_cache.invalidate()  # Rows are from library.db
+            open_db()
+            set_pragmas(con, journal_mode=journal_mode, synchronous=synchronous)
+            cursor.execute("INSERT INTO Music (OsFileName) VALUES (?)",
+                           ["Artist/Album/Song.m4a"])
+            con.commit()
+            for name, func in paths:
+                results = []
+                for batch in (False, True):
+                    hist_cursor.execute("DELETE FROM History")
+                    con.commit()
+                    config_cache.invalidate()  # Cached rows were deleted
+                    start = time.time()
+                    if batch:
+                        with UnitOfWork(rows=0):
+                            for i in range(rows):
+                                func(i)
+                    else:
+                        for i in range(rows):
+                            func(i)
+                    elapsed = time.time() - start
+                    results.append(rows / elapsed if elapsed else 0.0)
+                print(name.ljust(20), journal_mode.ljust(8), synchronous.ljust(7),
+                      ("{:,.0f}".format(results[0]) + " /s").rjust(15),
+                      ("{:,.0f}".format(results[1]) + " /s").rjust(15))
+            close_db()
+    finally:
+        FNAME_LIBRARY, con, cursor, hist_cursor, loc_cursor = saved
+        config_cache.invalidate()  # Rows are from scratch database
+        remove_scratch()
+
+
+def populate_tables(SortedList, start_dir, pruned_dir, lodict, bulk=True):
     """ Create SQL tables out of OS sorted music top directory
+
+        Oct 18/26 - bulk=True uses populate_bulk() with one query for all
+            existing songs and one transaction for all new songs. The original
+            row-by-row method is kept for comparison with bulk=False.
+
+    :returns stats: populate_bulk() counts and phase times, or None
     """
     global NEW_LOCATION, SORTED_LIST, START_DIR, PRUNED_DIR, LODICT
     SORTED_LIST = SortedList
@@ -231,50 +421,13 @@ def populate_tables(SortedList, start_dir, pruned_dir, lodict):
     #open_db()  # July 24, 2023 Note new Locations() class has already opened
     #open_new_db()  # July 13, 2023
 
-    ''' 2024-02-09 Artist & Album not used. 
-    LastArtist = ""         # For control breaks
-    LastAlbum = ""
-    '''
-
-    for i, os_name in enumerate(SORTED_LIST):
-
-        ''' 2024-02-09 Artist & Album not used. 
-        # split '/mnt/music/Artist/Album/Song.m4a' into list
-        base_path = os_name[len(PRUNED_DIR):]
-        groups = base_path.split(os.sep)
-        Artist = groups[0]
-        Album = groups[1]
-        '''
-        key = os_name[len(PRUNED_DIR):]
-
-        ''' 2024-02-09 Artist & Album not used. 
-        if Artist != LastArtist:
-            LastArtist = Artist
-            LastAlbum = ""          # Force sub-total break for Album
-
-        if Album != LastAlbum:
-            LastAlbum = Album
-        '''
-
-        ''' Build full song path from song_list[] '''
-        full_path = os_name
-        full_path = full_path.replace(os.sep + NO_ARTIST_STR, '')
-        full_path = full_path.replace(os.sep + NO_ALBUM_STR, '')
-        sql_key = full_path[len(PRUNED_DIR):]
-
-        ''' June 2, 2023 - Do not store songs with missing artist or album '''
-        if os.sep + NO_ARTIST_STR in key or os.sep + NO_ALBUM_STR in key:
-            ofb.AddBlacklist(sql_key)
-            continue
+    if bulk:
+        return populate_bulk(lcs.get_walk_workers())
 
-        ''' June 10, 2023 - Do not store songs without two os.sep '''
-        if sql_key.count(os.sep) != 2:
-            #print("skipping sql_key without 2 separators:", sql_key)
-            ofb.AddBlacklist(sql_key)
-            continue
+    for key, full_path in populate_keys():
 
         ''' For FTP curlftpfs takes too much time to stat each file '''
-        d = ofb.Select(sql_key)
+        d = ofb.Select(key)
         if d:
             continue  # already in SQL Music Table
 
@@ -297,7 +450,7 @@ def populate_tables(SortedList, start_dir, pruned_dir, lodict):
         cursor.execute(sql, (key, stat.st_atime, stat.st_mtime,
                              stat.st_ctime, stat.st_size))
 
-    con.commit()
+    commit()
     #print(cfg.defaults)
     #cfg.print_windows()  # Just a little test to remove later
 
@@ -320,6 +473,146 @@ def populate_tables(SortedList, start_dir, pruned_dir, lodict):
     ''' TODO: record history totals '''
 
 
+def populate_keys():
+    """ Generator of songs in SORTED_LIST that can be stored in Music Table.
+        Songs under "<No Artist>" or "<No Album>" are blacklisted instead.
+    :returns key, full_path: OsFileName "Artist/Album/99 Song.ext" and path
+    """
+    for os_name in SORTED_LIST:
+
+        ''' 2024-02-09 Artist & Album not used. 
+        # split '/mnt/music/Artist/Album/Song.m4a' into list
+        base_path = os_name[len(PRUNED_DIR):]
+        groups = base_path.split(os.sep)
+        Artist = groups[0]
+        Album = groups[1]
+        '''
+        key = os_name[len(PRUNED_DIR):]
+
+        ''' Build full song path from song_list[] '''
+        full_path = os_name
+        full_path = full_path.replace(os.sep + NO_ARTIST_STR, '')
+        full_path = full_path.replace(os.sep + NO_ALBUM_STR, '')
+        sql_key = full_path[len(PRUNED_DIR):]
+
+        ''' June 2, 2023 - Do not store songs with missing artist or album '''
+        if os.sep + NO_ARTIST_STR in key or os.sep + NO_ALBUM_STR in key:
+            ofb.AddBlacklist(sql_key)
+            continue
+
+        ''' June 10, 2023 - Do not store songs without two os.sep '''
+        if sql_key.count(os.sep) != 2:
+            #print("skipping sql_key without 2 separators:", sql_key)
+            ofb.AddBlacklist(sql_key)
+            continue
+
+        yield key, full_path
+
+
+def populate_bulk(workers=1):
+    """ Bulk mode for populate_tables(). On first scan of a large library
+        the row-by-row method makes tens of thousands of SQL round trips.
+
+        1. Load every OsFileName in Music Table into a set with one query.
+        2. ofb.Select() only songs not in set for renamed file whitelist.
+        3. os.stat() only new songs. Network mounts use worker threads.
+        4. Insert new songs with executemany() inside one transaction.
+
+    :param workers: Files stat'd at once. See Locations.get_walk_workers()
+    :returns stats: OrderedDict of counts and seconds spent in each phase
+    """
+    _who = "sql.py populate_bulk():"
+    stats = OrderedDict()
+    start = time.time()
+
+    ''' Phase 1 - Set of existing songs with one query '''
+    cursor.execute("SELECT OsFileName FROM Music")
+    existing = set(row[0] for row in cursor)
+    stats['select_secs'] = time.time() - start
+
+    ''' Phase 2 - Songs not in SQL Music Table yet '''
+    start = time.time()
+    song_count = 0
+    keys = []
+    full_paths = []
+    for key, full_path in populate_keys():
+        song_count += 1
+        if key in existing:
+            continue  # already in SQL Music Table
+        if ofb.Select(key):
+            continue  # Renamed file found through whitelist
+        keys.append(key)
+        full_paths.append(full_path)
+    stats['check_secs'] = time.time() - start
+
+    ''' Phase 3 - Get file attributes of new songs '''
+    start = time.time()
+    rows = []
+    stat_errors = 0
+    for key, full_path, stat in zip(keys, full_paths,
+                                    stat_paths(full_paths, workers)):
+        if stat is None:
+            print(_who, "Could not stat:", full_path)
+            stat_errors += 1
+            continue
+        rows.append((key, stat.st_atime, stat.st_mtime,
+                     stat.st_ctime, stat.st_size))
+    stats['stat_secs'] = time.time() - start
+
+    ''' Phase 4 - Insert new songs in one transaction '''
+    start = time.time()
+    inserted = 0
+    if rows:
+        sql = "INSERT OR IGNORE INTO Music (OsFileName, \
+               OsAccessTime, OsModifyTime, OsChangeTime, OsFileSize) \
+               VALUES (?, ?, ?, ?, ?)"
+        cursor.executemany(sql, rows)
+        inserted = cursor.rowcount
+    commit()
+    stats['insert_secs'] = time.time() - start
+
+    stats['songs'] = song_count
+    stats['existing'] = song_count - len(keys)
+    stats['stat_errors'] = stat_errors
+    stats['inserted'] = inserted
+    stats['workers'] = workers
+    if inserted:
+        print(_who, "Inserted:", inserted, "rows |",
+              " | ".join([k + ": " + ('{0:.3f}'.format(v) if "secs" in k
+                                      else str(v))
+                          for k, v in stats.items()]))
+    return stats
+
+
+def stat_paths(full_paths, workers=1):
+    """ os.stat() list of paths. Over sshfs or curlftpfs each stat is a
+        network round trip so 'workers' threads stat different files at once.
+    :returns stats: List of os.stat() results, None when file can't be stat'd
+    """
+    results = [None] * len(full_paths)
+
+    def stat_slice(first):
+        """ Stat every workers'th path beginning at first """
+        for i in range(first, len(full_paths), workers):
+            try:
+                results[i] = os.stat(full_paths[i])
+            except OSError:
+                results[i] = None
+
+    workers = max(1, min(int(workers), len(full_paths)))
+    if workers == 1:
+        stat_slice(0)
+        return results
+
+    threads = [threading.Thread(target=stat_slice, args=(i,))
+               for i in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
 def fix_os_last_access():
     """ Last access date corrupted by Nautilus scanning files starting in
         the Fall/Winter 2023.
@@ -502,6 +795,81 @@ ACCESS stat.st_atime : Feb 06 2021 05:00:00 PM < d['OsAccessTime']: Feb 07 2021
     print()  # Give me a little space!
 
 
+def set_pragmas(conn, journal_mode=None, synchronous=None):
+    """ Journal mode, synchronous and cache size for write speed.
+        WAL journal mode is stored in database file. """
+    journal_mode = SQL_JOURNAL_MODE if journal_mode is None else journal_mode
+    synchronous = SQL_SYNCHRONOUS if synchronous is None else synchronous
+    try:
+        conn.execute("PRAGMA journal_mode = " + journal_mode)
+        conn.execute("PRAGMA synchronous = " + synchronous)
+        conn.execute("PRAGMA cache_size = -" + str(SQL_CACHE_KB))
+        conn.execute("PRAGMA temp_store = MEMORY")
+    except sqlite3.OperationalError as err:  # database is locked
+        print("sql.py set_pragmas() error:", err)
+
+
+def hist_tally_sql(row, sign):
+    """ Trigger body to add (sign '+') or subtract (sign '-') History row
+        'NEW' or 'OLD' to HistoryTally. NULL key columns are stored as ''. """
+    where = " WHERE Type = IFNULL(" + row + ".Type, '') " + \
+            "AND Action = IFNULL(" + row + ".Action, '') " + \
+            "AND SourceMaster = IFNULL(" + row + ".SourceMaster, '');"
+    cmd = ""
+    if sign == "+":
+        cmd += "INSERT OR IGNORE INTO HistoryTally VALUES (" + \
+               "IFNULL(" + row + ".Type, ''), IFNULL(" + row + ".Action, ''), " + \
+               "IFNULL(" + row + ".SourceMaster, ''), 0, 0, 0); "
+    cmd += "UPDATE HistoryTally SET RowCount = RowCount " + sign + " 1, " + \
+           "TotalSize = TotalSize " + sign + " IFNULL(" + row + ".Size, 0), " + \
+           "TotalSeconds = TotalSeconds " + sign + \
+           " IFNULL(" + row + ".Seconds, 0)" + where
+    if sign == "-":
+        cmd += " DELETE FROM HistoryTally" + where[:-1] + " AND RowCount <= 0;"
+    return cmd
+
+
+def hist_tally_create():
+    """ HistoryTally summary table has row count, total Size and total
+        Seconds for every History Type, Action and SourceMaster.
+
+        Triggers keep it current for hist_add() and all other INSERT, UPDATE
+        and DELETE on History (webscrape.py, sqlite browser, etc.) so
+        show_debug() and show_sql_summary() never read History rows.
+
+        First time the table is built with GROUP BY. """
+    found = con.execute("SELECT name FROM sqlite_master WHERE type='table' " +
+                        "AND name='HistoryTally'").fetchone()
+    con.execute(
+        "CREATE TABLE IF NOT EXISTS HistoryTally(Type TEXT NOT NULL, " +
+        "Action TEXT NOT NULL, SourceMaster TEXT NOT NULL, RowCount INT, " +
+        "TotalSize INT, TotalSeconds FLOAT, " +
+        "PRIMARY KEY(Type, Action, SourceMaster))")
+    con.execute("CREATE TRIGGER IF NOT EXISTS HistoryTallyInsert " +
+                "AFTER INSERT ON History BEGIN " +
+                hist_tally_sql("NEW", "+") + " END")
+    con.execute("CREATE TRIGGER IF NOT EXISTS HistoryTallyDelete " +
+                "AFTER DELETE ON History BEGIN " +
+                hist_tally_sql("OLD", "-") + " END")
+    con.execute("CREATE TRIGGER IF NOT EXISTS HistoryTallyUpdate " +
+                "AFTER UPDATE OF Type, Action, SourceMaster, Size, Seconds " +
+                "ON History BEGIN " + hist_tally_sql("OLD", "-") + " " +
+                hist_tally_sql("NEW", "+") + " END")
+    if not found:
+        hist_tally_rebuild()
+
+
+def hist_tally_rebuild():
+    """ Recalculate HistoryTally from History Table using GROUP BY. """
+    con.execute("DELETE FROM HistoryTally")
+    con.execute(
+        "INSERT INTO HistoryTally SELECT IFNULL(Type, ''), " +
+        "IFNULL(Action, ''), IFNULL(SourceMaster, ''), count(*), " +
+        "IFNULL(sum(Size), 0), IFNULL(sum(Seconds), 0) FROM History " +
+        "GROUP BY 1, 2, 3")
+    commit()
+
+
 def open_db(LCS=None):
     """ Open SQL Tables - Music Table and History Table
         Create Tables and Indices that don't exist
@@ -515,6 +883,7 @@ def open_db(LCS=None):
         lcs = LCS  # Locations class
 
     con = sqlite3.connect(FNAME_LIBRARY)
+    set_pragmas(con)
 
     # MUSIC TABLE
     """ Version 3 """
@@ -572,8 +941,11 @@ def open_db(LCS=None):
                 "History(Timestamp)")
     con.execute("CREATE INDEX IF NOT EXISTS TypeActionIndex ON " +
                 "History(Type, Action)")
-
-
+    # Oct 18 2026 - hist_get_music_var() direct lookup, no Python filtering
+    con.execute("CREATE INDEX IF NOT EXISTS MusicIdTypeActionIndex ON " +
+                "History(MusicId, Type, Action)")
+    hist_tally_create()  # Oct 18 2026 - Summary of History for show_debug()
+    music_search_create()  # Oct 18 2026 - Full-text index for music_search()
 
     # LOCATION TABLE
     con.execute(
@@ -586,6 +958,23 @@ def open_db(LCS=None):
     con.execute("CREATE UNIQUE INDEX IF NOT EXISTS LocationCodeIndex ON " +
                 "Location(Code)")
 
+    # METADATA CACHE TABLE - FileControl.get_metadata() via MetadataCache()
+    con.execute(
+        "CREATE TABLE IF NOT EXISTS MetaCache(Id INTEGER PRIMARY KEY, " +
+        "OsFileName TEXT, OsFileSize INT, OsModifyTime FLOAT, " +
+        "Metadata TEXT)")
+    con.execute("CREATE UNIQUE INDEX IF NOT EXISTS MetaCacheNameIndex ON " +
+                "MetaCache(OsFileName)")
+
+    # JOB QUEUE TABLE - location.py synchronize and analyze volume via JobQueue()
+    con.execute(
+        "CREATE TABLE IF NOT EXISTS JobQueue(Id INTEGER PRIMARY KEY, " +
+        "Operation TEXT, SourceMaster TEXT, Target TEXT, Path TEXT, " +
+        "Command TEXT, State TEXT, Attempts INT, Size INT, " +
+        "QueueTime FLOAT, StartTime FLOAT, EndTime FLOAT, Bytes INT)")
+    con.execute("CREATE UNIQUE INDEX IF NOT EXISTS JobQueuePathIndex ON " +
+                "JobQueue(Operation, SourceMaster, Target, Path)")
+
 
     ''' For mserve.py rename_file() function to rename "the" to "The" '''
     con.execute("PRAGMA case_sensitive_like = ON;")
@@ -629,6 +1018,7 @@ def check_upgrade(conn):
     cursor = con.cursor()
     hist_cursor = con.cursor()
     loc_cursor = con.cursor()
+    config_cache.invalidate()  # Configuration rows read on first use
 
     ''' Functions to fix errors in SQL database '''
     #fd = FixData("Fri Aug 18 23:59:59 2023")  # Cutoff time for selections
@@ -659,7 +1049,7 @@ def check_upgrade(conn):
 def set_db_version(version=3):
     """ Set the user_version when database is created. """
     cursor.execute("PRAGMA user_version = {v:d}".format(v=version))
-    con.commit()
+    commit()
 
 
 # noinspection SpellCheckingInspection
@@ -967,6 +1357,8 @@ def open_new_db():
                     "History(Timestamp)")
     new_con.execute("CREATE INDEX IF NOT EXISTS TypeActionIndex ON " +
                     "History(Type, Action)")
+    new_con.execute("CREATE INDEX IF NOT EXISTS MusicIdTypeActionIndex ON " +
+                    "History(MusicId, Type, Action)")
 
     # LOCATION TABLE
     new_con.execute("CREATE TABLE IF NOT EXISTS Location(Id INTEGER PRIMARY KEY, " +
@@ -993,6 +1385,7 @@ def open_homa_db():
 
     global con, cursor, hist_cursor, loc_cursor, lcs
     con = sqlite3.connect(FNAME_LIBRARY)
+    set_pragmas(con)
 
     # HISTORY TABLE
     """ Version 3 """
@@ -1011,6 +1404,10 @@ def open_homa_db():
                 "History(Timestamp)")
     con.execute("CREATE INDEX IF NOT EXISTS TypeActionIndex ON " +
                 "History(Type, Action)")
+    # Oct 18 2026 - hist_get_music_var() direct lookup, no Python filtering
+    con.execute("CREATE INDEX IF NOT EXISTS MusicIdTypeActionIndex ON " +
+                "History(MusicId, Type, Action)")
+    hist_tally_create()
 
     ''' For mserve.py rename_file() function to rename "the" to "The" '''
     con.execute("PRAGMA case_sensitive_like = ON;")
@@ -1025,6 +1422,7 @@ def open_homa_db():
     con.row_factory = sqlite3.Row
     #cursor = con.cursor()
     hist_cursor = con.cursor()  # 2024-10-20 - Only cursor in homa.py
+    config_cache.invalidate()
     #loc_cursor = con.cursor()
 
 
@@ -1294,7 +1692,7 @@ class OsFileNameBlacklist:
             renamed_path = this_topdir + os.sep + white_key
             self.RenameFileGroup(original_path, renamed_path,
                                  music_id=music_id, ndx=i)
-        con.commit()  # Write to disk
+        commit()  # Write to disk
 
     def RenameFileGroup(self, old_path, new_path, level=None,
                         music_id=None, ndx=None):
@@ -1352,6 +1750,7 @@ class OsFileNameBlacklist:
             if e != '':
                 continue  # '.old' or '.new' filename extension
 
+            meta_cache.delete(old_path)  # Renamed file has new path
             comment = "File renamed." if file_exists else \
                 "Nothing to rename. File doesn't exist."
             hist_add(time.time(), music_id, g.USER, 'rename', level_log,
@@ -1395,6 +1794,7 @@ class OsFileNameBlacklist:
             if e != '':
                 continue  # '.old' or '.new' file extension
 
+            meta_cache.delete(old_path)
             comment = "File deleted." if file_exists else \
                 "Nothing to delete. File doesn't exist."
             hist_add(time.time(), music_id, g.USER, 'delete', level_log,
@@ -1409,6 +1809,279 @@ class OsFileNameBlacklist:
 ofb = OsFileNameBlacklist()
 
 
+class MetadataCache:
+    """ Cache of FileControl.get_metadata() self.metadata dictionaries.
+
+        Key is (OsFileName, OsFileSize, OsModifyTime). When a song file
+        hasn't changed since it was last probed, mutagen and ffprobe are
+        skipped. OsFileName is the full path because the same Artist/Album/
+        Title can exist in many locations with different encoding.
+
+        Recently used dictionaries are kept in memory (LRU) in front of the
+        SQL MetaCache Table so replaying a song doesn't read SQL either.
+
+        USAGE:
+
+        meta_cache = MetadataCache()
+        metadata = meta_cache.get(path, size, mtime) returns None when the
+            path isn't cached or the file changed since it was cached. The
+            changed file's row is deleted.
+        meta_cache.put(path, size, mtime, metadata) saves to SQL and LRU.
+        meta_cache.delete(path) after file renamed or deleted.
+        meta_cache.prune() keeps newest 'max_rows' rows. Called by put().
+        meta_cache.mem_hits, .sql_hits, .misses, .stale, .puts, .pruned
+            counters.
+
+        Rows for files deleted or moved outside of mserve are never looked
+        up again. prune() deletes them once they are the oldest rows.
+    """
+
+    def __init__(self, lru_size=200, max_rows=META_CACHE_ROWS):
+        self.lru = OrderedDict()  # {path: (size, mtime, metadata)}
+        self.lru_size = lru_size  # Maximum dictionaries kept in memory
+        self.max_rows = max_rows  # Maximum rows in SQL MetaCache Table
+        self.mem_hits = 0  # Found in memory
+        self.sql_hits = 0  # Found in SQL MetaCache Table
+        self.misses = 0  # Not cached at all
+        self.stale = 0  # Cached but size or modification time changed
+        self.puts = 0  # Dictionaries saved
+        self.pruned = 0  # Oldest rows deleted by prune()
+        self.who = "sql.py MetadataCache()."
+
+    def get(self, path, size, mtime):
+        """ Return copy of metadata dictionary or None """
+        entry = self.lru.pop(path, None)
+        in_memory = entry is not None
+        if not in_memory:
+            sql_cmd = "SELECT OsFileSize, OsModifyTime, Metadata FROM " + \
+                      "MetaCache WHERE OsFileName = ?"
+            row = con.execute(sql_cmd, (path,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            try:
+                entry = (row[0], row[1],
+                         json.loads(row[2], object_pairs_hook=OrderedDict))
+            except ValueError:
+                print(self.who + "get() bad json for:", path)
+                self.misses += 1
+                return None
+
+        if entry[0] != size or entry[1] != mtime:
+            self.stale += 1  # File changed. Caller puts new metadata
+            self.delete(path)  # In case file isn't probed again
+            return None
+
+        if in_memory:
+            self.mem_hits += 1
+        else:
+            self.sql_hits += 1
+        self.lru[path] = entry  # Most recently used is last
+        while len(self.lru) > self.lru_size:
+            self.lru.popitem(last=False)  # Least recently used is first
+        return OrderedDict(entry[2])
+
+    def put(self, path, size, mtime, metadata):
+        """ Save metadata dictionary to LRU and SQL MetaCache Table """
+        if not metadata:
+            return
+        self.lru.pop(path, None)
+        self.lru[path] = (size, mtime, OrderedDict(metadata))
+        while len(self.lru) > self.lru_size:
+            self.lru.popitem(last=False)  # Least recently used is first
+
+        sql_cmd = "INSERT OR REPLACE INTO MetaCache (OsFileName, " + \
+                  "OsFileSize, OsModifyTime, Metadata) VALUES (?, ?, ?, ?)"
+        con.execute(sql_cmd, (path, size, mtime, json.dumps(metadata)))
+        commit()
+        self.puts += 1
+        if self.puts % META_CACHE_PRUNE == 0:
+            self.prune()
+
+    def prune(self):
+        """ Delete oldest rows over 'max_rows'. INSERT OR REPLACE gives
+            each put() a new Id, so lowest Ids were saved longest ago. """
+        sql_cmd = "SELECT Id FROM MetaCache ORDER BY Id DESC LIMIT 1 OFFSET ?"
+        row = con.execute(sql_cmd, (self.max_rows,)).fetchone()
+        if row is None:
+            return 0  # Not over the limit
+        count = con.execute("DELETE FROM MetaCache WHERE Id <= ?",
+                            (row[0],)).rowcount
+        commit()
+        self.pruned += count  # LRU copies are still checked by size & mtime
+        return count
+
+    def delete(self, path):
+        """ Remove path from LRU and SQL MetaCache Table """
+        self.lru.pop(path, None)
+        con.execute("DELETE FROM MetaCache WHERE OsFileName = ?", (path,))
+        commit()
+
+    def counts(self):
+        """ Return counters in dictionary for mserve.py show_debug() """
+        lookups = self.mem_hits + self.sql_hits + self.misses + self.stale
+        hits = self.mem_hits + self.sql_hits
+        return OrderedDict([
+            ("lookups", lookups), ("mem_hits", self.mem_hits),
+            ("sql_hits", self.sql_hits), ("misses", self.misses),
+            ("stale", self.stale), ("puts", self.puts),
+            ("pruned", self.pruned),
+            ("hit_percent", round(hits * 100.0 / lookups, 1) if lookups else 0.0),
+            ("lru_count", len(self.lru)), ("lru_size", self.lru_size)])
+
+
+''' Global FileControl.get_metadata() cache '''
+meta_cache = MetadataCache()
+
+
+class JobQueue:
+    """ Durable queue of file operations in SQL JobQueue Table.
+
+        One row per file for an Operation ('synchronize', 'detect_old',
+        'loudnorm_1', 'loudnorm_2', 'detect_new') between SourceMaster
+        location code and Target location code. Rows hold State ('queued',
+        'running', 'done' or 'failed'), Attempts, QueueTime, StartTime,
+        EndTime, Size and Bytes so a run interrupted by a crash, power
+        failure or close button resumes where it left off.
+
+        USAGE:
+
+        jobs = sql.JobQueue('synchronize', lcs.open_code, lcs.act_code)
+        with sql.UnitOfWork():  # One commit for all files
+            todo = [f for f in files if jobs.enqueue(*f)]  # False = done
+        for path, command, size, mtime in todo:
+            jobs.start(path)
+            ... run command ...
+            jobs.finish(path, ok, size)
+        jobs.stats() returns files/s, MB/s and ETA for progress display.
+        jobs.purge() when all jobs ran. Failed rows are kept for next run.
+
+        A 'running' row found at startup was interrupted and is run again.
+        A 'done' row with the same command and size is skipped by enqueue()
+        unless the file was modified after the job ended.
+    """
+
+    def __init__(self, operation, source, target=""):
+        self.operation = operation  # 'synchronize', 'loudnorm_1', etc.
+        self.source = source  # Location code, EG "L001"
+        self.target = target if target else ""  # Other location code
+        self.key = (operation, source, self.target)
+        self.session_start = time.time()  # stats() throughput since then
+        self.skipped = 0  # enqueue() found job done in an earlier session
+        self.who = "sql.py JobQueue()."
+
+    def enqueue(self, path, command, size=0, mtime=0):
+        """ Add or reset job for path. Commit is deferred when called
+            inside 'with sql.UnitOfWork():'
+        :param size: File size in bytes. Different size runs job again.
+        :param mtime: File modification time. When newer than the time
+            the job ended, the file changed since and job runs again.
+        :returns: False when same command is already done, else True """
+        sql_cmd = "SELECT Id, State, Command, Size, EndTime FROM JobQueue " + \
+                  "WHERE Operation = ? AND SourceMaster = ? AND Target = ? " + \
+                  "AND Path = ?"
+        row = con.execute(sql_cmd, self.key + (path,)).fetchone()
+        if row and row[1] == 'done' and row[2] == command and \
+                (row[3] or 0) == size and \
+                (not mtime or not row[4] or float(mtime) <= row[4]):
+            self.skipped += 1
+            return False
+
+        now = time.time()
+        if row:
+            sql_cmd = "UPDATE JobQueue SET Command = ?, State = 'queued', " + \
+                      "Size = ?, QueueTime = ?, StartTime = NULL, " + \
+                      "EndTime = NULL, Bytes = 0 WHERE Id = ?"
+            con.execute(sql_cmd, (command, size, now, row[0]))
+        else:
+            sql_cmd = "INSERT INTO JobQueue (Operation, SourceMaster, " + \
+                      "Target, Path, Command, State, Attempts, Size, " + \
+                      "QueueTime, Bytes) VALUES (?, ?, ?, ?, ?, 'queued', " + \
+                      "0, ?, ?, 0)"
+            con.execute(sql_cmd, self.key + (path, command, size, now))
+        commit()
+        return True
+
+    def start(self, path, start_time=None):
+        """ Job for path is running now. Attempts are counted. """
+        sql_cmd = "UPDATE JobQueue SET State = 'running', " + \
+                  "Attempts = Attempts + 1, StartTime = ?, EndTime = NULL " + \
+                  "WHERE Operation = ? AND SourceMaster = ? AND Target = ? " + \
+                  "AND Path = ?"
+        start_time = start_time if start_time else time.time()
+        con.execute(sql_cmd, (start_time,) + self.key + (path,))
+        commit()
+
+    def finish(self, path, ok, bytes_done=0, end_time=None):
+        """ Job for path ended. State is 'done' when ok else 'failed' """
+        sql_cmd = "UPDATE JobQueue SET State = ?, EndTime = ?, Bytes = ? " + \
+                  "WHERE Operation = ? AND SourceMaster = ? AND Target = ? " + \
+                  "AND Path = ?"
+        end_time = end_time if end_time else time.time()
+        state = 'done' if ok else 'failed'
+        con.execute(sql_cmd, (state, end_time, bytes_done) + self.key + (path,))
+        commit()
+
+    def interrupted(self):
+        """ Count of jobs left 'queued' or 'running' by an earlier session """
+        sql_cmd = "SELECT count(*) FROM JobQueue WHERE Operation = ? AND " + \
+                  "SourceMaster = ? AND Target = ? AND " + \
+                  "State IN ('queued', 'running') AND QueueTime < ?"
+        return con.execute(sql_cmd, self.key + (self.session_start,)
+                           ).fetchone()[0]
+
+    def stats(self):
+        """ Counts by State and throughput of jobs ended this session.
+
+            Elapsed is first StartTime to last EndTime so jobs run at the
+            same time by FfmpegPool() aren't counted twice. ETA is based on
+            bytes remaining when sizes are known, else on files remaining.
+        """
+        sql_cmd = "SELECT State, count(*), IFNULL(sum(Size), 0) FROM " + \
+                  "JobQueue WHERE Operation = ? AND SourceMaster = ? " + \
+                  "AND Target = ? GROUP BY State"
+        counts = {'queued': 0, 'running': 0, 'done': 0, 'failed': 0}
+        remaining_size = 0
+        for state, count, size in con.execute(sql_cmd, self.key):
+            counts[state] = count
+            if state in ('queued', 'running'):
+                remaining_size += size
+
+        sql_cmd = "SELECT count(*), IFNULL(sum(Bytes), 0), min(StartTime), " + \
+                  "max(EndTime) FROM JobQueue WHERE Operation = ? AND " + \
+                  "SourceMaster = ? AND Target = ? AND " + \
+                  "State IN ('done', 'failed') AND StartTime >= ?"
+        files, bytes_done, first, last = con.execute(
+            sql_cmd, self.key + (self.session_start,)).fetchone()
+        elapsed = last - first if first and last and last > first else 0.0
+
+        remaining = counts['queued'] + counts['running']
+        files_per_sec = files / elapsed if elapsed else 0.0
+        bytes_per_sec = bytes_done / elapsed if elapsed else 0.0
+        if bytes_per_sec and remaining_size:
+            eta = remaining_size / bytes_per_sec
+        elif files_per_sec:
+            eta = remaining / files_per_sec
+        else:
+            eta = None  # Nothing ended yet
+
+        return OrderedDict([
+            ("queued", counts['queued']), ("running", counts['running']),
+            ("done", counts['done']), ("failed", counts['failed']),
+            ("remaining", remaining), ("skipped", self.skipped),
+            ("session_files", files), ("session_bytes", bytes_done),
+            ("elapsed", elapsed), ("files_per_sec", files_per_sec),
+            ("mb_per_sec", bytes_per_sec / 1000000.0), ("eta", eta)])
+
+    def purge(self):
+        """ All jobs ran. Delete all but 'failed' rows so next run starts
+            fresh. Failed rows keep Attempts for next run. """
+        sql_cmd = "DELETE FROM JobQueue WHERE Operation = ? AND " + \
+                  "SourceMaster = ? AND Target = ? AND State != 'failed'"
+        con.execute(sql_cmd, self.key)
+        commit()
+
+
 def update_lyrics(key, lyrics, time_index):
     """
         Apply Unsynchronized Lyrics and Lyrics Time Index.
@@ -1427,7 +2100,8 @@ def update_lyrics(key, lyrics, time_index):
         # print('Saving', count, 'lines of time_index:', time_index)
 
     cursor.execute(sql, (lyrics, time_index, key))
-    con.commit()
+    music_search_update(key)
+    commit()
 
 
 def get_lyrics(key):
@@ -1469,7 +2143,7 @@ def update_last_play(key, play_count, last_play_time):
     sql = "UPDATE Music INDEXED BY OsFileNameIndex " +\
           "SET PlayCount=?, LastPlayTime=? WHERE OsFileName = ?"
     cursor.execute(sql, (play_count, last_play_time, key))
-    con.commit()
+    commit()
 
 
 def get_last_play(key):
@@ -1503,6 +2177,166 @@ def music_get_row(key, print_err=True):
         return None
 
 
+def music_page(last_name=None, limit=200):
+    """ Next 'limit' Music Table rows in OsFileName order after 'last_name'.
+        Keyset pagination using OsFileNameIndex, time doesn't grow with
+        number of rows already read. Used by DictTreeview.page_init() """
+    if last_name is None:
+        cursor.execute("SELECT * FROM Music INDEXED BY OsFileNameIndex \
+                       ORDER BY OsFileName LIMIT ?", [limit])
+    else:
+        cursor.execute("SELECT * FROM Music INDEXED BY OsFileNameIndex \
+                       WHERE OsFileName > ? ORDER BY OsFileName LIMIT ?",
+                       [last_name, limit])
+    return cursor.fetchall()
+
+
+def music_rows(ids):
+    """ Music Table rows for list of Music Ids in OsFileName order.
+        Used by DictTreeview.page_ids() for search results not paged in. """
+    rows = []
+    for i in range(0, len(ids), 500):  # SQLite limit on host parameters
+        chunk = ids[i:i + 500]
+        cursor.execute("SELECT * FROM Music WHERE Id IN (" +
+                       ",".join("?" * len(chunk)) + ")", chunk)
+        rows += cursor.fetchall()
+    rows.sort(key=lambda row: row['OsFileName'])
+    return rows
+
+
+def music_search_create():
+    """ MusicSearch full-text index of Title, Artist, Album, Composer,
+        Comment and Lyrics. rowid is Music Id. FTS5 when SQLite has it,
+        else FTS4. FTS_VERSION stays None when neither is compiled in.
+
+        Kept current by update_metadata(), update_lyrics() and rename
+        through music_search_update(). Built first time from Music Table. """
+    global FTS_VERSION
+    FTS_VERSION = None
+    found = con.execute("SELECT sql FROM sqlite_master WHERE type='table' " +
+                        "AND name='MusicSearch'").fetchone()
+    if found:
+        FTS_VERSION = "fts5" if "fts5" in found[0].lower() else "fts4"
+        try:
+            con.execute("SELECT rowid FROM MusicSearch LIMIT 1")
+        except sqlite3.OperationalError as err:  # no such module: fts5
+            print("sql.py music_search_create() index unusable:", err)
+            FTS_VERSION = None
+        return
+
+    for version in ("fts5", "fts4"):
+        try:
+            con.execute("CREATE VIRTUAL TABLE MusicSearch USING " + version +
+                        "(" + ", ".join(FTS_COLUMNS) + ")")
+            FTS_VERSION = version
+            break
+        except sqlite3.OperationalError:  # no such module
+            continue
+
+    if FTS_VERSION is None:
+        print("sql.py music_search_create() SQLite has no FTS5 or FTS4.")
+        return
+    music_search_rebuild()
+
+
+def music_search_rebuild():
+    """ Recreate MusicSearch rows from every Music Table row. """
+    if FTS_VERSION is None:
+        return
+    con.execute("DELETE FROM MusicSearch")
+    con.execute("INSERT INTO MusicSearch (rowid, " + ", ".join(FTS_COLUMNS) +
+                ") SELECT " + FTS_SELECT + " FROM Music")
+    commit()
+
+
+def music_search_update(key=None, music_id=None):
+    """ Reindex one Music Table row after Title, Artist, Album, Composer,
+        Comment or LyricsScore changed. Pass OsFileName key or Music Id.
+        Caller commits. """
+    if FTS_VERSION is None:
+        return
+    where = " WHERE OsFileName = ?" if music_id is None else " WHERE Id = ?"
+    value = key if music_id is None else music_id
+    try:
+        con.execute("DELETE FROM MusicSearch WHERE rowid IN " +
+                    "(SELECT Id FROM Music" + where + ")", (value,))
+        con.execute("INSERT INTO MusicSearch (rowid, " +
+                    ", ".join(FTS_COLUMNS) + ") SELECT " + FTS_SELECT +
+                    " FROM Music" + where, (value,))
+    except sqlite3.OperationalError as err:
+        print("sql.py music_search_update() error:", err, key, music_id)
+
+
+def music_search_query(text, any_word=False):
+    """ Convert words typed into MATCH expression. Each word is a quoted
+        prefix term, all words must match unless any_word is True.
+        Returns "" when no words. """
+    terms = []
+    for word in text.split():
+        if not any(c.isalnum() for c in word):
+            continue  # E.G. "&" in "Simon & Garfunkel" isn't indexed
+        word = word.replace('"', '""')
+        if FTS_VERSION == "fts5":
+            terms.append('"' + word + '"*')
+        else:
+            terms.append('"' + word + '*"')
+    return (" OR " if any_word else " ").join(terms)
+
+
+def music_search(text, limit=None, any_word=False):
+    """ Music Ids matching all words in text, best match first. When
+        any_word is True, Music Ids matching at least one word.
+        Title matches outrank Artist, Album, Composer, Comment then Lyrics
+        matches (FTS_WEIGHTS). Returns None when there is no full-text index
+        so caller can search another way.
+
+        ids = sql.music_search("thunder acdc")
+        ids = sql.music_search("thunder acdc", any_word=True)
+    """
+    if FTS_VERSION is None:
+        return None
+    match = music_search_query(text, any_word)
+    if not match:
+        return []
+
+    # Songs deleted from Music Table since they were indexed are skipped.
+    # JOIN not "rowid IN (SELECT Id FROM Music)" which reruns MATCH per row.
+    join = " FROM MusicSearch JOIN Music ON Music.Id = MusicSearch.rowid " + \
+           "WHERE MusicSearch MATCH ?"
+    try:
+        if FTS_VERSION == "fts5":
+            weights = ", ".join(str(w) for w in FTS_WEIGHTS)
+            cmd = "SELECT MusicSearch.rowid" + join + \
+                  " ORDER BY bm25(MusicSearch, " + weights + ")"
+            if limit:
+                cmd += " LIMIT " + str(int(limit))
+            return [row[0] for row in con.execute(cmd, (match,))]
+
+        cmd = "SELECT MusicSearch.rowid, matchinfo(MusicSearch, 'pcx')" + join
+        scored = [(-music_search_score(info), Id) for Id, info
+                  in con.execute(cmd, (match,))]
+    except sqlite3.OperationalError as err:  # E.G. fts5: syntax error
+        print("sql.py music_search() error:", err, "MATCH:", match)
+        return []
+    scored.sort()
+    ids = [Id for _score, Id in scored]
+    return ids[:limit] if limit else ids
+
+
+def music_search_score(info):
+    """ Relevance from FTS4 matchinfo 'pcx' blob. For each phrase and
+        column: hits in this row / hits in all rows, times column weight. """
+    ints = struct.unpack("=" + str(len(info) // 4) + "I", bytes(info))
+    phrases, columns = ints[0], ints[1]
+    score = 0.0
+    for p in range(phrases):
+        for c in range(columns):
+            base = 2 + 3 * (p * columns + c)
+            if ints[base]:  # Hits this row / hits all rows
+                score += FTS_WEIGHTS[c] * ints[base] / float(ints[base + 1])
+    return score
+
+
 def music_update_stat(key, full_path):
     """ Update Music records OS access times and size. 
         Assume duration is the same as before. Called by mserve.py
@@ -1627,6 +2461,32 @@ def update_metadata(fc, commit=True):
     fc.PlayCount = d['PlayCount']  # How many times 80% + was played
     fc.LastPlayTime = d['LastPlayTime']  # Time last played (float)
 
+    ''' Oct 18 2026 - Only ffprobe reports MAJOR_BRAND, MINOR_BRAND and
+        COMPATIBLE_BRANDS, and mutagen's length can differ from ffprobe's
+        container Duration. When metadata came from mutagen (or from
+        meta_cache), keep what ffprobe stored instead of blanking it.
+        Stored values are only kept when song file size and modification
+        time match the Music row. Otherwise the song file changed after
+        it was probed, so it is probed again. '''
+    stat = getattr(fc, 'stat_start', None)
+    if getattr(fc, 'metadata_backend', None) in ("mutagen", "cache") and \
+            d['Duration']:
+        if stat and d['OsFileSize'] == stat.st_size and \
+                d['OsModifyTime'] == stat.st_mtime:
+            fc.ffMajor = d['ffMajor']
+            fc.ffMinor = d['ffMinor']
+            fc.ffCompatible = d['ffCompatible']
+            fc.Duration = d['Duration']
+            fc.DurationSecs = d['Seconds']
+        else:
+            fc.get_metadata(backend="ffprobe")  # Bypasses meta_cache
+            if commit and stat:
+                # Next time stored values match song file and are kept
+                sql = "UPDATE Music INDEXED BY OsFileNameIndex SET \
+                       OsFileSize=?, OsModifyTime=? WHERE OsFileName = ?"
+                cursor.execute(sql, (stat.st_size, stat.st_mtime, key))
+                commit_work()
+
     ''' Adding a new 'init' or 'edit' history record? '''
     if d['Artist'] is None:
         action = 'init'  # music file has never been played in mserve
@@ -1740,7 +2600,8 @@ def update_metadata(fc, commit=True):
               fc.AlbumArtist, fc.AlbumDate, fc.FirstDate, fc.DiscNumber,
               fc.TrackNumber, fc.Genre, fc.Composer, fc.Comment, fc.Duration,
               fc.DurationSecs, fc.GaplessPlayback, key))
-    con.commit()
+    music_search_update(key)
+    commit_work()
 
     # Add history record
     # Time will be file's last modification time
@@ -1793,7 +2654,7 @@ def update_metadata(fc, commit=True):
     #         SourceDetail, key, Size, Count, FloatSeconds,
     #         Comments)  # Aug 3/23 conversion
 
-    con.commit()
+    commit_work()
 
     return True  # Metadata was updated in SQL database
 
@@ -1833,6 +2694,14 @@ def hist_get_row(key):
     return OrderedDict(row)
 
 
+def hist_page(last_id=None, limit=200):
+    """ Next 'limit' History Table rows in Id order after 'last_id'.
+        Keyset pagination on primary key. Used by DictTreeview.page_init() """
+    hist_cursor.execute("SELECT * FROM History WHERE Id > ? ORDER BY Id LIMIT ?",
+                        [last_id if last_id is not None else 0, limit])
+    return hist_cursor.fetchall()
+
+
 def hist_add_time_index(key, time_list):
     """
         Add time index if 'init' doesn't exist.
@@ -1913,7 +2782,7 @@ def hist_add_music_var(MusicId, Type, Action, Time=None, User=None,
         hist_cursor.execute(cmd, (now, SourceMaster, SourceDetail, Target,
                                   Size, Count, Seconds, Comments, now,
                                   d['Id']))
-        con.commit()
+        commit()
 
     else:
         # Add new row with values
@@ -1925,10 +2794,51 @@ def hist_get_music_var(MusicId, Type, Action, SourceMaster=None):
     """  One variable per Type / Action / SourceMaster can be stored per song.
          For example, Type="Volume", Action="Analyze", SourceMaster="L004".
 
+         Oct. 18 2026 - Single query using MusicIdTypeActionIndex. Returns
+            first matching row (lowest Id) like hist_check() did.
+    """
+    cmd = "SELECT * FROM History INDEXED BY MusicIdTypeActionIndex " + \
+          "WHERE MusicId = ? AND Type = ? AND Action = ?"
+    parms = [MusicId, Type, Action]
+    if SourceMaster:
+        cmd += " AND SourceMaster = ?"
+        parms.append(SourceMaster)
+    hist_cursor.execute(cmd + " ORDER BY Id LIMIT 1", parms)
+    row = hist_cursor.fetchone()
+    return OrderedDict(row) if row else None
+
+
+def hist_get_music_vars(MusicIds, Type, Action, SourceMaster=None):
+    """ Batch version of hist_get_music_var() for location wide analysis
+        such as 'detect_old' and 'loudnorm_1'. One query per 500 MusicIds.
+
+        :param MusicIds: List of Music Table Ids. None = every song
+        :returns: {MusicId: OrderedDict(row)} first row (lowest Id) for song
     """
-    if hist_check(MusicId, Type, Action, check_master=SourceMaster):
-        return hist_get_row(HISTORY_ID)
-    return None
+    cmd = "SELECT * FROM History WHERE Type = ? AND Action = ?"
+    parms = [Type, Action]
+    if SourceMaster:
+        cmd += " AND SourceMaster = ?"
+        parms.append(SourceMaster)
+
+    if MusicIds is None:
+        chunks = [None]  # Uses TypeActionIndex
+    else:
+        MusicIds = list(set(MusicIds))
+        chunks = [MusicIds[i:i + 500] for i in range(0, len(MusicIds), 500)]
+
+    found = {}
+    for chunk in chunks:
+        if chunk is None:
+            hist_cursor.execute(cmd + " AND MusicId > 0 ORDER BY Id", parms)
+        else:
+            hist_cursor.execute(
+                cmd + " AND MusicId IN (" + ",".join("?" * len(chunk)) +
+                ") ORDER BY Id", parms + chunk)
+        for row in hist_cursor.fetchall():
+            if row['MusicId'] not in found:
+                found[row['MusicId']] = OrderedDict(row)
+    return found
 
 
 def hist_del_music_var(MusicId, Type, Action, SourceMaster=None):
@@ -1941,7 +2851,7 @@ def hist_del_music_var(MusicId, Type, Action, SourceMaster=None):
 
     sql = "DELETE FROM History WHERE Id=?"
     hist_cursor.execute(sql, (HISTORY_ID,))
-    con.commit()
+    commit()
     return True
 
 
@@ -2127,7 +3037,7 @@ def hist_init_lost_and_found():
     #print('Songs on disk:', song_count, 'Added count:', add_count, \
     #      'Added meta count:', add_meta_count)
 
-    con.commit()                                # Save database changes
+    commit()                                # Save database changes
 
 
 HISTORY_ID = None
@@ -2171,24 +3081,149 @@ def hist_check(MusicId, check_type, check_action, check_master=None):
     """
     global HISTORY_ID
 
-    for row in hist_cursor.execute(
-            "SELECT Id, Type, Action, SourceMaster FROM History " +
-            "INDEXED BY MusicIdIndex WHERE MusicId = ?", [MusicId]):
-        Id = row[0]
-        Type = row[1]
-        Action = row[2]
-        SourceMaster = row[3]
-        if Type == check_type and Action == check_action:
-            # SourceMaster check is optional
-            if not check_master or check_master == SourceMaster:
-                HISTORY_ID = Id
-                return True
+    # Oct. 18 2026 - Filter in SQL using MusicIdTypeActionIndex
+    cmd = "SELECT Id FROM History INDEXED BY MusicIdTypeActionIndex " + \
+          "WHERE MusicId = ? AND Type = ? AND Action = ?"
+    parms = [MusicId, check_type, check_action]
+    if check_master:  # SourceMaster check is optional
+        cmd += " AND SourceMaster = ?"
+        parms.append(check_master)
+    hist_cursor.execute(cmd + " ORDER BY Id LIMIT 1", parms)
+    row = hist_cursor.fetchone()
+    if row:
+        HISTORY_ID = row[0]
+        return True
 
     HISTORY_ID = 0
     return False                # Not Found
 
 
 # ===========================  USER CONFIGURATION  ============================
+class ConfigCache:
+    """ Write-through cache of configuration rows in SQL History Table.
+
+        Configuration rows have MusicId 0: window geometry, resume,
+        chron_state, hockey_state, open_states, playlist, location, walk,
+        encoding and sql.Config() treeview customizations. They are all
+        read once (SELECT ... WHERE MusicId = 0) and kept in memory by
+        (Type, Action) in Id order. get_config(), save_config(),
+        delete_config(), hist_add() and Config() keep the cache current so
+        UI code paths no longer issue SQL to read them.
+
+        USAGE:
+
+        config_cache = ConfigCache()
+        rows = config_cache.rows(Type, Action) list of row dictionaries.
+        config_cache.get(Type, Action) copy of first row or None.
+        config_cache.put(row) after INSERT of a MusicId 0 row.
+        config_cache.update(Id, SourceMaster=...) after UPDATE of a row.
+        config_cache.remove(Type, Action) or .remove_id(Id) after DELETE.
+        config_cache.invalidate() after bulk changes. Reloads on next use.
+        config_cache.hits, .misses, .loads, .writes, .invalidates counters.
+    """
+
+    def __init__(self):
+        self.cache = {}  # {(Type, Action): [row_dict, row_dict...]}
+        self.ids = {}  # {Id: (Type, Action)}
+        self.loaded = False
+        self.hits = 0  # Found in memory
+        self.misses = 0  # Not a configuration row, answered from memory
+        self.loads = 0  # SQL reads of all configuration rows
+        self.writes = 0  # put(), update() and remove() calls
+        self.invalidates = 0  # invalidate() calls
+        self.who = "sql.py ConfigCache()."
+
+    def load(self):
+        """ Read all MusicId 0 rows from SQL History Table """
+        self.cache = {}
+        self.ids = {}
+        hist_cursor.execute("SELECT * FROM History INDEXED BY MusicIdIndex " +
+                            "WHERE MusicId = 0 ORDER BY Id")
+        for sql_row in hist_cursor.fetchall():
+            self.add(dict(sql_row))
+        self.loaded = True
+        self.loads += 1
+
+    def add(self, row):
+        """ Add row dictionary to memory keeping Id order """
+        key = (row['Type'], row['Action'])
+        rows = self.cache.setdefault(key, [])
+        rows.append(row)
+        if len(rows) > 1 and rows[-2]['Id'] > row['Id']:
+            rows.sort(key=lambda r: r['Id'])
+        self.ids[row['Id']] = key
+
+    def rows(self, Type, Action):
+        """ Return list of row dictionaries for Type and Action. Don't
+            change the dictionaries, use update() instead. """
+        if not self.loaded:
+            self.load()
+        rows = self.cache.get((Type, Action), [])
+        if rows:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return rows
+
+    def get(self, Type, Action):
+        """ Return copy of first row dictionary (lowest Id) or None """
+        rows = self.rows(Type, Action)
+        return dict(rows[0]) if rows else None
+
+    def put(self, row):
+        """ New MusicId 0 row was inserted into SQL History Table """
+        if not self.loaded:
+            return  # Read from SQL when first used
+        self.add(dict(row))
+        self.writes += 1
+
+    def update(self, Id, **columns):
+        """ MusicId 0 row was updated in SQL History Table """
+        key = self.ids.get(Id)
+        if key is None:
+            return
+        for row in self.cache[key]:
+            if row['Id'] == Id:
+                row.update(columns)
+        self.writes += 1
+
+    def remove_id(self, Id):
+        """ Row was deleted from SQL History Table """
+        key = self.ids.pop(Id, None)
+        if key is None:
+            return
+        self.cache[key] = [row for row in self.cache[key] if row['Id'] != Id]
+        if not self.cache[key]:
+            del self.cache[key]
+        self.writes += 1
+
+    def remove(self, Type, Action):
+        """ All rows for Type and Action were deleted from SQL History Table """
+        for row in self.cache.pop((Type, Action), []):
+            self.ids.pop(row['Id'], None)
+        self.writes += 1
+
+    def invalidate(self):
+        """ Forget everything. SQL is read again on next lookup. """
+        self.cache = {}
+        self.ids = {}
+        self.loaded = False
+        self.invalidates += 1
+
+    def counts(self):
+        """ Return counters in dictionary for mserve.py show_debug() """
+        lookups = self.hits + self.misses
+        return OrderedDict([
+            ("lookups", lookups), ("hits", self.hits),
+            ("misses", self.misses), ("loads", self.loads),
+            ("writes", self.writes), ("invalidates", self.invalidates),
+            ("keys", len(self.cache)), ("rows", len(self.ids))])
+
+
+''' Global get_config() / save_config() / Config() cache '''
+config_cache = ConfigCache()
+
+
 class Config:
     """ User Configuration - Treeview, Scrollbox, Font, Color, Width, etc. """
 
@@ -2490,25 +3525,18 @@ class Config:
         return tup_key
 
     def get_sql(self, sql_key, Id=False):
-        """ Get SQL row matching key of four strings """
+        """ Get SQL row matching key of four strings.
+            Oct. 18 2026 - Rows come from config_cache, not SQL. """
         tup_key = self.make_key(sql_key)
         self.Type, self.Action, self.SourceMaster, self.SourceDetail = tup_key
-        hist_cursor.execute("SELECT * FROM History INDEXED BY TypeActionIndex " +
-                            "WHERE Type = ? AND Action = ?",
-                            (self.Type, self.Action))
-        try:
-            rows = hist_cursor.fetchall()
-            for sql_row in rows:
-                row = dict(sql_row)
-                if self.SourceMaster == row['SourceMaster'] and \
-                        self.SourceDetail == row['SourceDetail']:
-                    if not Id:  # Default is to return 'Target' column
-                        return json.loads(row['Target'])
-                    else:
-                        return row['Id']
-        except sqlite3.ProgrammingError:
-            # No configuration override so return default
-            pass
+        for row in config_cache.rows(self.Type, self.Action):
+            if self.SourceMaster == row['SourceMaster'] and \
+                    self.SourceDetail == row['SourceDetail']:
+                if not Id:  # Default is to return 'Target' column
+                    return json.loads(row['Target'])
+                else:
+                    return row['Id']
+        # No configuration override so return default
         return []  # Return empty list of rows
 
     def get_cfg(self, sql_key):
@@ -2574,7 +3602,9 @@ class Config:
             sql = "UPDATE History SET Target=?, Comments=?, Timestamp=?" + \
                   " WHERE Id = ?"
             hist_cursor.execute(sql, (self.Target, self.Comments, self.Time, Id))
-            con.commit()
+            config_cache.update(Id, Target=self.Target, Comments=self.Comments,
+                                Timestamp=self.Time)
+            commit()
             return 2  # Update
 
         self.Comments = "Create " + custom_name
@@ -2586,7 +3616,14 @@ class Config:
             (self.Time, 0, self.User, self.Type, self.Action, self.SourceMaster,
              self.SourceDetail, self.Target, self.Size, self.Count, self.Seconds,
              self.Comments, self.Time))
-        con.commit()
+        config_cache.put(
+            {"Id": hist_cursor.lastrowid, "Time": self.Time, "MusicId": 0,
+             "User": self.User, "Type": self.Type, "Action": self.Action,
+             "SourceMaster": self.SourceMaster,
+             "SourceDetail": self.SourceDetail, "Target": self.Target,
+             "Size": self.Size, "Count": self.Count, "Seconds": self.Seconds,
+             "Comments": self.Comments, "Timestamp": self.Time})
+        commit()
         return 1  # Insert
 
     def print_windows(self, line_dump=False):
@@ -2752,20 +3789,16 @@ def get_config(Type, Action):
         Type - Action   'location' - 'last': The last location played.
                         SourceMaster = loc. Code, SourceDetail = loc. Name,
                         Target = TopDir
+        Type - Action   'walk' - L999: Size = directories listed at once by
+                        location.py ParallelWalk()
         Type - Action   'encoding' - 'format': Target = oga, mp4, flac or wav
                         'encoding' - 'quality': Size = 30 to 100
                         'encoding' - 'naming': SM = '99 ' or '99 - '
 
+        Oct. 18 2026 - Returned from config_cache. SQL read once per open_db().
     """
 
-    hist_cursor.execute("SELECT * FROM History INDEXED BY TypeActionIndex " +
-                        "WHERE Type = ? AND Action = ? LIMIT 1", (Type, Action))
-    try:
-        d = dict(hist_cursor.fetchone())
-    except TypeError:  # TypeError: 'NoneType' object is not iterable:
-        d = None
-
-    return d
+    return config_cache.get(Type, Action)
 
 
 def save_config(Type, Action="", SourceMaster="", SourceDetail="", Target="", 
@@ -2788,8 +3821,12 @@ def save_config(Type, Action="", SourceMaster="", SourceDetail="", Target="",
     hist_cursor.execute(cmd, (now, SourceMaster, SourceDetail, Target,
                               Size, Count, Seconds, Comments, now,
                               d['Id']))
+    config_cache.update(d['Id'], Time=now, SourceMaster=SourceMaster,
+                        SourceDetail=SourceDetail, Target=Target, Size=Size,
+                        Count=Count, Seconds=Seconds, Comments=Comments,
+                        Timestamp=now)
 
-    con.commit()
+    commit()
 
 
 def delete_config(Type, Action, valid_count=1):
@@ -2807,8 +3844,9 @@ def delete_config(Type, Action, valid_count=1):
 
     hist_cursor.execute("DELETE FROM History INDEXED BY TypeActionIndex " +
                         "WHERE Type = ? AND Action = ?", (Type, Action))
+    config_cache.remove(Type, Action)
 
-    con.commit()
+    commit()
 
 
 def hist_last_time(check_type, check_action):
@@ -2838,7 +3876,9 @@ def hist_last_time(check_type, check_action):
 
 def hist_add(Time, MusicId, User, Type, Action, SourceMaster, SourceDetail, 
              Target, Size, Count, Seconds, Comments):
-    """ Add History Row for Synchronizing Lyrics Time Indices. """
+    """ Add History Row for Synchronizing Lyrics Time Indices.
+        HistoryTallyInsert trigger adds row to HistoryTally.
+        Configuration rows (MusicId 0) are added to config_cache. """
     # DEBUG:
     # InterfaceError: Error binding parameter 1 - probably unsupported type.
     # print("Time, MusicId, User, Type, Action, SourceMaster, SourceDetail,")
@@ -2849,9 +3889,18 @@ def hist_add(Time, MusicId, User, Type, Action, SourceMaster, SourceDetail,
            SourceMaster, SourceDetail, Target, Size, Count, Seconds, Comments, \
            Timestamp) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
 
+    Timestamp = time.time()
     hist_cursor.execute(sql, (Time, MusicId, User, Type, Action, SourceMaster,
                               SourceDetail, Target, Size, Count, Seconds,
-                              Comments, time.time()))
+                              Comments, Timestamp))
+    if MusicId == 0:
+        config_cache.put(
+            {"Id": hist_cursor.lastrowid, "Time": Time, "MusicId": MusicId,
+             "User": User, "Type": Type, "Action": Action,
+             "SourceMaster": SourceMaster, "SourceDetail": SourceDetail,
+             "Target": Target, "Size": Size, "Count": Count,
+             "Seconds": Seconds, "Comments": Comments,
+             "Timestamp": Timestamp})
 
 
 def hist_delete_type_action(Type, Action):
@@ -2868,7 +3917,8 @@ def hist_delete_type_action(Type, Action):
     deleted_row_count = hist_cursor.rowcount
     print('hist_delete_type_action(Type, Action):', Type, Action,
           'deleted_row_count:', deleted_row_count)
-    con.commit()
+    config_cache.invalidate()
+    commit()
 
 
 def hist_rename_type_action(Type, Action, newType, newAction):
@@ -2885,7 +3935,8 @@ def hist_rename_type_action(Type, Action, newType, newAction):
           "SET Type = ?, Action = ? " +\
           "WHERE Type = ? AND Action = ? "
     hist_cursor.execute(sql, (newType, newAction, Type, Action))
-    con.commit()
+    config_cache.invalidate()
+    commit()
 
     print("sql.py hist_count_type_action(...newType, newAction) <--- NEW")
     hist_count_type_action(newType, newAction)
@@ -2904,20 +3955,21 @@ def hist_rename_source_detail(Type, Action, oldDetail, newDetail):
           "SET SourceDetail = ? " +\
           "WHERE Type = ? AND Action = ? AND SourceDetail = ?"
     hist_cursor.execute(sql, (newDetail, Type, Action, oldDetail))
-    con.commit()
+    config_cache.invalidate()
+    commit()
 
     print("sql.py hist_count_type_action(Type, Action) END")
     hist_count_type_action(Type, Action)
 
 
 def hist_count_type_action(Type, Action, prt=True, tab=True):
-    """ Count History Rows for matching Type and Action. """
+    """ Count History Rows for matching Type and Action.
+        Oct. 18 2026 - Read from HistoryTally summary table. """
 
-    sql = "SELECT * FROM History INDEXED BY TypeActionIndex " +\
+    sql = "SELECT IFNULL(sum(RowCount), 0) FROM HistoryTally " +\
           "WHERE Type = ? AND Action = ? "
     hist_cursor.execute(sql, (Type, Action))
-    rows = hist_cursor.fetchall()
-    row_count = len(rows)
+    row_count = hist_cursor.fetchone()[0]
 
     tabs = "\t\t" if tab else ""  # show_debug() will want a tab to align
     prt_type = " | Type='" + Type + "' | Action='" + Action + "' | "
@@ -2933,16 +3985,14 @@ def hist_tally_type_action_master(Type, Action, SourceMaster, prt=True, tab=True
         Created 2024-04-13 to tally Type == "Volume", Action == "Analyze",
             SourceMaster == "L004" (Location Code)
         2024-04-22 Return total size for granular progress displays.
+        Oct. 18 2026 - Read from HistoryTally summary table.
     """
 
-    sql = "SELECT * FROM History INDEXED BY TypeActionIndex " +\
+    sql = "SELECT RowCount, TotalSize FROM HistoryTally " +\
           "WHERE Type = ? AND Action = ? AND SourceMaster = ?"
     hist_cursor.execute(sql, (Type, Action, SourceMaster))
-    rows = hist_cursor.fetchall()
-    row_count = tot_size = 0
-    for row in rows:
-        row_count += 1
-        tot_size += row['Size']
+    row = hist_cursor.fetchone()
+    row_count, tot_size = (row[0], row[1]) if row else (0, 0)
 
     tabs = "\t\t" if tab else ""  # show_debug() needs tabs to align
     prt_type = " | Type='" + Type + "' | Action='" + Action + "' | " +\
@@ -2955,25 +4005,19 @@ def hist_tally_type_action_master(Type, Action, SourceMaster, prt=True, tab=True
 
 
 def hist_tally_whole(prt=True, tab=True):
-    """ Tally All History Rows by Type and Action. """
+    """ Tally All History Rows by Type and Action.
+        Oct. 18 2026 - GROUP BY on HistoryTally summary table. """
 
     sql = "SELECT max(Id) FROM History;"
     hist_cursor.execute(sql)
     d = hist_cursor.fetchone()
-    print("SELECT max(Id) FROM History;", d)
+    print("SELECT max(Id) FROM History;", d[0])
 
     tally = {}
-    sql = "SELECT * FROM History;"
-    hist_cursor.execute(sql)
-    rows = hist_cursor.fetchall()
-    for sql_row in rows:
-        row = dict(sql_row)
-        Type = row['Type']
-        Action = row['Action']
-        if Type+"-"+Action in tally:
-            tally[Type+"-"+Action] += 1
-        else:
-            tally[Type+"-"+Action] = 1
+    sql = "SELECT Type, Action, sum(RowCount) FROM HistoryTally " +\
+          "GROUP BY Type, Action ORDER BY Type, Action"
+    for Type, Action, count in hist_cursor.execute(sql).fetchall():
+        tally[Type+"-"+Action] = count
 
     tabs = "\t\t" if tab else ""  # show_debug() will want a tab to align
     if prt:
@@ -2986,6 +4030,16 @@ def hist_tally_whole(prt=True, tab=True):
     return tally
 
 
+def hist_tally_totals():
+    """ Return History row count, total Size and total Seconds.
+        Used by mserve.py show_sql_summary() without reading History. """
+    hist_cursor.execute("SELECT IFNULL(sum(RowCount), 0), " +
+                        "IFNULL(sum(TotalSize), 0), " +
+                        "IFNULL(sum(TotalSeconds), 0.0) FROM HistoryTally")
+    row = hist_cursor.fetchone()
+    return row[0], row[1], row[2]
+
+
 def hist_init_lyrics_and_time():
     """ Tool to initialize history time for all songs that have lyrics.
         The time will be the last file access time.
@@ -3075,7 +4129,7 @@ def hist_init_lyrics_and_time():
 
     #print('Songs with lyrics:', song_count, 'Added count:', add_count, \
     #      'Added time count:', add_time_count)
-    con.commit()
+    commit()
 
 
 # ============================  LOCATION TABLE  ===============================
@@ -3092,7 +4146,7 @@ def loc_add(Code, Name, ModifyTime, ImagePath, MountPoint, TopDir, HostName,
         (Code, Name, ModifyTime, ImagePath, MountPoint, TopDir, HostName, 
          HostWakeupCmd, HostTestCmd, HostTestRepeat, HostMountCmd, HostTouchCmd, 
          HostTouchMinutes, Comments))
-    con.commit()
+    commit()
 
 
 def loc_update(Code, Name, ModifyTime, ImagePath, MountPoint, TopDir, HostName,
@@ -3108,7 +4162,7 @@ def loc_update(Code, Name, ModifyTime, ImagePath, MountPoint, TopDir, HostName,
         (Code, Name, ModifyTime, ImagePath, MountPoint, TopDir, HostName, 
          HostWakeupCmd, HostTestCmd, HostTestRepeat, HostMountCmd, HostTouchCmd, 
          HostTouchMinutes, Comments, Id))
-    con.commit()
+    commit()
 
 
 def loc_read(Code):
@@ -3199,16 +4253,20 @@ class Authorization:
             hist_add(time.time(), 0, g.USER, self.Type, self.Action, self.user,
                      self.email, self.Target, 0, 0, 0.0,
                      "User Authorization record created")
-            con.commit()
+            commit()
             return True
 
         ''' We have the existing history record, simply replace the fields '''
         sql = "UPDATE History SET Timestamp=?, SourceMaster=?, SourceDetail=?, \
               Comments=? WHERE Id = ?"
 
-        cursor.execute(sql, (time.time(), self.user, self.email,
+        now = time.time()
+        cursor.execute(sql, (now, self.user, self.email,
                        "User Authorization record updated", self.HistoryId))
-        con.commit()
+        config_cache.update(self.HistoryId, Timestamp=now,
+                            SourceMaster=self.user, SourceDetail=self.email,
+                            Comments="User Authorization record updated")
+        commit()
 
 
 # =================================  WEBSCRAPE  ===============================
@@ -5361,7 +6419,7 @@ class FixData:
         if update:
             print("self.successful_update_count:", self.successful_update_count)
             if not self.sql_cmd_error:
-                con.commit()
+                commit()
             else:
                 print("self.sql_cmd_error: changes have been rolled back.")
                 hist_cursor.execute("ROLLBACK")
@@ -32,6 +32,13 @@ from __future__ import with_statement       # Error handling for file opens
 #       Feb. 02 2025 - Child Windows auto-assign key when <None> registered
 #       Feb. 05 2025 - Create Tooltips().zap_tip_window() call before suspend
 #       June 14 2025 - Create VolumeMeters() ported from mserve for use in HomA
+#       Oct. 18 2026 - VuMeterRing() reads vu_meter.py shared memory ring
+#       Oct. 18 2026 - VolumeMeters() LEDs created once per resize, toggled
+#       Oct. 18 2026 - DictTreeview() paging mode, rows fetched on scroll
+#       Oct. 18 2026 - SearchText(index=) full-text search by SQL Id
+#       Oct. 18 2026 - SearchText(index=) ranked hits then paged in matches
+#       Oct. 18 2026 - DictTreeview.page_init() again starts over for new order
+#       Oct. 18 2026 - TkScheduler() per subsystem .after() timers & budgets
 #
 #==============================================================================
 
@@ -73,6 +80,8 @@ from PIL import Image, ImageTk  # For MoveTreeviewColumn
 
 # python standard library modules
 import os
+import mmap  # VuMeterRing() shared memory written by vu_meter.py
+import struct  # VuMeterRing() header and records
 import signal  # For os.kill(pid, signal.SIG___) used in VolumeMeters() class
 import time
 import datetime
@@ -1932,6 +1941,10 @@ class makeNotebook:
 #       DictTreeview class - Define Data Dictionary Driven treeview
 #
 # ==============================================================================
+PAGE_ROWS = 200  # DictTreeview.page_init() rows fetched at a time
+PAGE_NEAR = .9  # Fetch next page when scrollbar bottom passes 90%
+
+
 class DictTreeview:
     """ Use list of column dictionaries to create treeview. List names passed
         are music_treeview, history_treeview, etc. Class instance is often
@@ -1946,6 +1959,9 @@ class DictTreeview:
         Interim version:
             When 'columns=()' the displaycolumns will be autogenerated based on
             'tree_dict' parameter
+
+        2026-10-18 - Paging mode with page_init(). Only first page of SQL rows
+            is inserted. Next page is fetched when scrolling nears bottom.
     """
     def __init__(self, tree_dict, toplevel, master_frame, show='headings',
                  columns=(), sbar_width=12, highlight_callback=None, colors=None,
@@ -1973,6 +1989,19 @@ class DictTreeview:
         self.who = "toolkit.py DictTreeview()."
         self.photo = None                   # To prevent garbage collection
 
+        # Paging mode - page_init(), page_more(), page_all()
+        self.page_fetch = None              # fetch(last_key, limit) -> rows
+        self.page_key = None                # Column name for keyset E.G. 'Id'
+        self.page_convert = None            # convert(row) -> dict or None
+        self.page_last = None               # page_key value of last row read
+        self.page_rows = PAGE_ROWS          # Rows in a page
+        self.page_done = True               # All rows read?
+        self.page_count = 0                 # Pages read so far
+        self.page_pending = False           # page_more() after_idle queued
+        self.page_fetch_ids = None          # fetch_ids(ids) -> rows
+        self.page_hold = False              # SearchText(index=) results shown
+        self.v_scroll = None                # Vertical scrollbar
+
         # Child Windows - xxx_is_active vars are in .close() and __init__
         self.rsd_top_is_active = None       # Row SQL details
         self.rmd_top_is_active = None       # Row Metadata Details
@@ -2115,6 +2144,7 @@ class DictTreeview:
                                 width=sbar_width, command=self.tree.yview)
         v_scroll.grid(row=0, column=1, sticky=tk.NS)
         self.tree.configure(yscrollcommand=v_scroll.set)
+        self.v_scroll = v_scroll
 
         # Create a horizontal scrollbar linked to the frame.
         if use_h_scroll:
@@ -2204,6 +2234,114 @@ class DictTreeview:
         ''' highlight row as mouse traverses across treeview '''
         self.tree.tag_bind(iid, '<Motion>', self.highlight_row)
 
+    def page_init(self, fetch, key='Id', convert=None, rows=PAGE_ROWS,
+                  fetch_ids=None):
+        """ Paging mode. Insert first page of rows and fetch more on scroll.
+            Call again when sort order or filter changes. Rows already read
+            are deleted so scroll range and paging cursor start over.
+
+            :param fetch: fetch(last_key, limit) returns list of SQL rows after
+                last_key in key order. last_key is None for first page.
+                E.G. sql.hist_page() and sql.music_page()
+            :param key: Column name in rows used for keyset pagination
+            :param convert: convert(row) returns dict to insert or None to skip
+            :param rows: Number of rows in a page
+            :param fetch_ids: fetch_ids(ids) returns list of SQL rows for Ids.
+                Used by page_ids() for SearchText(index=). E.G. sql.music_rows()
+        """
+        old = [iid for iid, state in self.attached.items() if state is not None]
+        if old:
+            self.tree.delete(*old)  # Detached rows are deleted too
+        self.attached.clear()
+        self.page_fetch = fetch
+        self.page_fetch_ids = fetch_ids
+        self.page_hold = False
+        self.page_key = key
+        self.page_convert = convert
+        self.page_rows = rows
+        self.page_last = None
+        self.page_done = False
+        self.page_count = 0
+        self.tree.configure(yscrollcommand=self.page_scroll)
+        self.page_more()
+        children = self.tree.get_children()
+        if children:
+            self.tree.see(children[0])
+
+    def page_scroll(self, first, last):
+        """ Treeview yscrollcommand. Scrollbar then fetch next page if near
+            bottom. after_idle lets Treeview finish drawing first. """
+        self.v_scroll.set(first, last)
+        if not self.page_done and not self.page_pending and \
+                not self.page_hold and float(last) >= PAGE_NEAR:
+            self.page_pending = True
+            self.tree.after_idle(self.page_more)
+
+    def page_more(self):
+        """ Insert next page of rows. Returns number of rows inserted. """
+        self.page_pending = False
+        if self.page_done or not self.toplevel:
+            return 0  # All read or window closed (toplevel = None)
+        rows = self.page_fetch(self.page_last, self.page_rows)
+        self.page_count += 1
+        if len(rows) < self.page_rows:
+            self.page_done = True  # Short (or empty) page is the last
+
+        count = 0
+        for sql_row in rows:
+            self.page_last = sql_row[self.page_key]
+            count += self.page_insert(sql_row)
+        return count
+
+    def page_insert(self, sql_row):
+        """ Insert SQL row read by page_more() or page_ids(). Returns 1 when
+            inserted. When SearchText(index=) results are showing, all matches
+            were inserted by page_ids() so new rows are inserted detached. """
+        iid = str(sql_row['Id'])
+        if iid in self.attached:  # Search result inserted early by page_ids()
+            if self.attached[iid]:
+                self.tree.move(iid, '', 'end')  # Now in key order
+            return 0
+
+        row = dict(sql_row)
+        if self.page_convert is not None:
+            row = self.page_convert(row)
+            if row is None:
+                return 0
+        self.insert("", row, iid=iid, tags="unchecked")
+        self.attached[iid] = True  # row is attached to view
+        if self.page_hold:
+            self.tree.detach(iid)  # Not a search result
+            self.attached[iid] = False
+        return 1
+
+    def page_ids(self, ids):
+        """ Insert rows for SQL Ids that paging hasn't read yet. Used by
+            SearchText(index=) so searching doesn't read every page first.
+            Returns number of rows inserted. """
+        missing = [Id for Id in ids if str(Id) not in self.attached]
+        if not missing or self.page_fetch_ids is None:
+            return 0
+        hold = self.page_hold
+        self.page_hold = False  # These are search results, leave attached
+        count = 0
+        for sql_row in self.page_fetch_ids(missing):
+            count += self.page_insert(sql_row)
+        self.page_hold = hold
+        return count
+
+    def page_all(self):
+        """ Read remaining pages. Needed before searching or tallying all rows.
+            Returns number of rows inserted. """
+        count = 0
+        if self.page_done:
+            return count
+        wait_cursor(self.toplevel)
+        while not self.page_done and self.toplevel:
+            count += self.page_more()
+        self.toplevel.configure(cursor='')
+        return count
+
     def close(self, *_args):
         """ Parent is closing toplevel containing the treeview.
 
@@ -3556,7 +3694,13 @@ class SearchText:
     https://www.geeksforgeeks.org/search-string-in-text-using-python-tkinter/
     """
     def __init__(self, view, column=None, find_str=None, find_op='in',
-                 callback=None, tt=None, thread=None, keypress=False):
+                 callback=None, tt=None, thread=None, keypress=False,
+                 index=None):
+        """ index(text, any_word) returns SQL Ids matching all words in text
+            (any word when any_word is True), best match first, or None when
+            not available. E.G. sql.music_search(). Rows are fetched by Id
+            instead of reading every page into treeview. Rows already paged
+            in that contain the words in other columns are listed after. """
         # root window is the parent window
         self.view = view  # Treeview frame with scrollbars
         ''' How view was created: 
@@ -3567,6 +3711,9 @@ class SearchText:
         self.toplevel = view.toplevel
         self.tree = view.tree
         self.dict = view.tree_dict
+        self.index = index  # E.G. sql.music_search
+        if index is None:
+            view.page_all()  # Paging mode, search needs all rows in treeview
         self.attached = view.attached
 
         self.column = column  # Specific column to search, else all of treeview
@@ -3805,6 +3952,15 @@ xe3lpd
             self.sip = False
             return
 
+        if self.index is not None:
+            ids = self.index(self.new_str, any_word=self.search_or) \
+                if self.new_str else []
+            if ids is not None:
+                self.find_index(ids)
+                return
+            self.index = None  # No full-text index, search treeview rows
+            self.view.page_all()
+
         ext.t_init('reattach')
         #if not self.keypress_waiting:  # None or false
         #    self.reattach()         # Put back items excluded on last search
@@ -3892,6 +4048,50 @@ xe3lpd
         self.sip = False  # Search is over.
         self.entry.focus_set()
 
+    def find_index(self, ids):
+        """ Attach treeview rows for SQL Ids found by self.index() in score
+            order. Rows not paged in yet are inserted by view.page_ids()
+            first. Then rows already paged in that the index missed but
+            contain the words, E.G. part of OsFileName, size or time. """
+        self.old_str = self.new_str
+        self.keypress_waiting = False
+        if not self.new_str:
+            self.view.page_hold = False  # Scrolling reads pages again
+            self.reattach()  # Empty search string reattaches all rows
+            return
+
+        self.sip = True  # Search in progress
+        self.view.page_ids(ids)
+        self.view.page_hold = True  # Stop paging in rows that don't match
+        ranked = [str(Id) for Id in ids if str(Id) in self.attached]
+        matched = set(ranked)
+
+        ''' Substring of OsFileName, size, time, etc. in rows paged in '''
+        words = self.new_str.split()
+        for iid in list(self.attached.keys()):
+            if self.keypress_waiting:
+                self.sip = False
+                return  # Will be called again from self.search_changed()
+            if iid in matched:
+                continue
+            ret = self.search_matches(iid, words)
+            if ret is None:
+                self.sip = False
+                return  # Window is closing down
+            if ret is True:
+                ranked.append(iid)  # After index matches in score order
+                matched.add(iid)
+
+        for i_r, iid in enumerate(ranked):
+            self.tree.reattach(iid, '', i_r)  # Moves attached rows too
+            self.attached[iid] = True
+        for iid in list(self.attached.keys()):
+            if self.attached[iid] and iid not in matched:
+                self.tree.detach(iid)
+                self.attached[iid] = False
+        self.sip = False  # Search is over.
+        self.entry.focus_set()
+
     def find_callback(self):
         """ Search treeview and use callback function to test """
         if not self.toplevel:
@@ -4028,6 +4228,7 @@ xe3lpd
         self.search_text.set("")  # Prevent future text highlighting of old search
         self.new_str = ""  # New and old are compared to see if find() should
         self.old_str = ""  # begin execution. Ensure they are both blank.
+        self.view.page_hold = False  # SearchText(index=) let paging resume
         self.reattach()  # 2024-04-24 was higher up but do with empty self.new_str
         if self.find_str is None:
             self.frame.grid_remove()  # Next pack is faster this way?
@@ -4688,6 +4889,242 @@ class PointerInspector:
         return True
 
 
+class VuMeterRing:
+    """ Read newest amplitudes written by vu_meter.py AmplitudeRing() into
+        shared memory. Once mapped, reading a sample is a memory access. No
+        open(), read() or text parsing on every VU meter refresh.
+
+        USAGE:
+
+        ring = VuMeterRing(fname)
+        sample = ring.latest(channel) returns (timestamp, max, amp, peak,
+            hold) or None
+            when vu_meter.py is writing text files instead. Caller then
+            reads AMPLITUDE_..._FNAME text file.
+        ring.close() when vu_meter.py is killed.
+    """
+
+    ''' Repeat changes in vu_meter.py AmplitudeRing() '''
+    RING_MAGIC = b"VUR2"
+    RING_HEADER = struct.Struct("<4sIIQ")  # magic, channels, slots, sequence
+    RING_RECORD = struct.Struct("<ddddd")  # timestamp, maximal, amplitude,
+    # sample peak and peak hold
+
+    def __init__(self, fname):
+        self.fname = fname  # g.TEMP_DIR + appname + "_vu-meter-ring.bin"
+        self.mm = None  # mmap.mmap() when vu_meter.py has created file
+        self.channels = self.slots = 0
+        self.last_open = 0.0  # Time of last open() attempt
+        self.reads = 0  # Samples returned
+        self.retries = 0  # Writer lapped reader during read (very rare)
+        self.who = "toolkit.py VuMeterRing()."
+
+    def open(self):
+        """ Map file created by vu_meter.py. Only try once per second. """
+        now = time.time()
+        if now - self.last_open < 1.0:
+            return False
+        self.last_open = now
+        try:
+            fd = os.open(self.fname, os.O_RDONLY)
+        except OSError:
+            return False  # vu_meter.py not started or using text files
+        try:
+            size = os.fstat(fd).st_size
+            if size < self.RING_HEADER.size:
+                return False  # vu_meter.py is still creating file
+            mm = mmap.mmap(fd, size, access=mmap.ACCESS_READ)
+        except (OSError, ValueError, mmap.error) as err:
+            print(self.who + "open() error:", err)
+            return False
+        finally:
+            os.close(fd)  # mmap keeps its own reference
+
+        magic, channels, slots, _seq = self.RING_HEADER.unpack_from(mm, 0)
+        if magic != self.RING_MAGIC or size < self.RING_HEADER.size + \
+                slots * channels * self.RING_RECORD.size:
+            mm.close()
+            return False
+        self.mm, self.channels, self.slots = mm, channels, slots
+        return True
+
+    def latest(self, channel=0):
+        """ Return (timestamp, maximal, amplitude, peak, hold) of newest
+            sample for channel or None if no shared memory or nothing
+            written yet. """
+        if self.mm is None and not self.open():
+            return None
+        if channel >= self.channels:
+            return None
+        for _i in range(3):
+            seq = self.RING_HEADER.unpack_from(self.mm, 0)[3]
+            if seq == 0:
+                return None  # vu_meter.py hasn't written first sample
+            offset = self.RING_HEADER.size + self.RING_RECORD.size * \
+                (((seq - 1) % self.slots) * self.channels + channel)
+            sample = self.RING_RECORD.unpack_from(self.mm, offset)
+            if self.RING_HEADER.unpack_from(self.mm, 0)[3] - seq < \
+                    self.slots - 1:
+                self.reads += 1
+                return sample  # Row wasn't overwritten while reading it
+            self.retries += 1
+        return None
+
+    def close(self):
+        """ Unmap shared memory. Next latest() will map file again. """
+        if self.mm is not None:
+            self.mm.close()
+        self.mm = None
+        self.last_open = 0.0
+
+
+class TkScheduler:
+    """ Independent tk.after() timers, one for each subsystem, each with its
+        own rate. Replaces one busy loop that refreshes everything at the
+        fastest rate any of them needs.
+
+        USAGE:
+
+        sched = TkScheduler(toplevel)
+        sched.add('art', spin_art, 16, budget=8)  # callback, ms, budget ms
+        sched.add('lyrics', paint_lyrics, 100)
+        sched.start()  # Start all timers, or sched.start('art') for one
+        sched.trigger('exit')  # Run now, e.g. from Tk file handler
+        sched.stop()  # Cancel all timers, statistics are kept
+        sched.budgets() returns {name: OrderedDict(rate, budget, calls, ...)}
+
+        Callback returns False to stop its own timer. Rate is measured from
+        when the callback was due, so a slow callback doesn't slow down its
+        rate unless it takes longer than the rate (counted as 'late').
+        A callback taking longer than its budget is counted as 'over'.
+    """
+
+    def __init__(self, toplevel, who="TkScheduler"):
+        self.toplevel = toplevel  # Widget that owns .after() timers
+        self.jobs = OrderedDict()  # {name: job dictionary} in add() order
+        self.running = False  # start() called and stop() not yet called
+        self.start_time = None  # When start() was called
+        self.run_secs = 0.0  # Time running before last stop() for load %
+        self.who = "toolkit.py " + who + "()."
+
+    def add(self, name, callback, ms, budget=None):
+        """ Register subsystem. Budget defaults to half the rate. """
+        self.jobs[name] = {
+            'callback': callback, 'ms': int(ms),
+            'budget': float(budget) if budget else ms / 2.0,
+            'after': None, 'due': 0.0, 'calls': 0, 'secs': 0.0, 'max': 0.0,
+            'over': 0, 'late': 0}
+
+    def set_rate(self, name, ms, budget=None):
+        """ Change rate of subsystem. Takes effect on next call. """
+        job = self.jobs[name]
+        job['ms'] = int(ms)
+        job['budget'] = float(budget) if budget else ms / 2.0
+
+    def start(self, name=None):
+        """ Start all timers or the one named. Running timers are left as is. """
+        if not self.running:
+            self.running = True
+            self.start_time = time.time()
+        for key in [name] if name else self.jobs:
+            job = self.jobs[key]
+            if job['after'] is None:
+                job['due'] = time.time()
+                job['after'] = self.toplevel.after_idle(self.run, key)
+
+    def stop(self, name=None):
+        """ Cancel all timers or the one named. """
+        for key in [name] if name else self.jobs:
+            job = self.jobs[key]
+            if job['after'] is not None:
+                try:
+                    self.toplevel.after_cancel(job['after'])
+                except tk.TclError:
+                    pass  # Toplevel already destroyed
+                job['after'] = None
+        if name is None and self.running:
+            self.running = False
+            self.run_secs += time.time() - self.start_time
+
+    def trigger(self, name):
+        """ Run subsystem at next idle time instead of waiting for rate """
+        job = self.jobs[name]
+        if not self.running or job['after'] is None:
+            return  # Stopped timers aren't restarted
+        try:
+            self.toplevel.after_cancel(job['after'])
+        except tk.TclError:
+            return  # Toplevel already destroyed
+        job['due'] = time.time()
+        job['after'] = self.toplevel.after_idle(self.run, name)
+
+    def run(self, name):
+        """ .after() callback. Time subsystem and schedule next call. """
+        job = self.jobs[name]
+        job['after'] = None
+        start = time.time()
+        result = None
+        try:
+            result = job['callback']()
+        finally:
+            now = time.time()
+            elapsed = now - start
+            job['calls'] += 1
+            job['secs'] += elapsed
+            if elapsed > job['max']:
+                job['max'] = elapsed
+            if elapsed * 1000.0 > job['budget']:
+                job['over'] += 1
+
+            if self.running and result is not False:
+                job['due'] += job['ms'] / 1000.0
+                if job['due'] < now:
+                    job['late'] += 1  # Skip missed calls, don't catch up
+                    job['due'] = now
+                sleep = int((job['due'] - now) * 1000)
+                try:
+                    job['after'] = self.toplevel.after(
+                        sleep if sleep > 0 else 1, self.run, name)
+                except tk.TclError:
+                    self.stop()  # Toplevel destroyed in callback
+
+    def budgets(self):
+        """ Time used by each subsystem while running.
+            load is percent of wall clock time spent in callback. """
+        wall = self.run_secs
+        if self.running:
+            wall += time.time() - self.start_time
+        results = OrderedDict()
+        for name, job in self.jobs.items():
+            calls = job['calls']
+            results[name] = OrderedDict([
+                ('rate', job['ms']), ('budget', job['budget']),
+                ('calls', calls),
+                ('avg', job['secs'] * 1000.0 / calls if calls else 0.0),
+                ('max', job['max'] * 1000.0), ('over', job['over']),
+                ('late', job['late']),
+                ('load', job['secs'] * 100.0 / wall if wall else 0.0)])
+        return results
+
+    def report(self):
+        """ Lines of text with budgets() for each subsystem """
+        lines = ["name        rate ms  budget   calls   avg ms   max ms" +
+                 "    over    late  load %"]
+        for name, b in self.budgets().items():
+            lines.append("%-10s %8d %7.1f %7d %8.3f %8.3f %7d %7d %7.2f" % (
+                name, b['rate'], b['budget'], b['calls'], b['avg'], b['max'],
+                b['over'], b['late'], b['load']))
+        return lines
+
+    def reset(self):
+        """ Zero statistics. Timers keep running. """
+        self.start_time = time.time()
+        self.run_secs = 0.0
+        for job in self.jobs.values():
+            job.update({'calls': 0, 'secs': 0.0, 'max': 0.0, 'over': 0,
+                        'late': 0})
+
+
 class VolumeMeters:
     """ LED Volume Meters (stereo, left & right channels).
         Spawns `/usr/bin/python vu_meter.py stereo XXX` daemon.
@@ -4730,6 +5167,10 @@ class VolumeMeters:
         self.HISTORY_SIZE = 2  # Larger number gives slower decay
         self._meter_left_hist = self._meter_right_hist = None
         self.reset_history_size(self.HISTORY_SIZE)
+        self._leds = {}  # {canvas: dict} LED rectangles from _build()
+        self.frame_cnt = 0  # update_display() calls timed
+        self.frame_secs = 0.0  # Total seconds in update_display()
+        self.frame_max = 0.0  # Longest update_display() call
 
         ''' You can change the LED percentage colors after __init__() '''
         self.style = 'led'  # Use LED rectangles, other option is 'one' for bar
@@ -4743,6 +5184,8 @@ class VolumeMeters:
         self.AMPLITUDE_MONO_FNAME = g.TEMP_DIR + appname + "_vu-meter-mono.txt"
         self.AMPLITUDE_LEFT_FNAME = g.TEMP_DIR + appname + "_vu-meter-left.txt"
         self.AMPLITUDE_RIGHT_FNAME = g.TEMP_DIR + appname + "_vu-meter-right.txt"
+        self.AMPLITUDE_RING_FNAME = g.TEMP_DIR + appname + "_vu-meter-ring.bin"
+        self.ring = VuMeterRing(self.AMPLITUDE_RING_FNAME)  # Text file fallback
         self.pid = 0  # Process ID of vu_meter.py daemon. 0 = not running.
         self.tt = tt  # Tooltips
 
@@ -4784,13 +5227,28 @@ class VolumeMeters:
 
     def _blank_side(self, canvas, rectangle):
         """ Display one blank VU Meter (Left or Right), when music paused. """
+        leds = self._leds.get(canvas, None)
+        if leds:
+            self._light(canvas, leds, [False] * len(leds['lit']))
+            leds['blank'] = True  # Next paint deletes blank rectangle
         x0, y0, x1, y1 = 0, 0, self.width, self.height
         canvas.coords(rectangle, x0, y0, x1, y1)
         canvas.create_rectangle(x0, y0, self.width, y1, fill=self.theme_bg,
                                 width=1, outline='black', tag="rect")
 
     def update_display(self, stop='no'):
-        """ Update VU Meter display, either 'mono' or 'left' and 'right' """
+        """ Update VU Meter display, either 'mono' or 'left' and 'right'
+            Time spent is added to self.frame_cnt, .frame_secs & .frame_max
+        """
+        start = time.time()
+        self._update_sides(stop)
+        elapsed = time.time() - start
+        self.frame_cnt += 1
+        self.frame_secs += elapsed
+        self.frame_max = elapsed if elapsed > self.frame_max else self.frame_max
+
+    def _update_sides(self, stop='no'):
+        """ Called by update_display() to paint left and right channels """
         if stop == 'yes':
             # Stop display
             self._update_one_side('stop', self._meter_left,
@@ -4802,20 +5260,27 @@ class VolumeMeters:
 
         # Regular display
         self._update_one_side(self.AMPLITUDE_LEFT_FNAME, self._meter_left,
-                              self._meter_left_rect, self._meter_left_hist)
+                              self._meter_left_rect, self._meter_left_hist, 0)
 
         self._update_one_side(self.AMPLITUDE_RIGHT_FNAME, self._meter_right,
-                              self._meter_right_rect, self._meter_right_hist)
+                              self._meter_right_rect, self._meter_right_hist, 1)
 
-    def _update_one_side(self, fname, canvas, rectangle, history):
+    def _update_one_side(self, fname, canvas, rectangle, history, channel=0):
         """ Update one VU Meter display
             One time bug: Aug 12/23 - 40 LED's were treated as two LED's of
                 20 blocks each.
+            Oct. 18 2026 - Shared memory ring before text file fname.
         """
+        sample = None if fname == 'stop' else self.ring.latest(channel)
+        v_hold = 0.0  # Peak hold from vu_meter.py, not in text files
         if fname == 'stop':
             # Pausing music but meter.py will wait for sounds and
             # not update the files with zero values. So manually do it here.
             v_max, v_amp = 0.0, 0.0
+        elif sample:
+            _time, v_max, v_amp, _peak, v_hold = sample
+        elif not os.path.isfile(fname):
+            return False  # Ring buffer mode and vu_meter.py hasn't started
         else:
             with open(fname, "r") as f:
                 line = f.readline()
@@ -4847,9 +5312,11 @@ class VolumeMeters:
         if v_max == 0.0:
             # No sound (can't divide by zero) set y0 for no rectangle displayed
             percent_height = self.height
+            hold_height = 0
         else:
             # Have max. set y0 to percentage of volume, 0 = 100% volume
             percent_height = self.height - (self.height * smoothed_amp / v_max)
+            hold_height = int(self.height * min(v_hold / v_max, 1.0))
 
         # What style of bar?
         if self.style == 'one':
@@ -4861,7 +5328,7 @@ class VolumeMeters:
         else:
             # Function to display multiple smaller rectangles simulating LEDs
             bar_hgt = self.height - int(percent_height)
-            self._paint(canvas, bar_hgt, self.height)
+            self._paint(canvas, bar_hgt, self.height, hold_height)
 
         # Save current amplitude in sample history list
         history.pop(0)
@@ -4869,7 +5336,42 @@ class VolumeMeters:
         # print(t(time.time()),history)
         return True
 
-    def _paint(self, canvas, bar_height, height):
+    def _paint(self, canvas, bar_height, height, hold_height=0):
+        """ Light LED rectangles below bar_height plus peak hold LED at
+            hold_height. Only LEDs changing between lit and unlit are
+            configured. LEDs are created by _build() once per resize.
+        """
+        leds = self._leds.get(canvas, None)
+        if leds is None or leds['height'] != height or \
+                leds['width'] != self.width:
+            leds = self._build(canvas, height)
+        if leds['blank']:
+            canvas.delete("rect")  # Blank rectangle from pause covers LEDs
+            leds['blank'] = False
+
+        num_rect = len(leds['lit'])
+        # TODO: Analyze why there is rect_count and num_rect
+        rect_count = int(round(float(bar_height) / height * num_rect))
+        if rect_count > num_rect:
+            rect_count = num_rect  # Fix rounding errors
+
+        ''' LED index 0 is rect_no 1. Range (1, rect_count) is lit. '''
+        lit = [i < rect_count - 1 for i in range(num_rect)]
+        hold_ndx = int(round(float(hold_height) / height * num_rect)) - 2
+        if 0 <= hold_ndx < num_rect:
+            lit[hold_ndx] = True  # Peak hold LED above (or in) the bar
+        self._light(canvas, leds, lit)
+
+    @staticmethod
+    def _light(canvas, leds, lit):
+        """ Show or hide LEDs whose lit state changed since last frame. """
+        for i, item in enumerate(leds['items']):
+            if lit[i] != leds['lit'][i]:
+                canvas.itemconfigure(
+                    item, state=tk.NORMAL if lit[i] else tk.HIDDEN)
+        leds['lit'] = lit
+
+    def _build(self, canvas, height):
         """ Number of rectangles depends on height:
                 A rectangle must be at least 2 pixels high
                 Space between rectangles must be at least 1 pixel
@@ -4878,7 +5380,10 @@ class VolumeMeters:
 
                 400/30 = 13 pixels per rectangle and padding
                 10 pixels for rectangle, 3 pixels for padding
-                 """
+
+            All LEDs are created hidden. Returns dictionary saved in
+            self._leds[canvas].
+        """
         num_rect = height / 13  # How many rectangles will fit in height?
         if num_rect < 1:
             num_rect = 1  # Not enough height for rectangles
@@ -4887,18 +5392,14 @@ class VolumeMeters:
         if r_hgt < 1:
             r_hgt = 1  # Not enough height for rectangles
 
-        canvas.delete("rect")  # Remove rectangles from last time
+        canvas.delete("led")  # Remove LEDs for last height
+        canvas.delete("rect")  # Remove blank rectangle
 
         '''
             Create list of rectangle coordinate tuples (y0, y1). x0 and
             x1 will be constant for left side and right side to form a box
             of (x0, y0, x1, y1). The padding for x0 and x1 defaults to 2 from
             canvas border line.
-
-            Future modification will be to have peek hold 1 second.
-
-            Version after peek hold will have opaque colors between peek hold
-            and current color.
         '''
 
         ''' Generate list of all possible rectangles '''
@@ -4912,18 +5413,9 @@ class VolumeMeters:
 
         num_rect = len(y_list)  # May end up with fewer rectangles
 
-        # print('height:', height, 'number:', num_rect, 'r_hgt_pad:', r_hgt_pad, \
-        #       'r_hgt:', r_hgt, 'pad:', pad, 'y_list', y_list)
-
-        # TODO: Analyze why there is rect_count and num_rect
-        rect_count = int(round(float(bar_height) / height * num_rect))
-        if rect_count > num_rect:
-            rect_count = num_rect  # Fix rounding errors
-        # print('bar_height:', bar_height, 'rect_count:', rect_count)
-
-        ''' Paint the rectangles '''
-        for rect_no in range(1, rect_count):
-
+        ''' Create the rectangles hidden '''
+        items = []
+        for rect_no in range(1, num_rect + 1):
             y0, y1 = y_list[rect_no - 1]
             percent = rect_no * 100 / num_rect
             if percent < 10:
@@ -4936,8 +5428,14 @@ class VolumeMeters:
                 color = self.lt90_color
             else:
                 color = self.ge90_color
-            canvas.create_rectangle(3, y0, self.width - 2, y1, fill=color,
-                                    width=1, outline='black', tag="rect")
+            items.append(canvas.create_rectangle(
+                3, y0, self.width - 2, y1, fill=color, width=1,
+                outline='black', tag="led", state=tk.HIDDEN))
+
+        leds = {'height': height, 'width': self.width, 'items': items,
+                'lit': [False] * num_rect, 'blank': False}
+        self._leds[canvas] = leds
+        return leds
 
     def spawn(self):
         """ Run vu_meter.py in the background. """
@@ -4955,6 +5453,8 @@ class VolumeMeters:
             print(_who, "Already dead:", self.pid)
 
         # Delete amplitude work files if they exist
+        self.ring.close()  # Next vu_meter.py creates new ring file
+        self.remove_if_exists(self.AMPLITUDE_RING_FNAME)
         self.remove_if_exists(self.AMPLITUDE_MONO_FNAME)
         self.remove_if_exists(self.AMPLITUDE_LEFT_FNAME)
         self.remove_if_exists(self.AMPLITUDE_RIGHT_FNAME)
@@ -19,6 +19,8 @@ from __future__ import with_statement  # Error handling for file opens
 #       July 02 2023 - Temporary filenames suitable for Windows and Mac.
 #       July 12 2023 - Modify import order for mserve_config.py
 #       June 14 2025 - Support HomA appname. Create BASELINE_RESET untested 100
+#       Oct. 18 2026 - AmplitudeRing() shared memory IPC. Text files fallback.
+#       Oct. 18 2026 - block_amplitudes() numpy RMS/peak. PeakHold(). benchmark
 #
 #==============================================================================
 # noinspection SpellCheckingInspection
@@ -53,8 +55,11 @@ ENHANCEMENTS:
 """
 
 # Standard Python Library
+import os
 import sys
 import math
+import mmap  # Shared memory ring buffer read by mserve.py & toolkit.py
+import time
 import struct
 
 # dist-packages
@@ -74,6 +79,9 @@ INPUT_BLOCK_TIME = 0.05
 INPUT_FRAMES_PER_BLOCK = int(RATE*INPUT_BLOCK_TIME)
 SHORT_NORMALIZE = 1.0 / 32768.0
 BASELINE_RESET = 10  # How much silence to reset peek
+PEAK_HOLD = True  # Publish decaying peak hold. False = hold is amplitude
+PEAK_HOLD_BLOCKS = 20  # Hold highest amplitude 1 second (20 x 50 ms)
+PEAK_DECAY = 0.85  # After hold, multiply held amplitude each block
 # 2025-06-21 BASELINE_RESET was 10 set 100. Have no idea if this if 5 seconds or not?
 # 2025-06-22 Change BASELINE_RESET back to 10 for now...
 
@@ -84,6 +92,17 @@ AMPLITUDE_MONO_FNAME = g.TEMP_DIR + appname + "_vu-meter-mono.txt"
 AMPLITUDE_LEFT_FNAME = g.TEMP_DIR + appname + "_vu-meter-left.txt"
 AMPLITUDE_RIGHT_FNAME = g.TEMP_DIR + appname + "_vu-meter-right.txt"
 
+''' Volume Meter shared memory ring. Repeat changes in toolkit.py VuMeterRing()
+    Header is followed by RING_SLOTS rows of one RING_RECORD per channel.
+    Sequence is written last so reader never sees a half written row. '''
+AMPLITUDE_RING_FNAME = g.TEMP_DIR + appname + "_vu-meter-ring.bin"
+VU_IPC = "ring"  # "text" = only write AMPLITUDE_..._FNAME text files
+RING_MAGIC = b"VUR2"
+RING_SLOTS = 64  # 3.2 seconds of INPUT_BLOCK_TIME samples
+RING_HEADER = struct.Struct("<4sIIQ")  # magic, channels, slots, sequence
+RING_RECORD = struct.Struct("<ddddd")  # timestamp, maximal, amplitude,
+# sample peak and peak hold
+
 
 class Amplitude(object):
     """ an abstraction for Amplitudes (with an underlying float value)
@@ -125,12 +144,93 @@ class Amplitude(object):
             vu_file.write(str(mark_val) + " " + str(int_val))
 
 
+class PeakHold(object):
+    """ Hold highest amplitude for PEAK_HOLD_BLOCKS then decay it by
+        PEAK_DECAY each block. Computed here so every reader (mserve, homa)
+        paints the same peak without keeping its own history. """
+
+    def __init__(self, hold_blocks=PEAK_HOLD_BLOCKS, decay=PEAK_DECAY):
+        self.hold_blocks = hold_blocks
+        self.decay = decay
+        self.value = 0.0  # Held amplitude
+        self.count = 0  # Blocks since value was set
+
+    def update(self, amp):
+        """ Return held Amplitude after new amplitude for this block. """
+        if not PEAK_HOLD:
+            return amp
+        if amp.value >= self.value:
+            self.value = amp.value
+            self.count = 0
+        elif self.count < self.hold_blocks:
+            self.count += 1
+        else:
+            self.value *= self.decay
+        return Amplitude(self.value)
+
+
+class AmplitudeRing(object):
+    """ Shared memory ring buffer of (timestamp, maximal, amplitude, peak,
+        hold) for each channel. The file is in g.TEMP_DIR (ramdisk) and mapped with
+        mmap so readers don't open, read and parse a text file 20 times a
+        second. Same file (inode) is reused when vu_meter.py is restarted
+        so a reader's existing mmap stays valid.
+    """
+
+    def __init__(self, channels, fname=AMPLITUDE_RING_FNAME, slots=RING_SLOTS):
+        self.channels = channels
+        self.slots = slots
+        self.seq = 0  # Number of rows written. Row is seq % slots
+        self.size = RING_HEADER.size + slots * channels * RING_RECORD.size
+        fd = os.open(fname, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            os.ftruncate(fd, self.size)
+            self.mm = mmap.mmap(fd, self.size)
+        finally:
+            os.close(fd)  # mmap keeps its own reference
+        self.mm[:] = b"\0" * self.size
+        RING_HEADER.pack_into(self.mm, 0, RING_MAGIC, channels, slots, 0)
+
+    def write(self, values, scale=200):
+        """ values is list of (maximal, amplitude, peak, hold) Amplitude
+            tuples in channel order. Scaled the same as Amplitude.display()
+            text files. """
+        now = time.time()
+        offset = RING_HEADER.size + \
+            (self.seq % self.slots) * self.channels * RING_RECORD.size
+        for mark, amp, peak, hold in values:
+            RING_RECORD.pack_into(self.mm, offset, now, mark.value * scale,
+                                  amp.value * scale, peak.value * scale,
+                                  hold.value * scale)
+            offset += RING_RECORD.size
+        self.seq += 1
+        RING_HEADER.pack_into(self.mm, 0, RING_MAGIC, self.channels,
+                              self.slots, self.seq)
+
+    def close(self):
+        """ Unmap. File is left for readers, mserve.py removes it at exit. """
+        self.mm.close()
+
+
+def open_ring(channels):
+    """ Return AmplitudeRing() or None to fall back to text files. """
+    if VU_IPC != "ring":
+        return None
+    try:
+        return AmplitudeRing(channels)
+    except (OSError, IOError, ValueError, mmap.error) as err:
+        print("vu_meter.py open_ring() using text files:", err)
+        return None
+
+
 def parse_data(data, channel_ndx, channel_cnt, maximal):
     """
         Process data from one channel
+
+        Oct. 18 2026 - Replaced by block_amplitudes(). Kept for benchmark().
     """
-    data = np.fromstring(data, dtype=np.int16)[channel_ndx::channel_cnt]
-    data = data.tostring()
+    data = np.frombuffer(data, dtype=np.int16)[channel_ndx::channel_cnt]
+    data = data.tobytes()  # Was .tostring() which numpy deprecated
     amp = Amplitude.from_data(data)
     gap = amp.value      # For signal test below.
     if amp > maximal:
@@ -138,6 +238,58 @@ def parse_data(data, channel_ndx, channel_cnt, maximal):
     return amp, maximal, gap
 
 
+def block_amplitudes(data, channel_cnt):
+    """
+        Return list of RMS Amplitudes and list of peak Amplitudes, one per
+        channel, from one numpy view of the interleaved block. No struct
+        unpacking, no Python loop over samples and no copy back to bytes.
+    """
+    frames = np.frombuffer(data, dtype=np.int16).reshape(-1, channel_cnt)
+    count = frames.shape[0]
+    if count == 0:
+        return [Amplitude()] * channel_cnt, [Amplitude()] * channel_cnt
+    floats = frames.astype(np.float64)  # int16 squares would overflow
+    sum_squares = np.einsum('ij,ij->j', floats, floats)
+    rms = np.sqrt(sum_squares / count) * SHORT_NORMALIZE
+    peak = np.abs(floats).max(axis=0) * SHORT_NORMALIZE
+    return [Amplitude(float(v)) for v in rms], \
+        [Amplitude(float(v)) for v in peak]
+
+
+def benchmark(blocks=400):
+    """
+        Print CPU time per INPUT_BLOCK_TIME stereo block for the old
+        parse_data() struct path and the new block_amplitudes() path.
+
+        Run with: ./vu_meter.py benchmark
+    """
+    cpu = getattr(time, 'process_time', None) or time.clock  # Python 2
+    noise = np.random.randn(INPUT_FRAMES_PER_BLOCK * 2) * 8000
+    data = noise.clip(-32768, 32767).astype(np.int16).tobytes()
+
+    start = cpu()
+    for _i in range(blocks):
+        old_l, _mark, _gap = parse_data(data, 0, 2, Amplitude())
+        old_r, _mark, _gap = parse_data(data, 1, 2, Amplitude())
+    old_ms = (cpu() - start) * 1000.0 / blocks
+
+    start = cpu()
+    for _i in range(blocks):
+        amps, _peaks = block_amplitudes(data, 2)
+    new_ms = (cpu() - start) * 1000.0 / blocks
+
+    block_ms = INPUT_BLOCK_TIME * 1000.0
+    print("vu_meter.py benchmark -", blocks, "stereo blocks of",
+          INPUT_FRAMES_PER_BLOCK, "frames")
+    print("  struct parse_data()     : %.3f ms/block  %.1f%% of one core" %
+          (old_ms, old_ms * 100.0 / block_ms))
+    print("  numpy block_amplitudes(): %.3f ms/block  %.1f%% of one core" %
+          (new_ms, new_ms * 100.0 / block_ms))
+    print("  speed up: %.1f times" % (old_ms / new_ms if new_ms else 0.0))
+    print("  left/right difference: %.2e / %.2e" %
+          (abs(old_l.value - amps[0].value), abs(old_r.value - amps[1].value)))
+
+
 def main():
     """ mainline """
 
@@ -146,9 +298,14 @@ def main():
     if (len(sys.argv)) >= 2:  # 2025-06-14 Can be 2 parameters now
         parameter = sys.argv[1]     # Null = 'mono', 'stereo' = Left & Right
 
+    if parameter == 'benchmark':  # October 18, 2026 struct vs. numpy
+        benchmark()
+        return
+
     audio = pyaudio.PyAudio()
     reset_baseline_count = 0
     stream = None
+    ring = open_ring(2 if parameter == 'stereo' else 1)
 
     try:
         stream = audio.open(format=pyaudio.paInt16,
@@ -159,6 +316,8 @@ def main():
 
         maximal = Amplitude()
         maximal_l = maximal_r = maximal
+        hold, hold_l, hold_r = PeakHold(), PeakHold(), PeakHold()
+        peak = peak_l = peak_r = None
 
         while True:
             data = stream.read(INPUT_FRAMES_PER_BLOCK)
@@ -166,8 +325,13 @@ def main():
             # January 24, 2021 separate left and right channels
             if parameter == 'stereo':
                 amp = None
-                amp_l, maximal_l, gap = parse_data(data, 0, 2, maximal_l)
-                amp_r, maximal_r, gap = parse_data(data, 1, 2, maximal_r)
+                # October 18, 2026 both channels in one numpy pass
+                (amp_l, amp_r), (peak_l, peak_r) = block_amplitudes(data, 2)
+                gap = amp_r.value  # Same as old second parse_data() call
+                if amp_l > maximal_l:
+                    maximal_l = amp_l
+                if amp_r > maximal_r:
+                    maximal_r = amp_r
                 if maximal_r < maximal_l:
                     # A momentary spike to left channel inherited by right
                     maximal_r = maximal_l
@@ -179,7 +343,7 @@ def main():
                 # Mono - processing all data
                 amp_l = None
                 amp_r = None
-                amp = Amplitude.from_data(data)
+                (amp,), (peak,) = block_amplitudes(data, 1)
                 gap = amp.value      # For signal test below.
                 if amp > maximal:
                     maximal = amp
@@ -194,8 +358,14 @@ def main():
             else:
                 reset_baseline_count = 0
 
+            # October 18, 2026 shared memory ring instead of text files
+            if ring and parameter == 'stereo':
+                ring.write([(maximal_l, amp_l, peak_l, hold_l.update(amp_l)),
+                            (maximal_r, amp_r, peak_r, hold_r.update(amp_r))])
+            elif ring:
+                ring.write([(maximal, amp, peak, hold.update(amp))])
             # January 24, 2021 separate left and right channels
-            if parameter == 'stereo':
+            elif parameter == 'stereo':
                 amp_l.display(scale=200, mark=maximal_l, fn=AMPLITUDE_LEFT_FNAME)
                 amp_r.display(scale=200, mark=maximal_r, fn=AMPLITUDE_RIGHT_FNAME)
             else:
@@ -206,6 +376,8 @@ def main():
         stream.stop_stream()
         stream.close()
         audio.terminate()
+        if ring:
+            ring.close()
 
 
 if __name__ == "__main__":
@@ -23,6 +23,8 @@ from __future__ import with_statement  # Error handling for file opens
 #       May. 20 2025 - Make Pulse Audio optional to support Sony TV REST API.
 #       June 26 2025 - HomA create .get_all_inputs().
 #       July 08 2025 - Create _print_or_cast() for HomA.
+#       Oct. 18 2026 - SinkWatcher() event thread for find() PID to sink.
+#       Oct. 18 2026 - set_volume() sink object cache. benchmark_fades().
 #
 # ==============================================================================
 """
@@ -48,6 +50,7 @@ if g.USER is None:
 
 import os
 import time
+import threading  # SinkWatcher() thread listens for Pulse Audio events
 from collections import OrderedDict, namedtuple
 
 # Subdirectory /pulsectl under directory where mserve.py located
@@ -61,6 +64,150 @@ import toolkit
 
 who_am_i = "vu_pulse_audio.py PulseAudio()."
 FADE_NO = 0  # Aids in debugging
+WATCH_TIMEOUT = 1.0  # SinkWatcher() checks for close() every second
+FIND_TIMEOUT = 5.0  # Maximum seconds find() waits for ffplay sink
+FIND_SLICE = .016  # find() runs poll_fades() this often while waiting
+SINK_CACHE = True  # set_volume() reuses sink objects. benchmark_fades() compares
+
+# Sink input named tuple from get_all_sinks(), make_sink() and SinkWatcher()
+Sink = namedtuple('Sink', 'sink_no_str volume name application pid user')
+
+
+def make_sink(sink):
+    """ Sink named tuple from pulsectl PulseSinkInputInfo. Same fields as
+        get_all_sinks(). KeyError when proplist is missing a key. """
+    this_volume = str(sink.volume)
+    # <PulseVolumeInfo... - channels=1, volumes=[0%]>
+    # <PulseVolumeInfo... - channels=2, volumes=[25% 25%]>
+    this_volume = this_volume.split('[')[1]
+    this_volume = this_volume.split('%')[0]
+    # noinspection PyArgumentList
+    return Sink(str(sink.index), int(this_volume),
+                str(sink.name),  # Added 2025-06-23
+                str(sink.proplist['application.name']),
+                int(sink.proplist['application.process.id']),
+                str(sink.proplist['application.process.user']))
+
+
+class SinkWatcher:
+    """ Live map of PID to sink input kept by a background thread.
+
+        The thread has its own pulsectl.Pulse() connection subscribed to
+        'sink_input' events. pulsectl doesn't allow pulse calls inside the
+        event callback, so the callback only saves the event and stops
+        event_listen(). Then the thread reads the new or changed sink input
+        and notifies threads waiting in wait_pid().
+
+        PulseAudio.find() waits on self.cond instead of calling
+        sink_input_list() every 5 ms. When the connection fails self.alive
+        is False and find() goes back to polling.
+    """
+
+    def __init__(self, handles=None):
+        self.who = "vu_pulse_audio.py SinkWatcher()."
+        self.handles = handles  # PulseAudio.set_volume() cache to invalidate
+        self.pulse = pulsectl.Pulse('mserve-sink-watcher')
+        self.cond = threading.Condition()  # notify_all() when sinks change
+        self.sinks = OrderedDict()  # {sink index: Sink named tuple}
+        self.events = []  # (event type, sink index) saved by callback()
+        self.alive = True  # False after close() or lost connection
+        self.event_count = 0  # Sink input events received
+        self.thread = threading.Thread(target=self.run)
+        self.thread.daemon = True  # Don't hang mserve shutdown
+        self.thread.start()
+
+    def callback(self, ev):
+        """ pulsectl event callback. No pulse calls allowed in here. """
+        self.events.append((ev.t, ev.index))
+        raise pulsectl.PulseLoopStop
+
+    def run(self):
+        """ Thread reads all sink inputs then applies events until closed """
+        _who = self.who + "run():"
+        try:
+            self.pulse.event_mask_set('sink_input')
+            self.pulse.event_callback_set(self.callback)
+            with self.cond:  # Subscribe first so no new sink is missed
+                for sink in self.pulse.sink_input_list():
+                    self.update(sink.index, sink)
+                self.cond.notify_all()
+            while self.alive:
+                self.pulse.event_listen(timeout=WATCH_TIMEOUT)
+                while self.events:
+                    self.apply(*self.events.pop(0))
+        except Exception as err:  # PulseDisconnected, PulseError, etc.
+            print(_who, "stopped:", type(err), err)
+        with self.cond:
+            self.alive = False  # find() uses polling from now on
+            self.cond.notify_all()
+        try:
+            self.pulse.close()
+        except Exception:  # Already disconnected
+            pass
+
+    def apply(self, ev_t, index):
+        """ Read sink input after 'new' event. 'change' events come with
+            every fade step so known sinks aren't read again. Map volumes
+            are as of 'new' event, find() only needs PID and sink number. """
+        self.event_count += 1
+        if ev_t == 'change' and index in self.sinks:
+            return
+        sink = None
+        if ev_t != 'remove':
+            try:
+                sink = self.pulse.sink_input_info(index)
+            except pulsectl.PulseIndexError:
+                pass  # Removed before it could be read (short sound)
+        with self.cond:
+            self.update(index, sink)
+            self.cond.notify_all()
+
+    def update(self, index, sink):
+        """ Save Sink named tuple or remove when sink is None """
+        if sink is None:
+            self.sinks.pop(index, None)
+            if self.handles is not None:
+                self.handles.pop(str(index), None)  # Sink removed
+            return
+        try:
+            self.sinks[index] = make_sink(sink)
+        except (KeyError, IndexError, ValueError):
+            self.sinks.pop(index, None)  # No 'application.process.id' yet
+
+    def find_pid(self, pid):
+        """ Sink named tuple for PID or None. Call with self.cond held. """
+        for Sink in self.sinks.values():
+            if Sink.pid == pid:
+                return Sink
+        return None
+
+    def wait_pid(self, pid, timeout, slice_time, poll=None):
+        """ Wait until sink for PID has a volume.
+        :param slice_time: Seconds to wait before calling poll()
+        :param poll: Function to run fades while waiting
+        :returns: Sink named tuple or None after timeout
+        """
+        deadline = time.time() + timeout
+        while True:
+            with self.cond:
+                Sink = self.find_pid(pid)
+                if Sink is not None and Sink.volume is not None:
+                    return Sink
+                remaining = deadline - time.time()
+                if remaining <= 0 or not self.alive:
+                    return None
+                self.cond.wait(min(slice_time, remaining))
+            if poll:
+                poll()  # Last song fading out doesn't stall
+
+    def sinks_list(self):
+        """ Copy of all Sink named tuples in sink index order """
+        with self.cond:
+            return [self.sinks[index] for index in sorted(self.sinks)]
+
+    def close(self):
+        """ Stop thread within WATCH_TIMEOUT seconds """
+        self.alive = False
 
 
 class PulseAudio:
@@ -97,6 +244,13 @@ class PulseAudio:
             self.get_all_sinks()  # auto saves to self.sinks_now
             self.get_all_inputs()  # auto saves to self.inputs_now
         self.sinks_at_init = self.sinks_now
+        self.sink_handles = {}  # {sink_no_str: pulsectl sink} for set_volume()
+        self.watcher = None  # SinkWatcher() live PID to sink map for find()
+        if self.pulse_is_working:
+            try:
+                self.watcher = SinkWatcher(handles=self.sink_handles)
+            except Exception as err:  # Second connection refused
+                print(_who, "SinkWatcher() failed. find() will poll:", err)
         self.last_sinks = self.sinks_at_init  # 2025-06-14 HomA new sink callback
 
         # 2025-06-26 Four new attributes for HomA
@@ -432,6 +586,17 @@ AttributeError: 'module' object has no attribute 'pulsectl'
             ''' Fast method using pulse audio direct interface '''
             ext.t_init(who + '-- pulse.volume_change')
             err = None  # Default to no error
+            sink = self.sink_handles.get(target_sink) if SINK_CACHE else None
+            if sink is not None:
+                ''' Oct 18 2026 - Cached sink object, one IPC per fade step '''
+                try:
+                    self.pulse.volume_set_all_chans(sink, float(percent) / 100.0)
+                    self.sinks_now_volume(target_sink, percent)
+                    job_time = ext.t_end('no_print')
+                    return job_time, err
+                except pulsectl.PulseOperationFailed:
+                    # Sink removed or pulse restarted. Read sink list below
+                    self.sink_handles.pop(target_sink, None)
             try:
                 self.last_sink_input_list = self.pulse.sink_input_list()
             except pulsectl.PulseOperationFailed as _err:  # 56
@@ -462,6 +627,7 @@ pulsectl._pulsectl.CallError: ('pa_context_get_sink_input_info_list',
                 '''
                 try:
                     self.pulse = pulsectl.Pulse()
+                    self.sink_handles.clear()
                     self._print_or_cast("PulseAudio reloaded. Restart mserve", "error")
                     return  # User can try again or poll_fades will do next step
                 except pulsectl.PulseOperationFailed as err:
@@ -470,6 +636,7 @@ pulsectl._pulsectl.CallError: ('pa_context_get_sink_input_info_list',
 
             for sink in self.last_sink_input_list:
                 if str(sink.index) == target_sink:
+                    self.sink_handles[target_sink] = sink  # Next fade step
                     try:
                         self.pulse.volume_set_all_chans(sink, float(percent) / 100.0)
                     except pulsectl.PulseOperationFailed as _err:  # 144
@@ -509,6 +676,7 @@ AttributeError: 'module' object has no attribute 'pulsectl'
                         '''
                         try:
                             self.pulse = pulsectl.Pulse()
+                            self.sink_handles.clear()
                             self._print_or_cast("PulseAudio reloaded. Restart mserve",
                                                 "error")
                             return  # User can try again or poll_fades will do next step
@@ -516,16 +684,7 @@ AttributeError: 'module' object has no attribute 'pulsectl'
                             print(who + "pulsectl.PulseOperationFailed:", err)
                             return None, str(err)
 
-                    for i, S in enumerate(self.sinks_now):
-                        if S.sink_no_str == target_sink:
-                            Replace = namedtuple('Sink',
-                                                 'sink_no_str volume name pid user')
-                            # tuples immutable so recreate a new one based on old
-                            # noinspection PyArgumentList
-                            replace = Replace(str(S.sink_no_str), int(percent),
-                                              S.name, S.pid, S.user)
-                            self.sinks_now[i] = replace
-                            # Was 100% added duplicate at 70%
+                    self.sinks_now_volume(target_sink, percent)
                     job_time = ext.t_end('no_print')
                     return job_time, err
             ext.t_end('no_print')
@@ -572,7 +731,48 @@ AttributeError: 'module' object has no attribute 'pulsectl'
         # if pipe.return_code == 0:                  # Future use
         return job_time, err
 
+    def sinks_now_volume(self, target_sink, percent):
+        """ Reflect new volume in self.sinks_now Sink named tuple """
+        for i, S in enumerate(self.sinks_now or []):
+            if S.sink_no_str == target_sink:
+                # tuples immutable so recreate a new one based on old.
+                # Oct 18 2026 - _replace() instead of new namedtuple() class
+                self.sinks_now[i] = S._replace(volume=int(percent))
+                # Was 100% added duplicate at 70%
+
     def find(self, pid):
+        """
+        Wait for Pulse Audio sink to appear after "ffplay" was launched as
+        background task and the PID was discovered.
+
+        Oct 18 2026 - SinkWatcher() thread notifies as soon as the sink input
+            event arrives. Fades run every FIND_SLICE while waiting. When the
+            watcher isn't running, find_poll() checks every 5 ms.
+
+        :param pid: Linux process ID of "ffplay" instance just started
+        :return sink: Pulse Audio sink number or None if pid not found
+        """
+        if not self.watcher or not self.watcher.alive:
+            return self.find_poll(pid)
+
+        self.last_pid_sink = self.curr_pid_sink
+        ext.t_init('PulseAudio.find()')
+        Sink = self.watcher.wait_pid(pid, FIND_TIMEOUT, FIND_SLICE,
+                                     poll=self.poll_fades)
+        ext.t_end('no_print')
+        if Sink is None:
+            if not self.watcher.alive:
+                return self.find_poll(pid)  # Lost connection while waiting
+            return None
+
+        self.sinks_now = self.watcher.sinks_list()
+        self.curr_pid_sink = str(Sink.sink_no_str)
+        if str(self.last_pid_sink) == self.curr_pid_sink:
+            self._print_or_cast("Same sink used twice in row: " +
+                                self.curr_pid_sink, "error")
+        return self.curr_pid_sink
+
+    def find_poll(self, pid):
         """
         Checks every 5 ms for Pulse Audio sink to appear after "ffplay" was
         launched as background task and the PID was discovered.
@@ -580,7 +780,7 @@ AttributeError: 'module' object has no attribute 'pulsectl'
         :param pid: Linux process ID of "ffplay" instance just started
         :return sink: Pulse Audio sink number or None if pid not found
         """
-        who = who_am_i + "find(): "
+        who = who_am_i + "find_poll(): "
         ''' Originally sleeping for 5 ms, but it's blocking function
             and last song fading out for 1 second doesn't progress
         '''
@@ -779,21 +979,10 @@ AttributeError: 'module' object has no attribute 'pulsectl'
                 # -ss 2.05024790764
                 # -af afade=type=in:start_time=2.05024790764:duration=1 -nodisp
 
-                this_volume = str(sink.volume)
-                # <PulseVolumeInfo... - channels=1, volumes=[0%]>
-                # <PulseVolumeInfo... - channels=2, volumes=[25% 25%]>
-                this_volume = this_volume.split('[')[1]
-                this_volume = this_volume.split('%')[0]
-                # create 'Sink' named tuple class
-                Sink = namedtuple('Sink', 'sink_no_str volume name application pid user')
+                # 'Sink' named tuple class is global. Oct 18 2026 make_sink()
                 # 2025-06-23 was: ('Sink', 'sink_no_str volume application pid user')
                 try:
-                    # noinspection PyArgumentList
-                    this_sink = Sink(str(sink.index), int(this_volume),
-                                     str(sink.name),  # Added 2025-06-23
-                                     str(sink.proplist['application.name']),
-                                     int(sink.proplist['application.process.id']),
-                                     str(sink.proplist['application.process.user']))
+                    this_sink = make_sink(sink)
                     self.sinks_now.append(this_sink)
                 except Exception as err:
                     print("Exception (KeyError):", err)
@@ -1002,6 +1191,73 @@ AttributeError: 'module' object has no attribute 'pulsectl'
         return self.pulse
 
 
+def benchmark_fades(duration=1.0, sinks=8, ipc_ms=0.1):
+    """ Fade steps per second for a cross-fade (two fades at once) with and
+        without the set_volume() sink object cache.
+
+        StubPulse stands in for pulsectl.Pulse() so no sound server is
+        needed. Each call to it counts as one IPC and sleeps 'ipc_ms'.
+        From a terminal:
+
+            python -c "import vu_pulse_audio as v; v.benchmark_fades()"
+    """
+    global SINK_CACHE
+
+    class StubSink:
+        """ Looks like pulsectl PulseSinkInputInfo to get_all_sinks() """
+        def __init__(self, index):
+            self.index = index
+            self.name = "Simple DirectMedia Layer"
+            self.volume = "<PulseVolumeInfo... - channels=2, volumes=[100% 100%]>"
+            self.proplist = {'application.name': 'ffplay',
+                             'application.process.id': str(1000 + index),
+                             'application.process.user': g.USER}
+
+    class StubPulse:
+        """ sink_input_list() and volume_set_all_chans() count IPC calls """
+        def __init__(self):
+            self.ipc = 0
+
+        def sink_input_list(self):
+            self.ipc += 1
+            time.sleep(ipc_ms / 1000.0)
+            return [StubSink(i) for i in range(sinks)]
+
+        def volume_set_all_chans(self, _obj, _vol):
+            self.ipc += 1
+            time.sleep(ipc_ms / 1000.0)
+
+    pav = PulseAudio(server="stub")  # No connection to Pulse Audio server
+    pav.server = "pa"
+    pav.pulse_is_working = True
+    saved = SINK_CACHE
+    print("\nvu_pulse_audio.py benchmark_fades() -", sinks, "sink inputs,",
+          ipc_ms, "ms per IPC,", duration, "second cross-fade\n")
+    print("set_volume()".ljust(16), "Steps/second".rjust(14),
+          "IPC/step".rjust(10))
+    print("-" * 42)
+    try:
+        for cache in (False, True):
+            SINK_CACHE = cache
+            pav.pulse = StubPulse()
+            pav.sink_handles.clear()
+            pav.get_all_sinks()
+            pav.pulse.ipc = 0
+            pav.fade("0", 100.0, 25.0, duration)  # Song fading out
+            pav.fade("1", 25.0, 100.0, duration)  # Song fading in
+            steps = 0
+            start = time.time()
+            while pav.fade_list:
+                pav.poll_fades()
+                steps += 2
+            elapsed = time.time() - start
+            print(("sink cache" if cache else "sink list").ljust(16),
+                  "{:,.0f}".format(steps / elapsed).rjust(14),
+                  "{:.2f}".format(float(pav.pulse.ipc) / steps).rjust(10))
+    finally:
+        SINK_CACHE = saved
+
+
 class FlashMessage:
     """ FUTURE USE: Copied from mmm - Make it work later """
     def __init__(self, widget, var, message, count=5, on=500, off=300):